@@ -0,0 +1,60 @@
+"""Decode and encode time of each installed JSON backend on n8n payloads.
+
+Decodes a large workflow and a finished execution the way the clients did
+before (``response.json()``: bytes to str, then ``json.loads``) and with
+``codec.loads`` on the raw bytes, then encodes them compact and indented.
+
+Usage:
+    python benchmarks/bench_codec.py [--nodes 100] [--runs 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+from mcp_n8n import codec
+
+from payloads import execution, workflow
+
+
+def _time_ms(call, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    wf = workflow(args.nodes)
+    documents = {"workflow": wf, "execution": execution(wf)}
+    print(f"{'document':<10} {'backend':<8} {'operation':<15} {'median ms':>10}")
+    for kind, doc in documents.items():
+        body = json.dumps(doc).encode()
+        elapsed = _time_ms(lambda: json.loads(body.decode("utf-8")), args.runs)
+        print(f"{kind:<10} {'json':<8} {'loads(str)':<15} {elapsed:>10.3f}  ({len(body)} bytes)")
+        for backend in codec.BACKENDS:
+            try:
+                codec.use(backend)
+            except ImportError:
+                continue
+            for label, call in (
+                ("loads(bytes)", lambda: codec.loads(body)),
+                ("dumps compact", lambda: codec.dumps(doc)),
+                ("dumps indent=2", lambda: codec.dumps(doc, indent=2)),
+            ):
+                print(f"{kind:<10} {backend:<8} {label:<15} {_time_ms(call, args.runs):>10.3f}")
+    codec.use()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Per-call latency with and without the pooled N8nClient session.
+
+Starts a local keep-alive HTTP server and compares module-level
+``requests.get`` (a new connection per call) against ``N8nClient.get``.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [--calls 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import Optional
+
+import requests
+
+from mcp_n8n.client import N8nClient
+
+from stand_in import StandInServer
+
+
+class _ListingServer(StandInServer):
+    def answer(self, method: str, target: str, body: Optional[bytes]) -> tuple:
+        return 200, b'{"data": [], "nextCursor": null}'
+
+
+def _measure(call, calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label:<22} mean={statistics.mean(samples):.3f}ms p50={statistics.median(samples):.3f}ms p99={p99:.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    with _ListingServer() as server:
+        base = server.base_url
+        headers = {"X-N8N-API-KEY": "bench", "Accept": "application/json"}
+        before = _measure(
+            lambda: requests.get(f"{base}/api/v1/workflows", headers=headers, timeout=30).json(),
+            args.calls,
+        )
+        with N8nClient(base_url=base, api_key="bench") as client:
+            after = _measure(lambda: client.get("/workflows"), args.calls)
+
+    _report("requests.get (no pool)", before)
+    _report("N8nClient (pooled)", after)
+
+
+if __name__ == "__main__":
+    main()
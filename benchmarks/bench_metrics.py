@@ -0,0 +1,71 @@
+"""Overhead of per-route metrics recording.
+
+Times ``route_of`` + ``RouteMetrics.record`` on their own (nanoseconds per
+call, from one thread and contended from several), then ``N8nClient``
+webhook calls against a local stand-in server with metrics on and off.
+
+Usage:
+    python benchmarks/bench_metrics.py [--calls 2000] [--threads 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mcp_n8n.client import N8nClient
+from mcp_n8n.config import get_settings
+from mcp_n8n.metrics import RouteMetrics, route_of
+
+from stand_in import StandInServer
+
+
+def _record_ns(metrics: RouteMetrics, calls: int) -> float:
+    endpoints = [f"/workflows/{i % 500}" for i in range(calls)]
+    start = time.perf_counter_ns()
+    for endpoint in endpoints:
+        metrics.record("GET", route_of(endpoint), 200, 0.012, 0, 2048)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def _client_us(base_url: str, calls: int, metrics_enabled: bool) -> float:
+    os.environ["N8N_METRICS_ENABLED"] = str(metrics_enabled).lower()
+    with N8nClient(base_url=base_url, api_key="bench") as client:
+        for _ in range(50):
+            client.webhook("bench")
+        samples = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            client.webhook("bench")
+            samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"record, 1 thread:          {_record_ns(RouteMetrics(), args.calls * 50):8.0f} ns/call")
+    metrics = RouteMetrics()
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(args.threads) as pool:
+        list(pool.map(lambda _: _record_ns(metrics, args.calls * 10), range(args.threads)))
+    elapsed = (time.perf_counter_ns() - start) / (args.threads * args.calls * 10)
+    print(f"record, {args.threads} threads:         {elapsed:8.0f} ns/call (wall time / total calls)")
+
+    with StandInServer() as stand_in:
+        off = _client_us(stand_in.base_url, args.calls, metrics_enabled=False)
+        on = _client_us(stand_in.base_url, args.calls, metrics_enabled=True)
+    os.environ.pop("N8N_METRICS_ENABLED", None)
+    get_settings.cache_clear()
+    print(f"client call, metrics off:  {off:8.1f} us (median)")
+    print(f"client call, metrics on:   {on:8.1f} us (median, {(on - off) / off:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Cold-start time of the package, the MCP server and the LangChain tools.
+
+Each measurement runs in a fresh interpreter, the way an MCP client starts
+``mcp-n8n`` per session: importing each entry point, building the LangChain
+tools, and for the server the time until the first ``tools/list`` answer over
+an in-memory session.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import mcp_n8n": "import mcp_n8n",
+    "import mcp_n8n.server": "import mcp_n8n.server",
+    "import mcp_n8n.langchain_tools": "import mcp_n8n.langchain_tools",
+    "langchain TOOLS": "from mcp_n8n.langchain_tools import TOOLS",
+    "server first tools/list": (
+        "import asyncio\n"
+        "from fastmcp import Client\n"
+        "from mcp_n8n.server import mcp\n"
+        "async def main():\n"
+        "    async with Client(mcp) as client:\n"
+        "        await client.list_tools()\n"
+        "asyncio.run(main())\n"
+    ),
+}
+
+_TIMED = (
+    "import time\n"
+    "_start = time.perf_counter()\n"
+    "{code}\n"
+    "print((time.perf_counter() - _start) * 1000)\n"
+)
+
+
+def _run_ms(code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMED.format(code=code)], capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<32} {'median ms':>10} {'min ms':>10}")
+    for name, code in SCENARIOS.items():
+        try:
+            samples = [_run_ms(code) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<32} {'skipped':>10}  ({e.stderr.strip().splitlines()[-1]})")
+            continue
+        print(f"{name:<32} {statistics.median(samples):>10.1f} {min(samples):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
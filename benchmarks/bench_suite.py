@@ -0,0 +1,465 @@
+"""End-to-end benchmark suite against an in-process fake n8n API.
+
+Runs every client operation, list pagination, large workflow and execution
+bodies, concurrent MCP tool calls and webhook load against
+``fake_api.FakeN8nApi`` (latency, document sizes and injected errors are
+configurable), and reports per scenario the throughput, p50/p99 latency and
+peak RSS (the process high-water mark while the scenario ran; the fake server
+runs in the same process). Client settings come from the environment as
+usual, e.g. ``N8N_CACHE_ENABLED=true`` to benchmark with the cache.
+
+Every scenario runs ``--repeat`` times and the medians are kept. Results are
+compared with the stored baseline (``benchmarks/baseline.json``, recorded
+with the default options): a scenario regresses when its throughput, p50, p99
+or peak RSS is worse than the baseline's by more than ``--tolerance``, and the
+run then exits 1. A missing baseline, or one recorded with other options,
+exits 2. Latency and throughput are scaled by a fixed CPU-bound calibration
+workload timed with each run, so a slower or busier machine is not taken for
+a regression; for exact comparisons, save a baseline on the machine you
+compare on before changing code, then rerun.
+
+Usage:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --save-baseline
+    python benchmarks/bench_suite.py [--iterations 200] [--concurrency 16] [--only mcp] --baseline /tmp/b.json
+    python benchmarks/bench_suite.py --latency-ms 5 --error-rate 0.02 --baseline /tmp/slow.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from fake_api import LARGE, FakeN8nApi
+from payloads import workflow
+
+from mcp_n8n import server
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.loadgen import LatencyHistogram, run_load
+from mcp_n8n.operations import credentials, executions, misc, tags, workflows
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Absolute slack below which a change is noise, whatever the tolerance.
+_SLACK = {"p50_ms": 0.05, "p99_ms": 0.5, "peak_rss_mb": 2.0}
+
+Operation = Callable[[N8nClient, int], Any]
+
+SMALL_WF = workflow(20)
+LARGE_WF = workflow(2000)
+
+
+def _ids(n: int, i: int, count: int) -> list[str]:
+    return [str((i * n + k) % count + 1) for k in range(n)]
+
+
+def operations(api: FakeN8nApi) -> dict[str, Operation]:
+    """Every operation, called with IDs that vary per iteration (so nothing is coalesced)."""
+    wf = lambda i: str(i % api.workflow_count + 1)  # noqa: E731
+    ex = lambda i: str(i % api.execution_count + 1)  # noqa: E731
+    return {
+        "list_workflows": lambda c, i: workflows.list_workflows(c, limit=100),
+        "get_workflow": lambda c, i: workflows.get_workflow(c, wf(i)),
+        "get_workflows_bulk": lambda c, i: workflows.get_workflows_bulk(c, _ids(20, i, api.workflow_count)),
+        "create_workflow": lambda c, i: workflows.create_workflow(
+            c, f"Bench {i}", SMALL_WF["nodes"], SMALL_WF["connections"], SMALL_WF["settings"],
+        ),
+        "update_workflow": lambda c, i: workflows.update_workflow(c, wf(i), name=f"Renamed {i}"),
+        "update_workflow_unchanged": lambda c, i: workflows.update_workflow(
+            c, wf(i), name=f"Workflow {wf(i)}", diff=True,
+        ),
+        "update_workflow_node_patch": lambda c, i: workflows.update_workflow(
+            c, wf(i), node_patches={"Node 1": {"parameters": {"url": f"https://api.example.com/v{i}"}}},
+        ),
+        "delete_workflow": lambda c, i: workflows.delete_workflow(c, wf(i)),
+        "activate_workflow": lambda c, i: workflows.activate_workflow(c, wf(i)),
+        "deactivate_workflow": lambda c, i: workflows.deactivate_workflow(c, wf(i)),
+        "execute_workflow": lambda c, i: workflows.execute_workflow(c, wf(i), {"n": i}),
+        "execute_workflow_and_wait": lambda c, i: workflows.execute_workflow_and_wait(c, wf(i)),
+        "list_active_workflows": lambda c, i: workflows.list_active_workflows(c),
+        "get_activation_error": lambda c, i: workflows.get_activation_error(c, wf(i)),
+        "list_executions": lambda c, i: executions.list_executions(c, limit=100),
+        "get_execution": lambda c, i: executions.get_execution(c, ex(i)),
+        "get_execution_with_data": lambda c, i: executions.get_execution(c, ex(i), include_data=True),
+        "get_execution_streamed": lambda c, i: executions.get_execution_streamed(c, ex(i), select="errors"),
+        "get_executions_bulk": lambda c, i: executions.get_executions_bulk(c, _ids(20, i, api.execution_count)),
+        "wait_for_execution": lambda c, i: executions.wait_for_execution(c, ex(i)),
+        "delete_execution": lambda c, i: executions.delete_execution(c, ex(i)),
+        "retry_execution": lambda c, i: executions.retry_execution(c, ex(i)),
+        "stop_execution": lambda c, i: executions.stop_execution(c, ex(i)),
+        "retry_executions_bulk": lambda c, i: executions.retry_executions_bulk(
+            c, execution_ids=_ids(10, i, api.execution_count),
+        ),
+        "stop_executions_bulk": lambda c, i: executions.stop_executions_bulk(
+            c, execution_ids=_ids(10, i, api.execution_count),
+        ),
+        "list_credentials": lambda c, i: credentials.list_credentials(c),
+        "get_credential_schema": lambda c, i: credentials.get_credential_schema(c, "httpBasicAuth"),
+        "create_credential": lambda c, i: credentials.create_credential(
+            c, f"Cred {i}", "httpBasicAuth", {"user": "u", "password": "p"},
+        ),
+        "delete_credential": lambda c, i: credentials.delete_credential(c, f"c{i % 50 + 1}"),
+        "list_tags": lambda c, i: tags.list_tags(c),
+        "create_tag": lambda c, i: tags.create_tag(c, f"tag-{i}"),
+        "delete_tag": lambda c, i: tags.delete_tag(c, f"t{i % 50 + 1}"),
+        "list_users": lambda c, i: misc.list_users(c),
+        "trigger_webhook": lambda c, i: misc.trigger_webhook(c, "bench", data={"n": i}),
+        "status": lambda c, i: misc.status(c),
+    }
+
+
+def pagination() -> dict[str, Operation]:
+    """Walks over every item, one page request per ``page_size`` items."""
+    return {
+        "iter_workflows": lambda c, i: sum(1 for _ in workflows.iter_workflows(c, page_size=20)),
+        "iter_executions": lambda c, i: sum(1 for _ in executions.iter_executions(c, page_size=20)),
+        "iter_tags": lambda c, i: sum(1 for _ in tags.iter_tags(c, page_size=10)),
+    }
+
+
+def large_bodies() -> dict[str, Operation]:
+    """The ``large`` workflow and execution: multi-megabyte bodies each way."""
+    return {
+        "get_workflow": lambda c, i: workflows.get_workflow(c, LARGE),
+        "create_workflow": lambda c, i: workflows.create_workflow(
+            c, "Large", LARGE_WF["nodes"], LARGE_WF["connections"], LARGE_WF["settings"],
+        ),
+        "update_workflow": lambda c, i: workflows.update_workflow(c, LARGE, nodes=LARGE_WF["nodes"]),
+        "get_execution_with_data": lambda c, i: executions.get_execution(c, LARGE, include_data=True),
+        "get_execution_document": lambda c, i: executions.get_execution_document(c, LARGE),
+        "get_execution_streamed": lambda c, i: executions.get_execution_streamed(c, LARGE, select="last_node"),
+    }
+
+
+# --- Measurement ---
+
+
+def _reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")  # resets VmHWM (Linux 4.0+)
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _result(histogram: LatencyHistogram, errors: int, elapsed: float, peak_rss_mb: float) -> dict:
+    summary = histogram.summary_ms()
+    return {
+        "ops": histogram.count,
+        "errors": errors,
+        "ops_per_s": round(histogram.count / elapsed, 1) if elapsed else None,
+        "p50_ms": summary["p50"],
+        "p99_ms": summary["p99"],
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+
+
+def measure(call: Callable[[int], Any], iterations: int, warmup: int = 5) -> dict:
+    """Run ``call(i)`` back to back; failed calls count as errors but are timed too."""
+    for i in range(warmup):
+        try:
+            call(i)
+        except Exception:
+            pass
+    _reset_peak_rss()
+    histogram, errors = LatencyHistogram(), 0
+    start = time.perf_counter()
+    for i in range(iterations):
+        began = time.perf_counter()
+        try:
+            call(i)
+        except Exception:
+            errors += 1
+        histogram.record((time.perf_counter() - began) * 1_000_000)
+    return _result(histogram, errors, time.perf_counter() - start, _peak_rss_mb())
+
+
+async def ameasure(call: Callable[[int], Awaitable[Any]], iterations: int, concurrency: int) -> dict:
+    """Run ``iterations`` calls of ``call(i)`` with at most ``concurrency`` in flight."""
+    await asyncio.gather(*(call(i) for i in range(concurrency)), return_exceptions=True)
+    _reset_peak_rss()
+    histogram, errors = LatencyHistogram(), 0
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with gate:
+            began = time.perf_counter()
+            try:
+                await call(i)
+            except Exception:
+                errors += 1
+            histogram.record((time.perf_counter() - began) * 1_000_000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(iterations)))
+    return _result(histogram, errors, time.perf_counter() - start, _peak_rss_mb())
+
+
+def mcp_scenarios(api: FakeN8nApi, iterations: int, concurrency: int) -> dict[str, dict]:
+    """Tool calls through FastMCP's in-process client, ``concurrency`` at a time."""
+    from fastmcp import Client
+
+    wf = lambda i: str(i % api.workflow_count + 1)  # noqa: E731
+    ex = lambda i: str(i % api.execution_count + 1)  # noqa: E731
+    mixed = [
+        ("n8n_get_workflow", lambda i: {"workflow_id": wf(i)}),
+        ("n8n_list_workflows", lambda i: {"limit": 50}),
+        ("n8n_get_execution", lambda i: {"execution_id": ex(i), "include_data": True}),
+        ("n8n_list_executions", lambda i: {"limit": 50}),
+        ("n8n_trigger_webhook", lambda i: {"webhook_path": "bench", "data": {"n": i}}),
+    ]
+
+    async def run() -> dict[str, dict]:
+        results = {}
+        client = AsyncN8nClient(base_url=api.base_url, api_key="bench")
+        server._client, server._limit = client, None
+        try:
+            async with Client(server.mcp) as mcp_client:
+                async def get_workflow(i: int) -> Any:
+                    return await mcp_client.call_tool("n8n_get_workflow", {"workflow_id": wf(i)})
+
+                async def mixed_tools(i: int) -> Any:
+                    name, arguments = mixed[i % len(mixed)]
+                    return await mcp_client.call_tool(name, arguments(i))
+
+                async def list_all(i: int) -> Any:
+                    return await mcp_client.call_tool("n8n_list_workflows", {"all_pages": True, "limit": 50})
+
+                results["get_workflow"] = await ameasure(get_workflow, iterations, concurrency)
+                results["mixed_tools"] = await ameasure(mixed_tools, iterations, concurrency)
+                results["list_workflows_all_pages"] = await ameasure(list_all, max(iterations // 10, 5), concurrency)
+        finally:
+            await client.aclose()
+            server._client, server._limit = None, None
+        return results
+
+    return asyncio.run(run())
+
+
+def webhook_load(api: FakeN8nApi, iterations: int, concurrency: int) -> dict:
+    """``loadgen.run_load`` closed loop: ``concurrency`` workers on one webhook path."""
+    with N8nClient(base_url=api.base_url, api_key="bench") as client:
+        _reset_peak_rss()
+        report = run_load(client, "bench", concurrency=concurrency, duration=None,
+                          requests_total=iterations * 5, payloads=lambda seq: {"n": seq})
+    return {
+        "ops": report["requests"],
+        "errors": report["failed"],
+        "ops_per_s": report["throughput_rps"],
+        "p50_ms": report["latency_ms"]["p50"],
+        "p99_ms": report["latency_ms"]["p99"],
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run_suite(api: FakeN8nApi, iterations: int, concurrency: int, only: Optional[str] = None) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    selected = lambda name: only is None or only in name  # noqa: E731
+    with N8nClient(base_url=api.base_url, api_key="bench") as client:
+        groups = [
+            ("op", operations(api), iterations),
+            ("pagination", pagination(), max(iterations // 10, 5)),
+            ("large", large_bodies(), max(iterations // 20, 5)),
+        ]
+        for group, calls, n in groups:
+            for name, call in calls.items():
+                if selected(f"{group}/{name}"):
+                    results[f"{group}/{name}"] = measure(lambda i, call=call: call(client, i), n)
+                    _progress(f"{group}/{name}", results[f"{group}/{name}"])
+    if selected("mcp/"):
+        for name, result in mcp_scenarios(api, iterations, concurrency).items():
+            if selected(f"mcp/{name}"):
+                results[f"mcp/{name}"] = result
+                _progress(f"mcp/{name}", result)
+    if selected("webhook/load"):
+        results["webhook/load"] = webhook_load(api, iterations, concurrency)
+        _progress("webhook/load", results["webhook/load"])
+    return results
+
+
+def calibrate(rounds: int = 5) -> float:
+    """Milliseconds for a fixed encode/decode workload (best of ``rounds``); the machine's speed."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(50):
+            json.loads(json.dumps(SMALL_WF))
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def _median(value: list) -> Optional[float]:
+    present = [v for v in value if v is not None]
+    return round(statistics.median(present), 3) if present else None
+
+
+def run_repeated(api: FakeN8nApi, args: argparse.Namespace) -> tuple[dict[str, dict], float]:
+    """Per scenario the median of each metric over ``args.repeat`` runs, and the median calibration."""
+    runs, calibrations = [], []
+    for _ in range(args.repeat):
+        calibrations.append(calibrate())
+        runs.append(run_suite(api, args.iterations, args.concurrency, args.only))
+    results = {
+        name: {key: _median([run[name][key] for run in runs]) for key in row}
+        for name, row in runs[0].items()
+    }
+    return results, _median(calibrations)
+
+
+# --- Baseline ---
+
+
+def scale_baseline(baseline: dict[str, dict], speed: float) -> dict[str, dict]:
+    """``baseline`` as it would have run on a machine ``speed`` times slower."""
+    scaled = {}
+    for name, base in baseline.items():
+        row = dict(base)
+        if row.get("ops_per_s"):
+            row["ops_per_s"] = round(row["ops_per_s"] / speed, 1)
+        for key in ("p50_ms", "p99_ms"):
+            if row.get(key) is not None:
+                row[key] = round(row[key] * speed, 3)
+        scaled[name] = row
+    return scaled
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> dict[str, list[str]]:
+    """Per scenario, the metrics worse than the baseline by more than ``tolerance``."""
+    regressions: dict[str, list[str]] = {}
+    for name, row in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        worse = []
+        if row["ops_per_s"] and base["ops_per_s"] and row["ops_per_s"] < base["ops_per_s"] / (1 + tolerance):
+            worse.append(f"ops/s {base['ops_per_s']} -> {row['ops_per_s']}")
+        for key in ("p50_ms", "p99_ms", "peak_rss_mb"):
+            if row[key] is None or base.get(key) is None:
+                continue
+            if row[key] > base[key] * (1 + tolerance) and row[key] - base[key] > _SLACK[key]:
+                worse.append(f"{key} {base[key]} -> {row[key]}")
+        if worse:
+            regressions[name] = worse
+    return regressions
+
+
+def _change(now: Optional[float], before: Optional[float]) -> str:
+    if not now or not before:
+        return ""
+    return f"{(now - before) / before:+.0%}"
+
+
+def _progress(name: str, row: dict) -> None:
+    print(f"  {name:<40} {row['ops_per_s'] or 0:>9.1f} ops/s", file=sys.stderr, flush=True)
+
+
+def report(results: dict[str, dict], baseline: dict[str, dict], regressions: dict[str, list[str]]) -> None:
+    print(f"{'scenario':<40} {'ops/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'RSS MB':>7} {'errors':>6}"
+          + ("   vs baseline (ops/s, p50, p99)" if baseline else ""))
+    for name, row in results.items():
+        line = (f"{name:<40} {row['ops_per_s'] or 0:>9.1f} {row['p50_ms'] or 0:>8.3f} "
+                f"{row['p99_ms'] or 0:>8.3f} {row['peak_rss_mb']:>7.1f} {row['errors']:>6}")
+        base = baseline.get(name)
+        if base:
+            line += "   " + " ".join(
+                f"{_change(row[k], base.get(k)):>5}" for k in ("ops_per_s", "p50_ms", "p99_ms")
+            )
+            if name in regressions:
+                line += "  REGRESSED"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per operation scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="In-flight MCP tool calls / webhook workers")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake server latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--workflows", type=int, default=200)
+    parser.add_argument("--executions", type=int, default=200)
+    parser.add_argument("--nodes", type=int, default=20, help="Nodes per workflow")
+    parser.add_argument("--large-nodes", type=int, default=2000, help="Nodes of the large workflow/execution")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario; medians are kept")
+    parser.add_argument("--only", help="Run only the scenarios whose name contains this")
+    parser.add_argument("--baseline", default=BASELINE, help="Baseline JSON to compare with (or save to)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative slowdown before failing")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    options = {k: getattr(args, k) for k in (
+        "iterations", "concurrency", "latency_ms", "error_rate", "workflows", "executions", "nodes", "large_nodes",
+        "repeat",
+    )}
+    baseline: dict[str, dict] = {}
+    if not args.save_baseline:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; record one with --save-baseline.", file=sys.stderr)
+            sys.exit(2)
+        with open(args.baseline, encoding="utf-8") as f:
+            stored = json.load(f)
+        if stored.get("options") != options:
+            print(f"Baseline {args.baseline} was recorded with {stored.get('options')}; "
+                  "rerun with those options or pass another --baseline.", file=sys.stderr)
+            sys.exit(2)
+
+    api = FakeN8nApi(args.workflows, args.executions, args.nodes, args.large_nodes,
+                     args.latency_ms / 1000, args.error_rate)
+    with api:
+        results, calibration_ms = run_repeated(api, args)
+    document = {
+        "options": options,
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count()},
+        "calibration_ms": calibration_ms,
+        "results": results,
+    }
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+    if not args.save_baseline:
+        baseline = stored["results"]
+        if stored.get("calibration_ms"):
+            speed = calibration_ms / stored["calibration_ms"]
+            print(f"Calibration {calibration_ms} ms vs {stored['calibration_ms']} ms at baseline; "
+                  f"scaling baseline timings by {speed:.2f}", file=sys.stderr)
+            baseline = scale_baseline(baseline, speed)
+    regressions = compare(results, baseline, args.tolerance)
+    report(results, baseline, regressions)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        print(f"\n{len(regressions)} scenario(s) regressed by more than {args.tolerance:.0%}:", file=sys.stderr)
+        for name, worse in regressions.items():
+            print(f"  {name}: {'; '.join(worse)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Output size and encode time of workflow and execution views.
+
+Builds a synthetic workflow (nodes with parameters and positions, pinned
+data) and a finished execution with run data, then renders each view as
+indented JSON (the old tool output), compact JSON and from the output cache.
+
+Usage:
+    python benchmarks/bench_views.py [--nodes 100] [--runs 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+from mcp_n8n.views import VIEWS, OutputCache, render
+
+from payloads import execution, workflow
+
+
+def _time_ms(call, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    wf = workflow(args.nodes)
+    documents = {"workflow": wf, "execution": execution(wf)}
+    print(f"{'document':<10} {'view':<9} {'encoding':<9} {'bytes':>9} {'median ms':>10}")
+    for kind, doc in documents.items():
+        size = len(json.dumps(doc, indent=2))
+        elapsed = _time_ms(lambda: json.dumps(doc, indent=2), args.runs)
+        print(f"{kind:<10} {'full':<9} {'indent=2':<9} {size:>9} {elapsed:>10.3f}")
+        for view in VIEWS:
+            size = len(render(doc, kind, view))
+            elapsed = _time_ms(lambda: render(doc, kind, view), args.runs)
+            print(f"{kind:<10} {view:<9} {'compact':<9} {size:>9} {elapsed:>10.3f}")
+        cache = OutputCache()
+        render(doc, kind, "full", cache=cache)
+        elapsed = _time_ms(lambda: render(doc, kind, "full", cache=cache), args.runs)
+        print(f"{kind:<10} {'full':<9} {'cached':<9} {size:>9} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
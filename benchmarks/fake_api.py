@@ -0,0 +1,227 @@
+"""In-process fake of the n8n public API for benchmarks.
+
+Serves ``/api/v1`` workflows, executions, credentials, tags, users and
+active workflows, plus ``/webhook/*``, from generated documents (see
+``payloads``), with cursor pagination like n8n's. Workflow and execution
+``"large"`` have ``large_nodes`` nodes; the others have ``nodes``. Writes are
+answered like n8n answers them but not stored, so every run sees the same
+data.
+
+Latency and injected errors come from ``stand_in.StandInServer``,
+which this extends: every request waits ``latency`` seconds, and an
+``error_rate`` fraction of requests (spread evenly, not randomly) gets
+``error_status`` instead.
+
+Usage:
+    with FakeN8nApi(workflows=200, latency=0.002, error_rate=0.01) as api:
+        client = N8nClient(base_url=api.base_url, api_key="bench")
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+from payloads import execution, workflow
+from stand_in import StandInServer
+
+Body = Union[bytes, dict, list]
+Answer = tuple[int, Body]
+
+LARGE = "large"
+
+
+def _page(items: list[bytes], query: dict, default_limit: int) -> bytes:
+    start = int(query.get("cursor", "0") or 0)
+    limit = int(query.get("limit", default_limit))
+    end = start + limit
+    cursor = json.dumps(str(end)).encode() if end < len(items) else b"null"
+    return b'{"data": [' + b", ".join(items[start:end]) + b'], "nextCursor": ' + cursor + b"}"
+
+
+class FakeN8nApi(StandInServer):
+    """Local keep-alive HTTP server answering the n8n API calls the client makes."""
+
+    def __init__(
+        self,
+        workflows: int = 200,
+        executions: int = 200,
+        nodes: int = 20,
+        large_nodes: int = 2000,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+    ) -> None:
+        super().__init__(latency, error_rate, error_status)
+        self.workflow_count = workflows
+        self.execution_count = executions
+        self.nodes = nodes
+        self.large_nodes = large_nodes
+        self._documents: dict[tuple[str, str], bytes] = {}
+        self._workflow_items = [self._document("workflow", str(i)) for i in range(1, workflows + 1)]
+        self._execution_items = [
+            json.dumps(self._execution_summary(str(i))).encode() for i in range(1, executions + 1)
+        ]
+        self._tag_items = [json.dumps({"id": f"t{i}", "name": f"tag-{i}"}).encode() for i in range(1, 51)]
+        self._credential_items = [
+            json.dumps({"id": f"c{i}", "name": f"Credential {i}", "type": "httpBasicAuth"}).encode()
+            for i in range(1, 51)
+        ]
+        self._user_items = [
+            json.dumps({"id": f"u{i}", "email": f"user{i}@example.com", "role": "global:member"}).encode()
+            for i in range(1, 21)
+        ]
+        self._routes: list[tuple[str, re.Pattern, Callable[..., Answer]]] = [
+            ("GET", re.compile(r"/api/v1/workflows"), self._list_workflows),
+            ("POST", re.compile(r"/api/v1/workflows"), self._created),
+            ("GET", re.compile(r"/api/v1/workflows/([^/]+)"), self._get_workflow),
+            ("PUT", re.compile(r"/api/v1/workflows/([^/]+)"), self._update_workflow),
+            ("DELETE", re.compile(r"/api/v1/workflows/([^/]+)"), self._get_workflow),
+            ("POST", re.compile(r"/api/v1/workflows/([^/]+)/(activate|deactivate)"), self._activate),
+            ("POST", re.compile(r"/api/v1/workflows/([^/]+)/run"), self._run),
+            ("GET", re.compile(r"/api/v1/active-workflows"), self._active_workflows),
+            ("GET", re.compile(r"/api/v1/active-workflows/error/([^/]+)"), self._activation_error),
+            ("GET", re.compile(r"/api/v1/executions"), self._list_executions),
+            ("GET", re.compile(r"/api/v1/executions/([^/]+)"), self._get_execution),
+            ("DELETE", re.compile(r"/api/v1/executions/([^/]+)"), self._get_execution),
+            ("POST", re.compile(r"/api/v1/executions/([^/]+)/retry"), self._retry),
+            ("POST", re.compile(r"/api/v1/executions/([^/]+)/stop"), self._stop),
+            ("GET", re.compile(r"/api/v1/credentials"), self._lister(self._credential_items)),
+            ("POST", re.compile(r"/api/v1/credentials"), self._created),
+            ("GET", re.compile(r"/api/v1/credentials/schema/([^/]+)"), self._credential_schema),
+            ("DELETE", re.compile(r"/api/v1/credentials/([^/]+)"), self._deleted),
+            ("GET", re.compile(r"/api/v1/tags"), self._lister(self._tag_items)),
+            ("POST", re.compile(r"/api/v1/tags"), self._created),
+            ("DELETE", re.compile(r"/api/v1/tags/([^/]+)"), self._deleted),
+            ("GET", re.compile(r"/api/v1/users"), self._lister(self._user_items)),
+            (None, re.compile(r"/webhook(?:-test)?/.+"), self._webhook),
+        ]
+
+    # --- Documents ---
+
+    def _exists(self, kind: str, item_id: str) -> bool:
+        count = self.workflow_count if kind == "workflow" else self.execution_count
+        return item_id == LARGE or (item_id.isdigit() and 1 <= int(item_id) <= count)
+
+    def _document(self, kind: str, item_id: str) -> bytes:
+        key = (kind, item_id)
+        with self._lock:
+            cached = self._documents.get(key)
+        if cached is not None:
+            return cached
+        wf = workflow(self.large_nodes if item_id == LARGE else self.nodes)
+        if kind == "workflow":
+            wf["id"] = item_id
+            wf["name"] = f"Workflow {item_id}"
+            wf["active"] = item_id.isdigit() and int(item_id) % 2 == 0
+            doc = wf
+        else:
+            wf["id"] = item_id
+            doc = {**execution(wf), "id": item_id}
+        encoded = json.dumps(doc).encode()
+        with self._lock:
+            self._documents[key] = encoded
+        return encoded
+
+    @staticmethod
+    def _execution_summary(item_id: str) -> dict:
+        return {
+            "id": item_id,
+            "workflowId": item_id,
+            "status": "success",
+            "mode": "trigger",
+            "finished": True,
+            "startedAt": "2025-06-01T00:00:00.000Z",
+            "stoppedAt": "2025-06-01T00:00:02.000Z",
+        }
+
+    # --- Routes ---
+
+    def _list_workflows(self, query: dict, body: Any) -> Answer:
+        items = self._workflow_items
+        if "active" in query:
+            active = query["active"] == "true"
+            items = [item for i, item in enumerate(items, 1) if (i % 2 == 0) == active]
+        return 200, _page(items, query, 100)
+
+    def _get_workflow(self, query: dict, body: Any, item_id: str) -> Answer:
+        if not self._exists("workflow", item_id):
+            return 404, {"message": "Not Found"}
+        return 200, self._document("workflow", item_id)
+
+    def _update_workflow(self, query: dict, body: Any, item_id: str) -> Answer:
+        if not self._exists("workflow", item_id):
+            return 404, {"message": "Not Found"}
+        return 200, {**json.loads(self._document("workflow", item_id)), **(body or {}), "versionId": "v2"}
+
+    def _activate(self, query: dict, body: Any, item_id: str, action: str) -> Answer:
+        if not self._exists("workflow", item_id):
+            return 404, {"message": "Not Found"}
+        return 200, {"id": item_id, "active": action == "activate"}
+
+    def _run(self, query: dict, body: Any, item_id: str) -> Answer:
+        if not self._exists("workflow", item_id):
+            return 404, {"message": "Not Found"}
+        return 200, {"executionId": "1" if item_id == LARGE else item_id}
+
+    def _active_workflows(self, query: dict, body: Any) -> Answer:
+        return 200, [str(i) for i in range(2, self.workflow_count + 1, 2)]
+
+    def _activation_error(self, query: dict, body: Any, item_id: str) -> Answer:
+        return 200, {}
+
+    def _list_executions(self, query: dict, body: Any) -> Answer:
+        items = self._execution_items
+        if "workflowId" in query:
+            items = [item for i, item in enumerate(items, 1) if str(i) == query["workflowId"]]
+        return 200, _page(items, query, 20)
+
+    def _get_execution(self, query: dict, body: Any, item_id: str) -> Answer:
+        if not self._exists("execution", item_id):
+            return 404, {"message": "Not Found"}
+        if query.get("includeData") == "true":
+            return 200, self._document("execution", item_id)
+        return 200, self._execution_summary(item_id)
+
+    def _retry(self, query: dict, body: Any, item_id: str) -> Answer:
+        if not self._exists("execution", item_id):
+            return 404, {"message": "Not Found"}
+        return 200, {**self._execution_summary(str(self.execution_count + 1)), "retryOf": item_id}
+
+    def _stop(self, query: dict, body: Any, item_id: str) -> Answer:
+        if not self._exists("execution", item_id):
+            return 404, {"message": "Not Found"}
+        return 200, {**self._execution_summary(item_id), "status": "canceled"}
+
+    def _credential_schema(self, query: dict, body: Any, credential_type: str) -> Answer:
+        return 200, {
+            "type": "object",
+            "properties": {"user": {"type": "string"}, "password": {"type": "string"}},
+            "required": ["user", "password"],
+        }
+
+    def _created(self, query: dict, body: Any) -> Answer:
+        return 200, {**(body or {}), "id": "new", "createdAt": "2025-06-01T00:00:00.000Z"}
+
+    def _deleted(self, query: dict, body: Any, item_id: str) -> Answer:
+        return 200, {"id": item_id}
+
+    def _webhook(self, query: dict, body: Any) -> Answer:
+        return 200, {"message": "Workflow was started"}
+
+    @staticmethod
+    def _lister(items: list[bytes]) -> Callable[..., Answer]:
+        return lambda query, body: (200, _page(items, query, 100))
+
+    def answer(self, method: str, target: str, body: Optional[bytes]) -> Answer:
+        """Status and body for one request, by route."""
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        path = url.path.rstrip("/")
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match and route_method in (None, method):
+                return handler(query, json.loads(body) if body else None, *match.groups())
+        return 404, {"message": "Not Found"}
@@ -0,0 +1,55 @@
+"""Synthetic n8n documents shaped like real workflows and executions."""
+
+from __future__ import annotations
+
+
+def workflow(nodes: int = 100) -> dict:
+    """Workflow with a chain of HTTP nodes, connections and pinned data."""
+    return {
+        "id": "wf1",
+        "name": "Order pipeline",
+        "active": True,
+        "createdAt": "2025-01-01T00:00:00.000Z",
+        "updatedAt": "2025-06-01T00:00:00.000Z",
+        "versionId": "v1",
+        "tags": [{"id": "t1", "name": "prod"}],
+        "nodes": [
+            {
+                "id": f"n{i}",
+                "name": f"Node {i}",
+                "type": "n8n-nodes-base.httpRequest",
+                "typeVersion": 4,
+                "position": [i * 200, 300],
+                "parameters": {"url": f"https://api.example.com/items/{i}", "options": {"timeout": 10000}},
+            }
+            for i in range(nodes)
+        ],
+        "connections": {
+            f"Node {i}": {"main": [[{"node": f"Node {i + 1}", "type": "main", "index": 0}]]}
+            for i in range(nodes - 1)
+        },
+        "settings": {"executionOrder": "v1"},
+        "staticData": {"lastId": 1234},
+        "pinData": {"Node 0": [{"json": {"id": i, "payload": "x" * 200}} for i in range(50)]},
+    }
+
+
+def execution(workflow: dict) -> dict:
+    """Finished execution of ``workflow`` with run data for every node."""
+    return {
+        "id": "ex1",
+        "workflowId": workflow["id"],
+        "status": "success",
+        "mode": "trigger",
+        "finished": True,
+        "startedAt": "2025-06-01T00:00:00.000Z",
+        "stoppedAt": "2025-06-01T00:00:02.000Z",
+        "workflowData": workflow,
+        "data": {"resultData": {
+            "lastNodeExecuted": workflow["nodes"][-1]["name"],
+            "runData": {
+                node["name"]: [{"executionTime": 5, "data": {"main": [[{"json": {"ok": True, "n": i}}]]}}]
+                for i, node in enumerate(workflow["nodes"])
+            },
+        }},
+    }
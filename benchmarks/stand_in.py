@@ -0,0 +1,94 @@
+"""Local keep-alive HTTP server shared by the benchmarks and the test fakes.
+
+``StandInServer`` owns the server thread, per-request latency and evenly
+spread error injection; subclasses decide what each request gets by
+overriding ``answer``. Not part of the shipped package (the load
+generator's ``--stand-in`` target is ``mcp_n8n.loadgen.StandInServer``).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import socket
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+
+class StandInServer:
+    """Answers every request with ``answer``; ``error_rate`` of them (spread evenly) get ``error_status``."""
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, error_status: int = 500) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.received = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    def _next_status(self) -> int:
+        with self._lock:
+            n = self.received
+            self.received += 1
+        failing = math.floor((n + 1) * self.error_rate) > math.floor(n * self.error_rate)
+        return self.error_status if failing else 200
+
+    def answer(self, method: str, target: str, body: Optional[bytes]) -> Optional[tuple]:
+        """``(status, body)`` or ``(status, body, headers)`` for one request; ``None`` drops the connection.
+
+        ``body`` may be bytes or anything JSON-serialisable. Injected errors
+        and latency are applied around this.
+        """
+        return 200, {"message": "Workflow was started"}
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                status = stand_in._next_status()
+                if status != 200:
+                    answer: Optional[tuple] = (status, {"message": "Error in workflow"})
+                else:
+                    answer = stand_in.answer(self.command, self.path, body)
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                if answer is None:
+                    self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    self.close_connection = True
+                    return
+                status, content, *rest = answer
+                payload = content if isinstance(content, bytes) else json.dumps(content).encode()
+                self.send_response(status)
+                for name, value in (rest[0] if rest else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _respond
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> StandInServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,5 +1,17 @@
 """mcp-n8n: n8n workflow automation API as Python library, LangChain tools, and MCP server."""
 
-from .client import N8nClient
+from typing import TYPE_CHECKING
 
-__all__ = ["N8nClient"]
+if TYPE_CHECKING:
+    from .client import AsyncN8nClient, N8nClient
+
+__all__ = ["AsyncN8nClient", "N8nClient"]
+
+
+def __getattr__(name: str):
+    # Imported on first use so ``mcp_n8n.server`` and the CLIs start without the HTTP stack.
+    if name in __all__:
+        from . import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
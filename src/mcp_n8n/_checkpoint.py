@@ -0,0 +1,30 @@
+"""Resumable-job checkpoints shared by the archiver and the purger."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Optional
+
+
+def id_key(execution_id: str) -> tuple:
+    """Sort key for execution IDs (numeric when possible)."""
+    return (0, int(execution_id), "") if str(execution_id).isdigit() else (1, 0, str(execution_id))
+
+
+def load_checkpoint(path: str, filters: dict) -> Optional[dict]:
+    """Load a checkpoint, or None if missing or written for other filters."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return None
+    return checkpoint if checkpoint.get("filters") == filters else None
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    """Atomically replace the checkpoint at ``path``."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp, path)
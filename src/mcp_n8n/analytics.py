@@ -0,0 +1,203 @@
+"""Execution latency, failure-rate and throughput statistics per workflow.
+
+Streams execution summaries from ``list_executions`` (no execution data) and
+folds them into ``ExecutionStats``: run times go into per-workflow
+``array('d')`` buffers (8 bytes per execution), statuses and trigger modes
+into counters and start times into hourly buckets, so a million executions
+cost a few megabytes and one sort per workflow.
+
+Usage:
+    from mcp_n8n.analytics import execution_stats
+
+    execution_stats(client, since="2025-06-01T00:00:00Z", workflow_id="42")
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional, Union
+
+from .operations import executions
+from .operations._pagination import StopPredicate
+from .operations._time import parse_timestamp
+
+if TYPE_CHECKING:
+    from .client import AsyncN8nClient, N8nClient
+
+PERCENTILES = (50, 95, 99)
+ERROR_STATUSES = frozenset({"error", "crashed"})
+
+
+def percentile(ordered: list[float], q: float) -> Optional[float]:
+    """Linear-interpolated ``q``-th percentile of an ascending sequence."""
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class _Bucket:
+    __slots__ = ("name", "durations", "statuses", "modes", "hours")
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        self.durations = array("d")
+        self.statuses: Counter[str] = Counter()
+        self.modes: Counter[str] = Counter()
+        self.hours: Counter[int] = Counter()
+
+    def add(self, status: str, mode: str, hour: Optional[int], duration_ms: Optional[float]) -> None:
+        self.statuses[status] += 1
+        self.modes[mode] += 1
+        if hour is not None:
+            self.hours[hour] += 1
+        if duration_ms is not None:
+            self.durations.append(duration_ms)
+
+    def summary(self) -> dict:
+        count = sum(self.statuses.values())
+        errors = sum(n for status, n in self.statuses.items() if status in ERROR_STATUSES)
+        ordered = sorted(self.durations)
+        durations = {f"p{q}": _round(percentile(ordered, q)) for q in PERCENTILES}
+        durations["mean"] = _round(sum(ordered) / len(ordered)) if ordered else None
+        durations["max"] = _round(ordered[-1]) if ordered else None
+        return {
+            "count": count,
+            "error_rate": round(errors / count, 4) if count else None,
+            "duration_ms": durations,
+            "by_status": dict(self.statuses.most_common()),
+            "by_mode": dict(self.modes.most_common()),
+            "per_hour": _throughput(self.hours),
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+def _throughput(hours: Counter[int]) -> dict:
+    """Executions per hour over the span of hours that saw any."""
+    if not hours:
+        return {"mean": 0.0, "peak": 0, "peak_hour": None}
+    span = max(hours) - min(hours) + 1
+    peak_hour, peak = max(hours.items(), key=lambda item: (item[1], item[0]))
+    return {
+        "mean": round(sum(hours.values()) / span, 2),
+        "peak": peak,
+        "peak_hour": datetime.fromtimestamp(peak_hour * 3600, timezone.utc).isoformat(),
+    }
+
+
+class ExecutionStats:
+    """Accumulates execution summaries into per-workflow and overall statistics."""
+
+    def __init__(
+        self,
+        since: Union[str, datetime, None] = None,
+        until: Union[str, datetime, None] = None,
+    ) -> None:
+        self.since = parse_timestamp(since)
+        self.until = parse_timestamp(until)
+        self._workflows: dict[str, _Bucket] = {}
+
+    def add(self, ex: dict) -> None:
+        started = parse_timestamp(ex.get("startedAt"))
+        if started is not None:
+            if (self.since is not None and started < self.since) or (self.until is not None and started > self.until):
+                return
+            hour: Optional[int] = int(started.timestamp() // 3600)
+        else:
+            hour = None
+        stopped = parse_timestamp(ex.get("stoppedAt"))
+        duration_ms = (stopped - started).total_seconds() * 1000 if started and stopped else None
+        status = ex.get("status") or "unknown"
+        mode = ex.get("mode") or "unknown"
+        workflow_id = str(ex.get("workflowId"))
+        bucket = self._workflows.get(workflow_id)
+        if bucket is None:
+            bucket = self._workflows[workflow_id] = _Bucket()
+            bucket.name = ex.get("workflowName")
+        bucket.add(status, mode, hour, duration_ms)
+
+    def _merged(self) -> _Bucket:
+        merged = _Bucket()
+        for bucket in self._workflows.values():
+            merged.durations.extend(bucket.durations)
+            merged.statuses.update(bucket.statuses)
+            merged.modes.update(bucket.modes)
+            merged.hours.update(bucket.hours)
+        return merged
+
+    def summary(self, top: Optional[int] = None) -> dict:
+        """Compact summary; ``top`` keeps only the busiest workflows."""
+        workflows = [
+            {"workflowId": wid, "workflowName": bucket.name, **bucket.summary()}
+            for wid, bucket in self._workflows.items()
+        ]
+        workflows.sort(key=lambda w: w["count"], reverse=True)
+        overall = self._merged().summary()
+        overall["workflows"] = len(workflows)
+        return {
+            "window": {
+                "since": self.since.isoformat() if self.since else None,
+                "until": self.until.isoformat() if self.until else None,
+            },
+            "overall": overall,
+            "workflows": workflows[:top] if top is not None else workflows,
+        }
+
+
+def _stop_before(since: Optional[datetime]) -> Optional[StopPredicate]:
+    if since is None:
+        return None
+
+    def stop(ex: dict) -> bool:
+        started = parse_timestamp(ex.get("startedAt"))
+        return started is not None and started < since
+
+    return stop
+
+
+def execution_stats(
+    client: N8nClient,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    top: Optional[int] = None,
+) -> dict:
+    """Run time percentiles, error rate, status/mode counts and hourly throughput.
+
+    ``since``/``until`` bound ``startedAt``; listing stops at the first
+    execution that started before ``since``.
+    """
+    stats = ExecutionStats(since, until)
+    for ex in executions.iter_executions(
+        client, workflow_id=workflow_id, status=status, max_items=max_items, stop=_stop_before(stats.since),
+    ):
+        stats.add(ex)
+    return stats.summary(top)
+
+
+async def aexecution_stats(
+    client: AsyncN8nClient,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    top: Optional[int] = None,
+) -> dict:
+    """Async twin of ``execution_stats``."""
+    stats = ExecutionStats(since, until)
+    async for ex in executions.aiter_executions(
+        client, workflow_id=workflow_id, status=status, max_items=max_items, stop=_stop_before(stats.since),
+    ):
+        stats.add(ex)
+    return stats.summary(top)
@@ -0,0 +1,231 @@
+"""Streaming execution archiver to rotating compressed JSONL files.
+
+Walks ``list_executions`` (optionally by workflow, status and startedAt range),
+fetches full execution data with bounded concurrency in small batches and
+writes one JSON record per line. Files rotate every ``max_records_per_file``
+records and are written as ``*.partial`` then renamed, so every finished file
+is complete. A new run into a directory that already holds an archive
+continues its file numbering rather than replacing earlier files. A
+checkpoint is saved after each finished file; an interrupted run resumes
+after the last archived execution.
+
+Usage:
+    mcp-n8n-archive --out ./archive --status error --since 2025-01-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import re
+from datetime import datetime
+from typing import IO, Callable, Optional
+
+from . import codec
+from ._checkpoint import id_key, load_checkpoint, save_checkpoint
+from .client import N8nClient
+from .operations import executions
+from .operations._time import parse_timestamp
+
+CHECKPOINT_FILE = "archive-checkpoint.json"
+
+_ARCHIVE_FILE = re.compile(r"executions-(\d+)\.jsonl\.(?:gz|zst)")
+
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _next_file_index(out_dir: str) -> int:
+    """One past the highest numbered archive file already in ``out_dir``."""
+    indexes = [int(m.group(1)) for m in map(_ARCHIVE_FILE.fullmatch, os.listdir(out_dir)) if m]
+    return max(indexes, default=0) + 1
+
+
+class _RotatingWriter:
+    """Writes JSONL records to numbered compressed files."""
+
+    def __init__(self, out_dir: str, compression: str, max_records: int, file_index: int) -> None:
+        self.out_dir = out_dir
+        self.compression = compression
+        self.max_records = max_records
+        self.file_index = file_index
+        self.files: list[str] = []
+        self._stream: Optional[IO[str]] = None
+        self._path = ""
+        self._count = 0
+
+    def _open(self) -> None:
+        suffix = "zst" if self.compression == "zstd" else "gz"
+        self._path = os.path.join(self.out_dir, f"executions-{self.file_index:05d}.jsonl.{suffix}")
+        while os.path.exists(self._path):  # never replace a finished file
+            self.file_index = _next_file_index(self.out_dir)
+            self._path = os.path.join(self.out_dir, f"executions-{self.file_index:05d}.jsonl.{suffix}")
+        partial = self._path + ".partial"
+        if self.compression == "zstd":
+            import zstandard
+
+            self._stream = zstandard.open(partial, "wt", encoding="utf-8")
+        else:
+            self._stream = gzip.open(partial, "wt", encoding="utf-8")
+        self._count = 0
+
+    def write(self, record: dict) -> bool:
+        """Write one record; return True if this finished a file."""
+        if self._stream is None:
+            self._open()
+        self._stream.write(codec.dumps(record))
+        self._stream.write("\n")
+        self._count += 1
+        if self._count >= self.max_records:
+            self.finish()
+            return True
+        return False
+
+    def finish(self) -> None:
+        if self._stream is None:
+            return
+        self._stream.close()
+        os.replace(self._path + ".partial", self._path)
+        self.files.append(self._path)
+        self._stream = None
+        self.file_index += 1
+
+
+def archive_executions(
+    client: N8nClient,
+    out_dir: str,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    compression: str = "auto",
+    max_records_per_file: int = 10_000,
+    max_concurrency: int = 4,
+    batch_size: int = 50,
+    resume: bool = True,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """Archive matching executions with full data to ``out_dir``.
+
+    ``since``/``until`` bound ``startedAt`` (ISO-8601). ``compression`` is
+    ``"zstd"``, ``"gzip"`` or ``"auto"`` (zstd when ``zstandard`` is installed).
+    Only ``batch_size`` full executions are held in memory at a time.
+    """
+    if compression == "auto":
+        compression = "zstd" if _zstd_available() else "gzip"
+    if compression not in ("zstd", "gzip"):
+        raise ValueError(f"Unsupported compression: {compression}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    since_at = parse_timestamp(since)
+    until_at = parse_timestamp(until)
+    filters = {"workflow_id": workflow_id, "status": status, "since": since, "until": until}
+    checkpoint_path = os.path.join(out_dir, CHECKPOINT_FILE)
+    checkpoint = load_checkpoint(checkpoint_path, filters) if resume else None
+    state = checkpoint or {
+        "filters": filters, "last_id": None, "file_index": _next_file_index(out_dir), "archived": 0,
+    }
+    resume_after = id_key(state["last_id"]) if state["last_id"] is not None else None
+
+    writer = _RotatingWriter(out_dir, compression, max_records_per_file, state["file_index"])
+    stats = {"archived": state["archived"], "skipped": 0, "failed": 0, "files": writer.files}
+    last_written: Optional[str] = state["last_id"]
+
+    def started(ex: dict) -> Optional[datetime]:
+        return parse_timestamp(ex.get("startedAt"))
+
+    def before_window(ex: dict) -> bool:
+        at = started(ex)
+        return since_at is not None and at is not None and at < since_at
+
+    def flush(batch: list[str]) -> None:
+        nonlocal last_written
+        fetched = executions.get_executions_bulk(client, batch, include_data=True, max_concurrency=max_concurrency)
+        for result in fetched["results"]:
+            if not result["ok"]:
+                stats["failed"] += 1
+                continue
+            finished_file = writer.write(result["data"])
+            stats["archived"] += 1
+            last_written = result["id"]
+            if finished_file:
+                save_checkpoint(checkpoint_path, {
+                    "filters": filters,
+                    "last_id": last_written,
+                    "file_index": writer.file_index,
+                    "archived": stats["archived"],
+                })
+        if progress is not None:
+            progress(dict(stats, files=list(writer.files)))
+
+    batch: list[str] = []
+    for ex in executions.iter_executions(
+        client, workflow_id=workflow_id, status=status, stop=before_window,
+    ):
+        if resume_after is not None and id_key(ex["id"]) >= resume_after:
+            stats["skipped"] += 1
+            continue
+        at = started(ex)
+        if until_at is not None and at is not None and at > until_at:
+            stats["skipped"] += 1
+            continue
+        batch.append(ex["id"])
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    writer.finish()
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    stats["files"] = list(writer.files)
+    stats["compression"] = compression
+    return stats
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="mcp-n8n-archive",
+        description="Archive n8n executions with full data to compressed JSONL files.",
+    )
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--workflow-id", help="Only executions of this workflow")
+    parser.add_argument("--status", help="Only executions with this status (success, error, ...)")
+    parser.add_argument("--since", help="Only executions started at or after this ISO-8601 time")
+    parser.add_argument("--until", help="Only executions started at or before this ISO-8601 time")
+    parser.add_argument("--compression", choices=["auto", "zstd", "gzip"], default="auto")
+    parser.add_argument("--max-records-per-file", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent execution fetches")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    def report(stats: dict) -> None:
+        print(f"archived={stats['archived']} failed={stats['failed']} files={len(stats['files'])}", flush=True)
+
+    with N8nClient() as client:
+        stats = archive_executions(
+            client,
+            args.out,
+            workflow_id=args.workflow_id,
+            status=args.status,
+            since=args.since,
+            until=args.until,
+            compression=args.compression,
+            max_records_per_file=args.max_records_per_file,
+            max_concurrency=args.concurrency,
+            resume=not args.no_resume,
+            progress=report,
+        )
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""Trim workflow and execution documents to a byte budget.
+
+A document over budget is trimmed in a fixed order, stopping as soon as it
+fits. One walk measures every subtree's JSON size; each step subtracts what it
+cuts, so the document is never re-encoded:
+
+1. binary payloads (``binary.<name>.data``) are dropped, keeping file metadata;
+2. long arrays are cut to a head and tail around an ``omitted`` marker, more
+   aggressively on each pass;
+3. long strings are cut to a prefix;
+4. whole ``runData`` entries of nodes that did not fail are dropped.
+
+Nodes whose runs have an error are never trimmed. Every marker carries a
+``handle`` (the path of the omitted part in the original document, plus a
+slice) that ``resolve`` turns back into that part, itself trimmed to a
+budget. Trimming does not modify the input: only containers on the path to a
+trimmed value are copied. ``SourceCache`` keeps recently trimmed documents so
+continuations are served without fetching them again.
+
+Usage:
+    from mcp_n8n.budget import trim
+
+    trim(execution, max_bytes=50_000, kind="execution", doc_id=execution["id"])
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Union
+
+from . import codec
+
+BYTES_PER_TOKEN = 4
+_ARRAY_KEEP = ((20, 5), (5, 2), (1, 1))
+_STRING_KEEP = 500
+_LONG_STRING = 2 * _STRING_KEEP
+
+Path = tuple[Union[str, int], ...]
+
+
+def budget_bytes(max_bytes: Optional[int] = None, max_tokens: Optional[int] = None) -> Optional[int]:
+    """Byte budget from ``max_bytes`` and/or ``max_tokens`` (about 4 bytes per token)."""
+    limits = [n for n in (max_bytes, max_tokens * BYTES_PER_TOKEN if max_tokens else None) if n]
+    return min(limits) if limits else None
+
+
+def make_handle(kind: str, doc_id: str, path: Path, start: Optional[int] = None, end: Optional[int] = None) -> str:
+    """Opaque token naming a part of a document: ``path`` and an optional slice of it."""
+    raw = codec.dumpb([kind, str(doc_id), list(path), start, end])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def parse_handle(handle: str) -> tuple[str, str, Path, Optional[int], Optional[int]]:
+    """Inverse of ``make_handle``; raises ``ValueError`` for malformed handles."""
+    try:
+        kind, doc_id, path, start, end = codec.loads(base64.urlsafe_b64decode(handle + "=" * (-len(handle) % 4)))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid continuation handle: {handle!r}") from e
+    return kind, doc_id, tuple(path), start, end
+
+
+def _failed_nodes(doc: Any) -> set[str]:
+    run_data = ((doc.get("data") or {}).get("resultData") or {}).get("runData") if isinstance(doc, dict) else None
+    if not isinstance(run_data, dict):
+        return set()
+    return {
+        name for name, runs in run_data.items()
+        if isinstance(runs, list) and any(isinstance(run, dict) and run.get("error") for run in runs)
+    }
+
+
+class _Node:
+    __slots__ = ("op", "children")
+
+    def __init__(self) -> None:
+        self.op: Optional[tuple] = None
+        self.children: dict[Union[str, int], _Node] = {}
+
+
+class _Plan:
+    """Replacements keyed by path, applied by rebuilding only the containers on those paths."""
+
+    def __init__(self) -> None:
+        self.root = _Node()
+
+    def set(self, path: Path, op: tuple) -> None:
+        node = self.root
+        for key in path:
+            node = node.children.setdefault(key, _Node())
+        node.op = op
+
+    def visible(self, path: Path) -> bool:
+        """Whether ``path`` is still in the output (not inside a replaced or cut-out part)."""
+        node = self.root
+        for key in path:
+            if node.op is not None:
+                if node.op[0] == "replace":
+                    return False
+                _, head, tail, _, length = node.op
+                if head <= key < length - tail:
+                    return False
+            node = node.children.get(key)
+            if node is None:
+                return True
+        return True
+
+    def apply(self, value: Any, node: Optional[_Node] = None) -> Any:
+        node = node or self.root
+        if node.op is not None and node.op[0] == "replace":
+            return node.op[1]
+        children = node.children
+        if isinstance(value, dict):
+            if not children:
+                return value
+            out = dict(value)
+            for key, child in children.items():
+                if key in value:
+                    out[key] = self.apply(value[key], child)
+            return out
+        if isinstance(value, list):
+            if node.op is None and not children:
+                return value
+            if node.op is not None:
+                _, head, tail, marker, _ = node.op
+                indexes: list = [*range(head), marker, *range(len(value) - tail, len(value))]
+            else:
+                indexes = list(range(len(value)))
+            return [
+                i if isinstance(i, dict) else self.apply(value[i], children[i]) if i in children else value[i]
+                for i in indexes
+            ]
+        return value
+
+
+def _size(value: Any) -> int:
+    return len(codec.dumpb(value))
+
+
+def _scalar_size(value: Any) -> int:
+    """JSON size of a scalar, without encoding plain strings and integers."""
+    if isinstance(value, str):
+        if value.isprintable() and '"' not in value and "\\" not in value:
+            return (len(value) if value.isascii() else len(value.encode())) + 2
+    elif value is None or value is True:
+        return 4
+    elif value is False:
+        return 5
+    elif type(value) is int:
+        return len(str(value))
+    return _size(value)
+
+
+def _key_size(key: Any) -> int:
+    return _scalar_size(key) if isinstance(key, str) else _size({key: 0}) - 4
+
+
+def _list_size(sizes: list[int]) -> int:
+    return len(sizes) + 1 + sum(sizes) if sizes else 2
+
+
+class _Index:
+    """One walk over the document measuring it and collecting what each trimming step can cut.
+
+    Sizes are kept for the subtrees a step may drop: the items of long arrays
+    (``arrays``: path -> index of the first item and item sizes) and the
+    ``measure`` paths (``sizes``). ``shrink`` keeps them and the total up to
+    date as parts are cut.
+    """
+
+    def __init__(self, doc: Any, base: Path, offset: int, exempt: set[Path], measure: set[Path]) -> None:
+        self.binaries: list[tuple[Path, dict, int]] = []
+        self.arrays: dict[Path, tuple[int, list[int]]] = {}
+        self.strings: list[tuple[Path, str, int]] = []
+        self.sizes: dict[Path, int] = {}
+        self._exempt = exempt
+        self._measure = measure
+        # Lengths of the exempt and measured paths, so other paths skip hashing.
+        self._depths = {len(p) for p in exempt | measure}
+        self._keys: dict[Any, int] = {}
+        self.size = self._walk(doc, base, offset)
+
+    def _walk(self, value: Any, path: Path, offset: int = 0) -> int:
+        if not isinstance(value, (dict, list)):
+            size = _scalar_size(value)
+            if isinstance(value, str) and len(value) > _LONG_STRING:
+                self.strings.append((path, value, size))
+            return size
+        if len(path) not in self._depths:
+            return self._dict(value, path) if isinstance(value, dict) else self._list(value, path, offset)
+        if path in self._exempt:
+            # Nothing below is cut, so only the total matters: let the encoder measure it.
+            size = _size(value)
+        elif isinstance(value, dict):
+            size = self._dict(value, path)
+        else:
+            size = self._list(value, path, offset)
+        if path in self._measure:
+            self.sizes[path] = size
+        return size
+
+    def _dict(self, value: dict, path: Path) -> int:
+        size = 2 * len(value) + 1 if value else 2
+        keys = self._keys
+        direct = len(path) + 1 not in self._depths
+        for key, child in value.items():
+            key_size = keys.get(key)
+            if key_size is None:
+                key_size = keys[key] = _key_size(key)
+            size += key_size
+            if isinstance(child, dict):
+                if key == "binary":
+                    for name, entry in child.items():
+                        if isinstance(entry, dict) and isinstance(entry.get("data"), str):
+                            self.binaries.append((path + (key, name), entry, _scalar_size(entry["data"])))
+                    size += _size(child)
+                else:
+                    size += self._dict(child, path + (key,)) if direct else self._walk(child, path + (key,))
+            elif isinstance(child, list):
+                size += self._list(child, path + (key,), 0) if direct else self._walk(child, path + (key,))
+            else:
+                child_size = _scalar_size(child)
+                if child_size > _LONG_STRING and isinstance(child, str) and len(child) > _LONG_STRING:
+                    self.strings.append((path + (key,), child, child_size))
+                size += child_size
+        return size
+
+    def _list(self, value: list, path: Path, offset: int) -> int:
+        sizes = []
+        direct = len(path) + 1 not in self._depths
+        for i, item in enumerate(value):
+            if isinstance(item, dict):
+                item_path = path + (offset + i,)
+                item_size = self._dict(item, item_path) if direct else self._walk(item, item_path)
+            elif isinstance(item, list):
+                item_path = path + (offset + i,)
+                item_size = self._list(item, item_path, 0) if direct else self._walk(item, item_path)
+            else:
+                item_size = _scalar_size(item)
+                if item_size > _LONG_STRING and isinstance(item, str) and len(item) > _LONG_STRING:
+                    self.strings.append((path + (offset + i,), item, item_size))
+            sizes.append(item_size)
+        if len(value) > 3:
+            self.arrays[path] = (offset, sizes)
+        return _list_size(sizes)
+
+    def shrink(self, path: Path, delta: int) -> None:
+        """Account for the value at ``path`` changing size by ``delta`` bytes."""
+        self.size += delta
+        for end in range(1, len(path) + 1):
+            key = path[end - 1]
+            if isinstance(key, int):
+                array = self.arrays.get(path[:end - 1])
+                if array is not None:
+                    array[1][key - array[0]] += delta
+            elif path[:end] in self.sizes:
+                self.sizes[path[:end]] += delta
+
+
+def trim(
+    doc: Any,
+    max_bytes: int,
+    kind: str,
+    doc_id: str,
+    base_path: Path = (),
+    offset: int = 0,
+    size: Optional[int] = None,
+) -> Any:
+    """Return ``doc`` trimmed to about ``max_bytes`` of JSON.
+
+    ``size`` is the document's JSON size if already known (e.g. bytes read
+    from the response stream). ``base_path``/``offset`` place ``doc`` inside
+    the original document (for continuations), so handles always name
+    original paths. A dict result gets a ``_budget`` entry describing what
+    was trimmed.
+    """
+    if size is not None and size <= max_bytes:
+        return doc
+
+    exempt = set()
+    run_data = None
+    if not base_path:
+        exempt = {("data", "resultData", "runData", name) for name in _failed_nodes(doc)}
+        run_data = ((doc.get("data") or {}).get("resultData") or {}).get("runData") if isinstance(doc, dict) else None
+    if not isinstance(run_data, dict):
+        run_data = {}
+    entries = {("data", "resultData", "runData", name) for name in run_data}
+    index = _Index(doc, base_path, offset, exempt, entries)
+    original = size if size is not None else index.size
+    if original <= max_bytes:
+        return doc
+    plan = _Plan()
+    shortened: dict[Path, tuple[int, int, int]] = {}
+
+    def rel(path: Path) -> Path:
+        path = path[len(base_path):]
+        if path and isinstance(path[0], int):
+            path = (path[0] - offset,) + path[1:]
+        return path
+
+    def drop_binaries() -> None:
+        for path, entry, data_size in index.binaries:
+            meta = {k: v for k, v in entry.items() if k != "data"}
+            meta["data"] = {
+                "omitted": "binary",
+                "bytes": len(entry["data"]),
+                "handle": make_handle(kind, doc_id, path + ("data",)),
+            }
+            plan.set(rel(path), ("replace", meta))
+            index.shrink(path + ("data",), _size(meta["data"]) - data_size)
+
+    def shorten_arrays(head: int, tail: int) -> None:
+        for path, (_, item) in index.arrays.items():
+            length = len(item)
+            if length <= head + tail + 1 or not plan.visible(rel(path)):
+                continue
+            previous = shortened.get(path)
+            if previous is None:
+                before = _list_size(item)
+            else:
+                kept_head, kept_tail, kept_marker = previous
+                before = _list_size(item[:kept_head] + [kept_marker] + item[length - kept_tail:])
+            marker = {
+                "omitted": length - head - tail,
+                "handle": make_handle(kind, doc_id, path, head, length - tail),
+            }
+            marker_size = _size(marker)
+            plan.set(rel(path), ("shorten", head, tail, marker, length))
+            shortened[path] = (head, tail, marker_size)
+            index.shrink(path, _list_size(item[:head] + [marker_size] + item[length - tail:]) - before)
+
+    def cut_strings() -> None:
+        for path, text, text_size in index.strings:
+            if not plan.visible(rel(path)):
+                continue
+            marker = {
+                "text": text[:_STRING_KEEP],
+                "omitted_chars": len(text) - _STRING_KEEP,
+                "handle": make_handle(kind, doc_id, path, _STRING_KEEP, len(text)),
+            }
+            plan.set(rel(path), ("replace", marker))
+            index.shrink(path, _size(marker) - text_size)
+
+    def drop_nodes() -> None:
+        for name, runs in run_data.items():
+            path = ("data", "resultData", "runData", name)
+            if path not in exempt:
+                count = len(runs) if isinstance(runs, list) else 1
+                marker = {"omitted": "runs", "runs": count, "handle": make_handle(kind, doc_id, path)}
+                plan.set(path, ("replace", marker))
+                index.shrink(path, _size(marker) - index.sizes[path])
+
+    steps = [("binary", drop_binaries)]
+    steps += [(f"arrays:{head}+{tail}", lambda h=head, t=tail: shorten_arrays(h, t)) for head, tail in _ARRAY_KEEP]
+    steps += [("strings", cut_strings), ("runData", drop_nodes)]
+
+    applied = []
+    for name, step in steps:
+        if index.size <= max_bytes:
+            break
+        step()
+        applied.append(name)
+    result = plan.apply(doc)
+    if isinstance(result, dict):
+        result = dict(result, _budget={
+            "max_bytes": max_bytes,
+            "original_bytes": original,
+            "bytes": index.size,
+            "steps": applied,
+            "fits": index.size <= max_bytes,
+        })
+    return result
+
+
+class SourceCache:
+    """LRU of documents that trimmed results were cut from, bounded by their JSON size."""
+
+    def __init__(self, max_bytes: int = 64_000_000) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, doc_id: str) -> Any:
+        """The cached document, or None."""
+        with self._lock:
+            entry = self._entries.get((kind, str(doc_id)))
+            if entry is None:
+                return None
+            self._entries.move_to_end((kind, str(doc_id)))
+            return entry[0]
+
+    def put(self, kind: str, doc_id: str, doc: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        key = (kind, str(doc_id))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (doc, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+
+
+def resolve(doc: Any, handle: str, max_bytes: Optional[int] = None) -> dict:
+    """The part of ``doc`` a handle names, trimmed to ``max_bytes`` if given."""
+    kind, doc_id, path, start, end = parse_handle(handle)
+    value = doc
+    for key in path:
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Handle path {list(path)} no longer exists in {kind} {doc_id}") from e
+    offset = start or 0
+    if isinstance(value, (list, str)):
+        end = len(value) if end is None else min(end, len(value))
+        value = value[offset:end]
+    part = {"path": list(path), "start": start, "end": end, "value": value}
+    if max_bytes is None:
+        return part
+    if isinstance(value, str):
+        if len(value) > max_bytes:
+            part["value"] = value[:max_bytes]
+            part["end"] = offset + max_bytes
+            part["next"] = make_handle(kind, doc_id, path, offset + max_bytes, end)
+        return part
+    part["value"] = trim(value, max_bytes, kind, doc_id, base_path=path, offset=offset)
+    return part
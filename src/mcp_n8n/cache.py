@@ -0,0 +1,193 @@
+"""Opt-in TTL response cache with stale-while-revalidate.
+
+Only GET endpoints matching a ``CacheRule`` are cached (by default single
+workflows and credential schemas). An entry is *fresh* for ``ttl`` seconds,
+then *stale* for another ``stale_ttl`` seconds, during which it is still
+served while the client refreshes it in the background. Writes made through
+the client invalidate the affected resource, and workflow listings renew or
+evict cached workflows by comparing their ``updatedAt``.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+# Listing endpoint -> detail endpoint template whose entries it can revalidate.
+LISTINGS = {"/workflows": "/workflows/{id}"}
+
+_RESOURCE = re.compile(r"^(/[^/]+/[^/]+)")
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """TTL policy for endpoints matching ``pattern``."""
+
+    pattern: str
+    ttl: float
+    stale_ttl: float = 0.0
+
+    def matches(self, endpoint: str) -> bool:
+        return re.fullmatch(self.pattern, endpoint) is not None
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+    rule: CacheRule
+    refreshing: bool = False
+
+
+def _key(endpoint: str, params: Optional[dict]) -> tuple:
+    return (endpoint, tuple(sorted(params.items())) if params else ())
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of decoded GET responses."""
+
+    def __init__(
+        self,
+        rules: list[CacheRule],
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rules = rules
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> ResponseCache:
+        return cls(
+            rules=[
+                CacheRule(r"/workflows/[^/]+", settings.cache_workflow_ttl, settings.cache_stale_ttl),
+                CacheRule(r"/credentials/schema/[^/]+", settings.cache_schema_ttl, settings.cache_stale_ttl),
+            ],
+            max_entries=settings.cache_max_entries,
+        )
+
+    def _rule_for(self, endpoint: str) -> Optional[CacheRule]:
+        for rule in self.rules:
+            if rule.matches(endpoint):
+                return rule
+        return None
+
+    def lookup(self, endpoint: str, params: Optional[dict] = None) -> tuple[str, Any]:
+        """Return ``(state, value)``; ``value`` is a private copy on a hit.
+
+        On ``STALE`` the caller should serve the value and start a refresh if
+        ``claim_refresh`` succeeds.
+        """
+        if self._rule_for(endpoint) is None:
+            return MISS, None
+        key = _key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS, None
+            age = self._clock() - entry.stored_at
+            if age > entry.rule.ttl + entry.rule.stale_ttl:
+                del self._entries[key]
+                self.misses += 1
+                return MISS, None
+            self._entries.move_to_end(key)
+            value = entry.value
+            if age <= entry.rule.ttl:
+                self.hits += 1
+                state = FRESH
+            else:
+                self.stale_hits += 1
+                state = STALE
+        return state, copy.deepcopy(value)
+
+    def claim_refresh(self, endpoint: str, params: Optional[dict] = None) -> bool:
+        """Mark a stale entry as being refreshed; False if someone already is."""
+        with self._lock:
+            entry = self._entries.get(_key(endpoint, params))
+            if entry is None or entry.refreshing:
+                return False
+            entry.refreshing = True
+            return True
+
+    def finish_refresh(self, endpoint: str, params: Optional[dict] = None) -> None:
+        with self._lock:
+            entry = self._entries.get(_key(endpoint, params))
+            if entry is not None:
+                entry.refreshing = False
+
+    def store(self, endpoint: str, params: Optional[dict], value: Any) -> None:
+        rule = self._rule_for(endpoint)
+        if rule is None:
+            return
+        key = _key(endpoint, params)
+        with self._lock:
+            self._entries[key] = _Entry(copy.deepcopy(value), self._clock(), rule)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop cached entries for the resource a write to ``endpoint`` touched."""
+        match = _RESOURCE.match(endpoint)
+        if match is None:
+            return
+        resource = match.group(1)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == resource or k[0].startswith(resource + "/")]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def reconcile(self, endpoint: str, result: Any) -> None:
+        """Renew or evict cached details using ``updatedAt`` from a listing."""
+        template = LISTINGS.get(endpoint)
+        if template is None or not isinstance(result, dict):
+            return
+        items = result.get("data")
+        if not isinstance(items, list):
+            return
+        now = self._clock()
+        with self._lock:
+            for item in items:
+                if not isinstance(item, dict) or "id" not in item:
+                    continue
+                key = _key(template.format(id=item["id"]), None)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                cached = entry.value.get("updatedAt") if isinstance(entry.value, dict) else None
+                if cached is not None and cached == item.get("updatedAt"):
+                    entry.stored_at = now
+                else:
+                    del self._entries[key]
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": size,
+        }
@@ -1,33 +1,93 @@
-"""n8n API client with sync requests."""
+"""n8n API clients: sync (pooled requests session) and asyncio (httpx), sharing one request pipeline."""
 
 from __future__ import annotations
 
-import requests
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Sequence
 
+from mcp_n8n import codec
+from mcp_n8n.cache import FRESH, STALE, ResponseCache
+from mcp_n8n.coalesce import SingleFlight, flight_key
 from mcp_n8n.config import get_settings
+from mcp_n8n.hooks import CallInfo, Hook, default_hooks, run_after, run_before, run_error
+from mcp_n8n.limiter import limiter_for
+from mcp_n8n.metrics import MetricsHook, metrics_for, route_of
+from mcp_n8n.operations._base import Call, OperationGen, Sleep, run_async, run_sync
+from mcp_n8n.resilience import (
+    RETRY_STATUSES,
+    RetryPolicy,
+    breaker_for,
+    is_host_failure,
+    is_overload,
+    parse_retry_after,
+)
+from mcp_n8n.streaming import AsyncByteReader
 
+if TYPE_CHECKING:
+    import httpx
+    import requests
 
-class N8nClient:
-    """Manages requests sessions for n8n API.
+
+class _BaseN8nClient:
+    """Connection settings shared by the sync and async clients.
 
     Configuration is loaded from environment variables (N8N_* prefix)
     or a .env file via Pydantic Settings. Explicit constructor params
     override settings values.
+
+    Pass a ``ResponseCache`` (or set ``N8N_CACHE_ENABLED``) to cache
+    workflow and credential-schema reads. Transient failures are retried per
+    ``retry_policy`` and guarded by the host's circuit breaker (see
+    ``mcp_n8n.resilience``); in-flight requests are capped by the host's
+    adaptive limiter (``client.limiter``, see ``mcp_n8n.limiter``). Identical
+    GETs already in flight are shared rather than resent (``client.coalescer``,
+    see ``mcp_n8n.coalesce``; disable with ``N8N_COALESCE_REQUESTS=false``).
+    Every attempt runs through ``client.hooks`` (see ``mcp_n8n.hooks``):
+    per-route metrics (``client.metrics``, see ``mcp_n8n.metrics``), an
+    OpenTelemetry span when OTel is installed, then any ``hooks`` passed in.
     """
 
     def __init__(
         self,
         base_url: str | None = None,
         api_key: str | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hooks: Sequence[Hook] = (),
     ) -> None:
         settings = get_settings()
         self.base_url = (base_url or settings.resolved_base_url).strip().rstrip("/")
         self.api_key = (api_key or settings.api_key).strip()
+        self.timeout = settings.timeout
+        self.pool_idle_timeout = settings.pool_idle_timeout
+        self._settings = settings
+        self._api_headers = self._headers()
+        if cache is None and settings.cache_enabled:
+            cache = ResponseCache.from_settings(settings)
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(settings)
+        self._breaker = breaker_for(self.base_url, settings)
+        self.limiter = limiter_for(self.base_url, settings)
+        self.coalescer = SingleFlight() if settings.coalesce_requests else None
+        self.metrics = metrics_for(self.base_url) if settings.metrics_enabled else None
+        self.hooks: list[Hook] = [
+            *([MetricsHook(self.metrics)] if self.metrics is not None else []),
+            *default_hooks(settings),
+            *hooks,
+        ]
 
     @property
     def api_url(self) -> str:
         return f"{self.base_url}/api/v1"
 
+    def webhook_url(self, path: str) -> str:
+        """Full URL of a production webhook path."""
+        return f"{self.base_url}/webhook/{path.lstrip('/')}"
+
     def _headers(self) -> dict[str, str]:
         return {
             "X-N8N-API-KEY": self.api_key,
@@ -35,73 +95,441 @@ class N8nClient:
             "Content-Type": "application/json",
         }
 
-    def get(self, endpoint: str, params: dict | None = None) -> dict | list:
-        """Synchronous GET request."""
-        response = requests.get(
+    def stats(self) -> dict:
+        """Route metrics plus limiter, circuit breaker, cache and coalescing state."""
+        return {
+            "routes": self.metrics.snapshot() if self.metrics is not None else [],
+            "limiter": self.limiter.stats(),
+            "breaker": self._breaker.stats(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "coalescing": self.coalescer.stats() if self.coalescer is not None else None,
+        }
+
+    def _cache_store(self, endpoint: str, params: dict | None, result: Any) -> None:
+        self.cache.store(endpoint, params, result)
+        self.cache.reconcile(endpoint, result)
+
+    def _call_info(self, method: str, url: str, attempt: int, stream: bool) -> CallInfo:
+        route = route_of(url[len(self.api_url):]) if url.startswith(self.api_url) else "/webhook/{path}"
+        return CallInfo("request", f"{method} {route}", method, url, route, attempt, stream)
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        opt_in: bool,
+        status_code: int | None,
+        retry_after: str | None = None,
+    ) -> float | None:
+        """Record an attempt's outcome; return seconds to wait before retrying, or None.
+
+        ``status_code`` is None when the request failed without a response.
+        """
+        if is_host_failure(status_code):
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        if status_code is not None and status_code not in RETRY_STATUSES:
+            return None
+        if not self.retry_policy.should_retry(method, attempt, opt_in):
+            return None
+        return self.retry_policy.delay(attempt, parse_retry_after(retry_after))
+
+    # The request pipeline is written once, as generators that yield ``Call``
+    # and ``Sleep`` like operations do (see ``mcp_n8n.operations._base``).
+    # ``N8nClient`` drives it with ``run_sync`` and ``AsyncN8nClient`` with
+    # ``run_async``; each supplies the primitives the calls name: ``_transmit``
+    # (the raw send), ``_take_slot``, ``_discard``, ``_shared`` and ``_refresh_later``.
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json: dict | None = None,
+        retry: bool = False,
+    ) -> OperationGen:
+        if self.cache is None:
+            return (yield from self._send(method, endpoint, params, json, retry))
+        if method == "GET":
+            state, value = self.cache.lookup(endpoint, params)
+            if state == FRESH:
+                return value
+            if state == STALE:
+                if self.cache.claim_refresh(endpoint, params):
+                    yield Call("_refresh_later", endpoint, params)
+                return value
+        try:
+            result = yield from self._send(method, endpoint, params, json, retry)
+        finally:
+            if method != "GET":
+                self.cache.invalidate(endpoint)
+        if method == "GET":
+            self._cache_store(endpoint, params, result)
+        return result
+
+    def _revalidate(self, endpoint: str, params: dict | None) -> OperationGen:
+        try:
+            self._cache_store(endpoint, params, (yield from self._send("GET", endpoint, params)))
+        except Exception:
+            pass
+        finally:
+            self.cache.finish_refresh(endpoint, params)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json: dict | None = None,
+        retry: bool = False,
+    ) -> OperationGen:
+        if method == "GET" and self.coalescer is not None:
+            return (yield Call(
+                "_shared",
+                flight_key(method, endpoint, params),
+                lambda: self._fetch(method, endpoint, params, json, retry),
+            ))
+        return (yield from self._fetch(method, endpoint, params, json, retry))
+
+    def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json: dict | None = None,
+        retry: bool = False,
+    ) -> OperationGen:
+        response = yield from self._execute(
+            method,
             f"{self.api_url}{endpoint}",
-            headers=self._headers(),
+            retry=retry,
+            headers=self._api_headers,
             params=params,
-            timeout=30,
+            json=json,
         )
         response.raise_for_status()
-        return response.json() if response.text else {"status": "success"}
+        return codec.loads(response.content) if response.content else {"status": "success"}
 
-    def post(self, endpoint: str, json: dict | None = None) -> dict:
-        """Synchronous POST request."""
-        response = requests.post(
-            f"{self.api_url}{endpoint}",
-            headers=self._headers(),
-            json=json,
-            timeout=30,
-        )
+    def _execute(
+        self, method: str, url: str, retry: bool = False, stream: bool = False, guarded: bool = True,
+        **kwargs: Any,
+    ) -> OperationGen:
+        """Send one HTTP request through the circuit breaker, retrying transient failures.
+
+        With ``guarded=False`` the request is sent once, outside the breaker and limiter.
+        """
+        attempt = 0
+        while True:
+            trial = self._breaker.before_call() if guarded else False
+            if guarded:
+                try:
+                    yield Call("_take_slot")
+                except BaseException:
+                    if trial:
+                        self._breaker.release_trial()
+                    raise
+            call = self._call_info(method, url, attempt, stream)
+            try:
+                run_before(self.hooks, call)
+                response = yield Call("_transmit", method, url, stream, kwargs)
+            except self._transport_errors as e:
+                if not guarded:
+                    run_error(self.hooks, call, e)
+                    raise
+                self.limiter.release(time.monotonic() - call.started, overloaded=True)
+                run_error(self.hooks, call, e)
+                delay = self._retry_delay(method, attempt, retry, None)
+                if delay is None:
+                    raise
+            except BaseException as e:
+                if guarded:
+                    self.limiter.release()
+                if trial:
+                    self._breaker.release_trial()
+                run_error(self.hooks, call, e)
+                raise
+            else:
+                if not guarded:
+                    run_after(self.hooks, call, response, response.status_code)
+                    return response
+                self.limiter.release(time.monotonic() - call.started, is_overload(response.status_code))
+                run_after(self.hooks, call, response, response.status_code)
+                delay = self._retry_delay(
+                    method, attempt, retry, response.status_code, response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                yield Call("_discard", response)
+            yield Sleep(delay)
+            attempt += 1
+
+    def _webhook(
+        self, path: str, method: str, json: dict | None, params: dict | None, resilient: bool,
+    ) -> OperationGen:
+        url = self.webhook_url(path)
+        kwargs: dict = {}
+        if json:
+            kwargs["json"] = json
+        if params:
+            kwargs["params"] = params
+
+        response = yield from self._execute(method.upper(), url, retry=resilient, guarded=resilient, **kwargs)
         response.raise_for_status()
-        return response.json() if response.text else {"status": "success"}
+        try:
+            return codec.loads(response.content)
+        except ValueError:
+            return {"response": response.text}
+
+
+class N8nClient(_BaseN8nClient):
+    """Manages requests sessions for n8n API.
+
+    A single ``requests.Session`` with a sized connection pool is shared by
+    all calls, so TCP/TLS connections are kept alive between requests. The
+    session is safe to share across threads; pools that sit idle for longer
+    than ``pool_idle_timeout`` are dropped and reopened on the next call.
+    ``requests`` is imported on construction, so async-only users never load it.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hooks: Sequence[Hook] = (),
+    ) -> None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        super().__init__(base_url, api_key, cache, retry_policy, hooks)
+        self._transport_errors = (requests.ConnectionError, requests.Timeout)
+        settings = self._settings
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.pool_connections,
+            pool_maxsize=settings.pool_maxsize,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self._refresher: ThreadPoolExecutor | None = None
+
+    def _get_session(self) -> requests.Session:
+        """Return the shared session, dropping pools that went idle."""
+        now = time.monotonic()
+        with self._lock:
+            if self.pool_idle_timeout and now - self._last_used > self.pool_idle_timeout:
+                for adapter in self._session.adapters.values():
+                    adapter.close()
+            self._last_used = now
+        return self._session
+
+    def _get_refresher(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="n8n-cache-refresh")
+            return self._refresher
+
+    def _transmit(self, method: str, url: str, stream: bool, kwargs: dict) -> requests.Response:
+        return self._get_session().request(method, url, timeout=self.timeout, stream=stream, **kwargs)
+
+    def _take_slot(self) -> None:
+        self.limiter.acquire()
+
+    def _discard(self, response: requests.Response) -> None:
+        response.close()
+
+    def _shared(self, key: tuple, steps: Callable[[], OperationGen]) -> Any:
+        return self.coalescer.do(key, lambda: run_sync(self, steps()))
+
+    def _refresh_later(self, endpoint: str, params: dict | None) -> None:
+        self._get_refresher().submit(run_sync, self, self._revalidate(endpoint, params))
+
+    def get(self, endpoint: str, params: dict | None = None) -> dict | list:
+        """Synchronous GET request."""
+        return run_sync(self, self._request("GET", endpoint, params=params))
+
+    def post(self, endpoint: str, json: dict | None = None, retry: bool = False) -> dict:
+        """Synchronous POST request; ``retry=True`` allows retrying transient failures."""
+        return run_sync(self, self._request("POST", endpoint, json=json, retry=retry))
 
     def put(self, endpoint: str, json: dict | None = None) -> dict:
         """Synchronous PUT request."""
-        response = requests.put(
-            f"{self.api_url}{endpoint}",
-            headers=self._headers(),
-            json=json,
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json() if response.text else {"status": "success"}
+        return run_sync(self, self._request("PUT", endpoint, json=json))
 
     def patch(self, endpoint: str, json: dict | None = None) -> dict:
         """Synchronous PATCH request."""
-        response = requests.patch(
-            f"{self.api_url}{endpoint}",
-            headers=self._headers(),
-            json=json,
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json() if response.text else {"status": "success"}
+        return run_sync(self, self._request("PATCH", endpoint, json=json))
 
     def delete(self, endpoint: str) -> dict:
         """Synchronous DELETE request."""
-        response = requests.delete(
+        return run_sync(self, self._request("DELETE", endpoint))
+
+    @contextmanager
+    def get_stream(self, endpoint: str, params: dict | None = None) -> Iterator[IO[bytes]]:
+        """GET request whose body is read incrementally from the socket."""
+        response = run_sync(self, self._execute(
+            "GET",
             f"{self.api_url}{endpoint}",
-            headers=self._headers(),
-            timeout=30,
+            stream=True,
+            headers=self._api_headers,
+            params=params,
+        ))
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield response.raw
+        finally:
+            response.close()
+
+    def webhook(
+        self,
+        path: str,
+        method: str = "POST",
+        json: dict | None = None,
+        params: dict | None = None,
+        resilient: bool = False,
+    ) -> dict:
+        """Send a request to a webhook endpoint (not through /api/v1).
+
+        Every webhook request may start a workflow run, so it is sent once and
+        its outcome (a failing workflow answers 500) is kept out of the API's
+        circuit breaker and limiter. ``resilient=True`` opts into both, and
+        into retries of transient failures.
+        """
+        return run_sync(self, self._webhook(path, method, json, params, resilient))
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=False)
+        self._session.close()
+
+    def __enter__(self) -> N8nClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncN8nClient(_BaseN8nClient):
+    """asyncio client for n8n API, backed by a pooled ``httpx.AsyncClient``.
+
+    Mirrors the ``N8nClient`` surface with coroutine methods, so many calls
+    can run concurrently on one event loop. Requires the ``async`` extra.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hooks: Sequence[Hook] = (),
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncN8nClient requires httpx: pip install 'mcp-n8n[async]'"
+            ) from e
+
+        super().__init__(base_url, api_key, cache, retry_policy, hooks)
+        self._transport_errors = (httpx.TransportError,)
+        settings = self._settings
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._http = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=settings.pool_connections * settings.pool_maxsize,
+                max_keepalive_connections=settings.pool_maxsize,
+                keepalive_expiry=self.pool_idle_timeout,
+            ),
+            transport=transport,
         )
-        response.raise_for_status()
-        return response.json() if response.text else {"status": "success"}
 
-    def webhook(self, path: str, method: str = "POST", json: dict | None = None, params: dict | None = None) -> dict:
-        """Send a request to a webhook endpoint (not through /api/v1)."""
-        url = f"{self.base_url}/webhook/{path}"
-        func = getattr(requests, method.lower())
-        kwargs: dict = {"timeout": 30}
-        if json:
-            kwargs["json"] = json
-        if params:
-            kwargs["params"] = params
+    async def _transmit(self, method: str, url: str, stream: bool, kwargs: dict) -> httpx.Response:
+        return await self._http.send(self._http.build_request(method, url, **kwargs), stream=stream)
 
-        response = func(url, **kwargs)
-        response.raise_for_status()
+    async def _take_slot(self) -> None:
+        await self.limiter.acquire_async()
+
+    async def _discard(self, response: httpx.Response) -> None:
+        await response.aclose()
+
+    async def _shared(self, key: tuple, steps: Callable[[], OperationGen]) -> Any:
+        return await self.coalescer.ado(key, lambda: run_async(self, steps()))
+
+    async def _refresh_later(self, endpoint: str, params: dict | None) -> None:
+        task = asyncio.ensure_future(run_async(self, self._revalidate(endpoint, params)))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def get(self, endpoint: str, params: dict | None = None) -> dict | list:
+        """Asynchronous GET request."""
+        return await run_async(self, self._request("GET", endpoint, params=params))
+
+    async def post(self, endpoint: str, json: dict | None = None, retry: bool = False) -> dict:
+        """Asynchronous POST request; ``retry=True`` allows retrying transient failures."""
+        return await run_async(self, self._request("POST", endpoint, json=json, retry=retry))
+
+    async def put(self, endpoint: str, json: dict | None = None) -> dict:
+        """Asynchronous PUT request."""
+        return await run_async(self, self._request("PUT", endpoint, json=json))
+
+    async def patch(self, endpoint: str, json: dict | None = None) -> dict:
+        """Asynchronous PATCH request."""
+        return await run_async(self, self._request("PATCH", endpoint, json=json))
+
+    async def delete(self, endpoint: str) -> dict:
+        """Asynchronous DELETE request."""
+        return await run_async(self, self._request("DELETE", endpoint))
+
+    @asynccontextmanager
+    async def get_stream(self, endpoint: str, params: dict | None = None) -> AsyncIterator[AsyncByteReader]:
+        """GET request whose body is read incrementally from the socket."""
+        response = await run_async(self, self._execute(
+            "GET",
+            f"{self.api_url}{endpoint}",
+            stream=True,
+            headers=self._api_headers,
+            params=params,
+        ))
         try:
-            return response.json()
-        except ValueError:
-            return {"response": response.text}
+            response.raise_for_status()
+            yield AsyncByteReader(response.aiter_bytes())
+        finally:
+            await response.aclose()
+
+    async def webhook(
+        self,
+        path: str,
+        method: str = "POST",
+        json: dict | None = None,
+        params: dict | None = None,
+        resilient: bool = False,
+    ) -> dict:
+        """Send a request to a webhook endpoint (not through /api/v1).
+
+        Every webhook request may start a workflow run, so it is sent once and
+        its outcome (a failing workflow answers 500) is kept out of the API's
+        circuit breaker and limiter. ``resilient=True`` opts into both, and
+        into retries of transient failures.
+        """
+        return await run_async(self, self._webhook(path, method, json, params, resilient))
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncN8nClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,107 @@
+"""Single-flight coalescing of identical in-flight GET requests.
+
+When a GET for the same endpoint and params is already on the wire, later
+callers wait for it instead of sending their own request. Everyone gets the
+one parsed result; when it was shared, each caller receives a private copy so
+no caller can see another's mutations. Threads wait on an event, asyncio
+tasks on a shared task (so cancelling the first caller does not cancel the
+request for the others).
+
+``coalescer.stats()`` counts requests sent and requests saved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+from . import codec
+
+
+def flight_key(method: str, endpoint: str, params: Optional[dict]) -> tuple:
+    return (method, endpoint, tuple(sorted(params.items())) if params else ())
+
+
+def _copy(value: Any) -> Any:
+    # Results are parsed JSON; a codec round trip copies them faster than deepcopy.
+    return codec.loads(codec.dumpb(value))
+
+
+class _Flight:
+    __slots__ = ("event", "task", "result", "error", "followers")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Shares one call among concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._flights: dict[tuple, _Flight] = {}
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.coalesced = 0
+
+    def do(self, key: tuple, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, or a copy of the result of the identical call in flight."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None or flight.task is not None:
+                flight = self._flights[key] = _Flight()
+                self.sent += 1
+                leader = True
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy(flight.result)
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.event.set()
+        return _copy(flight.result) if flight.followers else flight.result
+
+    async def ado(self, key: tuple, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async twin of ``do``; calls coalesce within one event loop."""
+        loop = asyncio.get_running_loop()
+        key = (loop, key)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                flight.task = loop.create_task(fn())
+                flight.task.add_done_callback(lambda task: self._landed(key, flight, task))
+                self.sent += 1
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+        result = await asyncio.shield(flight.task)
+        return _copy(result) if flight.followers else result
+
+    def _landed(self, key: tuple, flight: _Flight, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        if not task.cancelled():
+            task.exception()  # retrieved by the awaiting callers; avoids "never retrieved" noise
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = len(self._flights)
+        return {"sent": self.sent, "coalesced": self.coalesced, "in_flight": in_flight}
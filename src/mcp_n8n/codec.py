@@ -0,0 +1,125 @@
+"""JSON codec: orjson or msgspec when installed, stdlib ``json`` otherwise.
+
+The clients decode response bodies straight from bytes with ``loads`` (no
+charset detection or intermediate ``str``), and tool wrappers encode with
+``dumps``/``dumpb``. Output matches ``json.dumps(..., ensure_ascii=False)``:
+compact separators by default, or indented with ``indent``; dict keys that
+are not strings are converted like the stdlib does.
+
+Usage:
+    from mcp_n8n import codec
+
+    codec.loads(response.content)
+    codec.dumps(result, indent=2)
+    codec.use("json")  # force a backend
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+BACKEND = "json"
+_loads: Callable[[Union[bytes, str]], Any] = json.loads
+_dumpb: Callable[[Any, Optional[int]], bytes]
+_dumps: Callable[[Any, Optional[int]], str]
+
+
+def _json_dumps(value: Any, indent: Optional[int] = None) -> str:
+    if indent is None:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(value, indent=indent, ensure_ascii=False)
+
+
+def _json_dumpb(value: Any, indent: Optional[int] = None) -> bytes:
+    return _json_dumps(value, indent).encode()
+
+
+def _decoded(dumpb: Callable[[Any, Optional[int]], bytes]) -> Callable[[Any, Optional[int]], str]:
+    return lambda value, indent=None: dumpb(value, indent).decode()
+
+
+def _orjson() -> tuple[Callable, Callable, Callable]:
+    import orjson
+
+    compact = orjson.OPT_NON_STR_KEYS
+    indented = compact | orjson.OPT_INDENT_2
+
+    def dumpb(value: Any, indent: Optional[int] = None) -> bytes:
+        if indent is None:
+            return orjson.dumps(value, option=compact)
+        if indent == 2:
+            return orjson.dumps(value, option=indented)
+        return _json_dumpb(value, indent)
+
+    return orjson.loads, dumpb, _decoded(dumpb)
+
+
+def _msgspec() -> tuple[Callable, Callable, Callable]:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumpb(value: Any, indent: Optional[int] = None) -> bytes:
+        try:
+            data = encoder.encode(value)
+        except TypeError:
+            # Non-string dict keys and the like: let the stdlib convert them.
+            return _json_dumpb(value, indent)
+        return data if indent is None else msgspec.json.format(data, indent=indent)
+
+    return loads, dumpb, _decoded(dumpb)
+
+
+def _stdlib() -> tuple[Callable, Callable, Callable]:
+    return json.loads, _json_dumpb, _json_dumps
+
+
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+def use(backend: str = "auto") -> str:
+    """Switch to ``backend`` (or the fastest installed one for ``auto``); return its name."""
+    global BACKEND, _loads, _dumpb, _dumps
+    candidates = BACKENDS if backend == "auto" else (backend,)
+    for name in candidates:
+        if name not in _FACTORIES:
+            raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(BACKENDS)}")
+        try:
+            _loads, _dumpb, _dumps = _FACTORIES[name]()
+        except ImportError:
+            if backend != "auto":
+                raise
+            continue
+        BACKEND = name
+        return name
+    raise AssertionError("stdlib json is always available")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return _loads(data)
+
+
+def dumpb(value: Any, indent: Optional[int] = None) -> bytes:
+    """Encode ``value`` as UTF-8 JSON bytes."""
+    return _dumpb(value, indent)
+
+
+def dumps(value: Any, indent: Optional[int] = None) -> str:
+    """Encode ``value`` as JSON text."""
+    return _dumps(value, indent)
+
+
+use()
@@ -1,5 +1,7 @@
 """Pydantic Settings configuration for n8n MCP server."""
 
+import os
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -20,6 +22,98 @@ class Settings(BaseSettings):
         description="Full n8n base URL (overrides protocol + host)",
     )
     api_key: str = Field(default="", description="n8n API key")
+    timeout: float = Field(default=30.0, description="Per-request timeout in seconds")
+    pool_connections: int = Field(
+        default=10,
+        description="Number of per-host connection pools to keep",
+    )
+    pool_maxsize: int = Field(
+        default=20,
+        description="Maximum keep-alive connections per host",
+    )
+    pool_idle_timeout: float = Field(
+        default=60.0,
+        description="Seconds a pool may sit idle before its connections are dropped",
+    )
+    retry_max_retries: int = Field(
+        default=3,
+        description="Retries after a transient failure (connection error, 429/502/503/504); 0 disables",
+    )
+    retry_backoff_base: float = Field(default=0.5, description="Base delay in seconds for exponential backoff")
+    retry_backoff_max: float = Field(
+        default=30.0,
+        description="Longest backoff or Retry-After wait in seconds before giving up",
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive host failures that open the circuit breaker; 0 disables",
+    )
+    circuit_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds the circuit stays open before a trial request is allowed",
+    )
+    concurrency_floor: int = Field(default=2, description="Lowest in-flight request limit per n8n host")
+    concurrency_ceiling: int = Field(default=32, description="Highest in-flight request limit per n8n host")
+    concurrency_initial: int = Field(default=8, description="Starting in-flight request limit per n8n host")
+    concurrency_latency_tolerance: float = Field(
+        default=2.0,
+        description="Latency over this multiple of the baseline shrinks the concurrency limit",
+    )
+    coalesce_requests: bool = Field(
+        default=True,
+        description="Share one HTTP call among identical GET requests already in flight",
+    )
+    metrics_enabled: bool = Field(default=True, description="Record per-route request metrics")
+    metrics_port: Optional[int] = Field(
+        default=None,
+        description="Port for the MCP server's Prometheus /metrics endpoint (disabled when unset)",
+    )
+    otel_enabled: bool = Field(
+        default=True,
+        description="Create OpenTelemetry spans for requests and tool calls when opentelemetry-api is installed",
+    )
+    profile_tools: Optional[str] = Field(
+        default=None,
+        description="Comma-separated MCP tool names ('*' for all) to profile with cProfile and tracemalloc",
+    )
+    profile_dir: str = Field(default="profiles", description="Directory profiles are written to")
+    profile_sample_rate: float = Field(default=1.0, description="Fraction of selected tool calls that are profiled")
+    cache_enabled: bool = Field(default=False, description="Cache workflow and credential-schema reads")
+    cache_max_entries: int = Field(default=1024, description="Maximum cached responses (LRU)")
+    cache_workflow_ttl: float = Field(default=60.0, description="Seconds a cached workflow stays fresh")
+    cache_schema_ttl: float = Field(default=3600.0, description="Seconds a cached credential schema stays fresh")
+    cache_stale_ttl: float = Field(
+        default=300.0,
+        description="Seconds past TTL a stale entry is served while it is refreshed",
+    )
+    mirror_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for the local workflow mirror (disabled when unset)",
+    )
+    mirror_max_age: float = Field(
+        default=300.0,
+        description="Seconds the MCP server may serve workflow reads from the mirror after a sync",
+    )
+    max_list_items: int = Field(
+        default=1000,
+        description="Hard cap on items returned by MCP list tools in all-pages mode",
+    )
+    max_concurrent_tools: int = Field(
+        default=16,
+        description="Maximum MCP tool calls talking to n8n at the same time",
+    )
+    json_indent: Optional[int] = Field(
+        default=None,
+        description="Indent for MCP tool JSON output (compact when unset)",
+    )
+    output_cache_entries: int = Field(
+        default=256,
+        description="Encoded workflow/execution outputs kept for reuse while unchanged",
+    )
+    budget_source_cache_bytes: int = Field(
+        default=64_000_000,
+        description="Bytes of trimmed workflows/executions kept to serve n8n_get_omitted",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="N8N_",
@@ -37,5 +131,19 @@ class Settings(BaseSettings):
 
 
 def get_settings() -> Settings:
-    """Get configuration from environment variables or .env file."""
+    """Get configuration from environment variables or .env file.
+
+    Settings are built once and reused until an ``N8N_*`` variable or the
+    working directory (where ``.env`` is read from) changes; call
+    ``get_settings.cache_clear()`` after editing ``.env``.
+    """
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("N8N_")))
+    return _load_settings(env, os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _load_settings(env: tuple, cwd: str) -> Settings:
     return Settings()
+
+
+get_settings.cache_clear = _load_settings.cache_clear
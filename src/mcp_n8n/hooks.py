@@ -0,0 +1,261 @@
+"""Before/after/error hooks around client requests and MCP tool calls.
+
+Each HTTP attempt a client makes (retries included) runs its ``client.hooks``
+in order: ``before(call)`` when it starts, then ``after(call, response)`` or
+``error(call, exc)``. The MCP server runs its tool hooks the same way around
+each tool call, with the tool's result. ``call`` is a ``CallInfo``; hooks can
+keep per-call state in ``call.state``.
+
+Shipped hooks:
+
+- ``MetricsHook`` (``mcp_n8n.metrics``): per-route request metrics;
+- ``OpenTelemetryHook``: one span per request (or tool call, if added to the
+  tool hooks), a no-op unless ``opentelemetry-api`` is installed
+  (``N8N_OTEL_ENABLED=false`` to leave it out);
+- ``ProfileHook``: samples calls into cProfile and tracemalloc and writes the
+  results to a directory. The server enables it for the tools listed in
+  ``N8N_PROFILE_TOOLS``.
+
+Usage:
+    from mcp_n8n.hooks import Hook
+
+    class SlowCalls(Hook):
+        def after(self, call, result):
+            if call.elapsed > 1:
+                print("slow:", call.name, call.elapsed)
+
+    client = N8nClient(hooks=[SlowCalls()])
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+
+@dataclass
+class CallInfo:
+    """One hooked call: an HTTP attempt (``kind="request"``) or an MCP tool call (``kind="tool"``).
+
+    ``name`` is ``"GET /workflows/{id}"`` for requests and the tool name for
+    tool calls. ``status`` and ``elapsed`` are filled in before the after or
+    error hooks run (``status`` stays None without an HTTP response).
+    """
+
+    kind: str
+    name: str
+    method: str = ""
+    url: str = ""
+    route: str = ""
+    attempt: int = 0
+    stream: bool = False
+    started: float = 0.0
+    status: Optional[int] = None
+    elapsed: Optional[float] = None
+    state: dict = field(default_factory=dict)
+
+
+class Hook:
+    """Base class for hooks; override any of the three methods."""
+
+    def before(self, call: CallInfo) -> None:
+        pass
+
+    def after(self, call: CallInfo, result: Any) -> None:
+        pass
+
+    def error(self, call: CallInfo, exc: BaseException) -> None:
+        pass
+
+
+def run_before(hooks: Iterable[Hook], call: CallInfo) -> None:
+    for hook in hooks:
+        hook.before(call)
+    call.started = time.monotonic()
+
+
+def run_after(hooks: Iterable[Hook], call: CallInfo, result: Any, status: Optional[int] = None) -> None:
+    call.elapsed = time.monotonic() - call.started
+    call.status = status
+    for hook in hooks:
+        hook.after(call, result)
+
+
+def run_error(hooks: Iterable[Hook], call: CallInfo, exc: BaseException) -> None:
+    call.elapsed = time.monotonic() - call.started
+    for hook in hooks:
+        hook.error(call, exc)
+
+
+class OpenTelemetryHook(Hook):
+    """A span per call, current while the call runs so nested calls become its children.
+
+    Request spans follow the HTTP client conventions (``{method} {route}``,
+    ``http.response.status_code``; 4xx/5xx and exceptions mark the span as an
+    error). Without ``opentelemetry-api`` every method returns immediately;
+    with the API but no SDK configured, spans are OTel's own no-ops.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import context, trace
+        except ImportError:
+            self.enabled = False
+            return
+        self.enabled = True
+        self._context = context
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("mcp_n8n")
+
+    def before(self, call: CallInfo) -> None:
+        if not self.enabled:
+            return
+        trace = self._trace
+        if call.kind == "request":
+            attributes = {"http.request.method": call.method, "url.full": call.url, "http.route": call.route}
+            if call.attempt:
+                attributes["http.request.resend_count"] = call.attempt
+            span = self._tracer.start_span(call.name, kind=trace.SpanKind.CLIENT, attributes=attributes)
+        else:
+            span = self._tracer.start_span(f"tools/call {call.name}", attributes={"mcp.tool.name": call.name})
+        call.state["otel"] = (span, self._context.attach(trace.set_span_in_context(span)))
+
+    def after(self, call: CallInfo, result: Any) -> None:
+        entry = call.state.pop("otel", None)
+        if entry is None:
+            return
+        span, token = entry
+        if call.status is not None:
+            span.set_attribute("http.response.status_code", call.status)
+            if call.status >= 400:
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        self._end(span, token)
+
+    def error(self, call: CallInfo, exc: BaseException) -> None:
+        entry = call.state.pop("otel", None)
+        if entry is None:
+            return
+        span, token = entry
+        span.record_exception(exc)
+        span.set_attribute("error.type", type(exc).__qualname__)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(exc)))
+        self._end(span, token)
+
+    def _end(self, span: Any, token: Any) -> None:
+        try:
+            self._context.detach(token)
+        except ValueError:
+            pass  # ended in another context than it started (e.g. a cancelled task)
+        span.end()
+
+
+class ProfileHook(Hook):
+    """Profiles a sample of calls with cProfile and tracemalloc.
+
+    For each profiled call ``directory`` gets ``<name>-<time>-<n>.prof``
+    (load with ``pstats`` or snakeviz) and ``.alloc.txt`` (the ``top`` source
+    lines by memory allocated during the call and still held at its end).
+    ``names`` selects calls by ``CallInfo.name`` (``"*"`` for all) and
+    ``sample_rate`` is the fraction of those profiled. Profilers are
+    process-wide, so only one call is profiled at a time and, under asyncio,
+    the profile also contains whatever else ran on the loop meanwhile.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        names: Iterable[str] = ("*",),
+        sample_rate: float = 1.0,
+        top: int = 50,
+    ) -> None:
+        self.directory = directory
+        self.names = frozenset(names)
+        self.sample_rate = sample_rate
+        self.top = top
+        self.written: list[str] = []
+        self._active = False
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def _selected(self, call: CallInfo) -> bool:
+        return ("*" in self.names or call.name in self.names) and random.random() < self.sample_rate
+
+    def before(self, call: CallInfo) -> None:
+        if not self._selected(call):
+            return
+        with self._lock:
+            if self._active:
+                return
+            self._active = True
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (or debugger) already owns the interpreter's profiling hook.
+            self._active = False
+            return
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline = None if started_tracing else tracemalloc.take_snapshot()
+        call.state["profile"] = (profiler, started_tracing, baseline)
+
+    def after(self, call: CallInfo, result: Any) -> None:
+        self._finish(call, "ok" if call.status is None or call.status < 400 else f"HTTP {call.status}")
+
+    def error(self, call: CallInfo, exc: BaseException) -> None:
+        self._finish(call, f"{type(exc).__qualname__}: {exc}")
+
+    def _finish(self, call: CallInfo, outcome: str) -> None:
+        entry = call.state.pop("profile", None)
+        if entry is None:
+            return
+        profiler, started_tracing, baseline = entry
+        try:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            with self._lock:
+                self._seq += 1
+                seq = self._seq
+            os.makedirs(self.directory, exist_ok=True)
+            stem = os.path.join(
+                self.directory,
+                f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', call.name).strip('_')}-{time.strftime('%Y%m%dT%H%M%S')}-{seq}",
+            )
+            profiler.dump_stats(f"{stem}.prof")
+            allocations = snapshot.compare_to(baseline, "lineno") if baseline else snapshot.statistics("lineno")
+            with open(f"{stem}.alloc.txt", "w", encoding="utf-8") as f:
+                f.write(f"# {call.kind} {call.name}: {outcome}, {call.elapsed or 0:.3f}s\n")
+                for stat in allocations[:self.top]:
+                    f.write(f"{stat}\n")
+            self.written.append(f"{stem}.prof")
+        finally:
+            self._active = False
+
+
+def default_hooks(settings: Any) -> list[Hook]:
+    """Hooks every client gets from settings (currently the OpenTelemetry span hook)."""
+    if not settings.otel_enabled:
+        return []
+    hook = OpenTelemetryHook()
+    return [hook] if hook.enabled else []
+
+
+def tool_hooks(settings: Any) -> list[Hook]:
+    """Hooks the MCP server runs around tool calls: profiles of the tools in ``N8N_PROFILE_TOOLS``.
+
+    FastMCP traces tool calls itself; request spans nest under its tool span.
+    """
+    names = [name.strip() for name in (settings.profile_tools or "").split(",") if name.strip()]
+    if not names:
+        return []
+    return [ProfileHook(settings.profile_dir, names, settings.profile_sample_rate)]
@@ -0,0 +1,212 @@
+"""Adaptive per-host concurrency limiter (AIMD).
+
+Every request to an n8n host takes a slot from that host's limiter. The limit
+grows by one slot per "window" of successful, fast responses while it is
+saturated, and shrinks multiplicatively on 429/5xx, connection errors or when
+latency rises well above the observed baseline, always staying within
+``concurrency_floor`` and ``concurrency_ceiling``. Callers beyond the limit
+wait in one FIFO queue shared by threads and asyncio tasks.
+
+``limiter.stats()`` reports the current limit, in-flight requests and queue
+depth.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from .resilience import host_key
+
+# Re-measure the no-load latency baseline after this many samples.
+_BASELINE_SAMPLES = 500
+_SMOOTHING = 0.2
+# Latency must also exceed the baseline by this many seconds to count as slow,
+# so sub-millisecond jitter on a fast local instance is ignored.
+_LATENCY_SLACK = 0.005
+
+
+class _Waiter:
+    __slots__ = ("event", "future", "loop", "granted")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+        self.granted = False
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """Fair concurrency limiter whose limit follows latency and overload signals."""
+
+    def __init__(
+        self,
+        host: str = "",
+        floor: int = 1,
+        ceiling: int = 32,
+        initial: Optional[int] = None,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.75,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(min(self.ceiling, max(self.floor, initial or self.floor)))
+        self._in_flight = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+        self._baseline: Optional[float] = None
+        self._smoothed: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = 0.0
+        self.decreases = 0
+
+    @classmethod
+    def from_settings(cls, host: str, settings: Any) -> AdaptiveLimiter:
+        return cls(
+            host,
+            floor=settings.concurrency_floor,
+            ceiling=settings.concurrency_ceiling,
+            initial=settings.concurrency_initial,
+            latency_tolerance=settings.concurrency_latency_tolerance,
+        )
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    # --- Slots ---
+
+    def _try_take(self) -> bool:
+        if not self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _grant_waiting(self) -> None:
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self._in_flight += 1
+            waiter.wake()
+
+    def acquire(self) -> None:
+        """Block until a slot is free; callers are served in arrival order."""
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+        waiter.event.wait()
+
+    async def acquire_async(self) -> None:
+        """Async twin of ``acquire``."""
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._in_flight -= 1
+                    self._grant_waiting()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """Return a slot, feeding the request's latency and outcome into the limit.
+
+        ``latency`` is None for a request that was abandoned without an answer
+        that says anything about the host's load.
+        """
+        with self._lock:
+            saturated = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+            if latency is not None:
+                self._adjust(latency, overloaded, saturated)
+            self._grant_waiting()
+
+    # --- Limit adjustment ---
+
+    def _adjust(self, latency: float, overloaded: bool, saturated: bool) -> None:
+        self._samples += 1
+        self._smoothed = latency if self._smoothed is None else (
+            (1 - _SMOOTHING) * self._smoothed + _SMOOTHING * latency
+        )
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        if self._samples % _BASELINE_SAMPLES == 0:
+            self._baseline = self._smoothed
+
+        threshold = self._baseline * self.latency_tolerance + _LATENCY_SLACK
+        slow = latency > threshold and self._smoothed > threshold
+        if overloaded or slow:
+            now = self._clock()
+            # One decrease per round trip, so a burst of bad responses counts once.
+            if now - self._last_decrease >= self._smoothed:
+                self._limit = max(float(self.floor), self._limit * self.backoff)
+                self._last_decrease = now
+                self.decreases += 1
+        elif saturated:
+            self._limit = min(float(self.ceiling), self._limit + 1.0 / self._limit)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "host": self.host,
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+                "floor": self.floor,
+                "ceiling": self.ceiling,
+                "latency_ms": round(self._smoothed * 1000, 2) if self._smoothed is not None else None,
+                "baseline_ms": round(self._baseline * 1000, 2) if self._baseline is not None else None,
+                "decreases": self.decreases,
+            }
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url: str, settings: Any) -> AdaptiveLimiter:
+    """The shared limiter for the host of ``url``."""
+    host = host_key(url)
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = AdaptiveLimiter.from_settings(host, settings)
+        return limiter
+
+
+def all_limiters() -> list[AdaptiveLimiter]:
+    with _limiters_lock:
+        return list(_limiters.values())
+
+
+def reset_limiters() -> None:
+    """Forget all limiter state (e.g. between tests)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,373 @@
+"""Webhook load generator with HdrHistogram-style latency reporting.
+
+Drives one webhook path either at a fixed concurrency (closed loop: each
+worker sends its next request as soon as the previous one finishes) or at a
+target rate (open loop: requests are scheduled every ``1 / rate`` seconds and
+their latency is measured from the scheduled start, so a slow server cannot
+hide queueing delay). Requests go out on a connection pool sized to the
+concurrency, without the client's retries, circuit breaker or adaptive
+limiter, which would otherwise shape the load being measured.
+
+Payloads come from a JSON template (``$seq``, ``$uuid`` and ``$ts`` are
+substituted per request) or cycle through the lines of a JSONL file. The
+report has latency percentiles from a log-linear histogram, an error
+breakdown by HTTP status or exception and achieved throughput.
+
+Usage:
+    mcp-n8n-loadgen order-created --rate 50 --duration 30 --payload '{"order": $seq}'
+    mcp-n8n-loadgen order-created --concurrency 16 --requests 5000 --payload-file orders.jsonl
+    mcp-n8n-loadgen ping --stand-in --stand-in-latency-ms 5 --max-p99-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import string
+import sys
+import threading
+import time
+import uuid
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .client import N8nClient
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+Payloads = Callable[[int], Optional[dict]]
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the layout of HdrHistogram.
+
+    Values are recorded in microseconds. Each power of two is split into
+    linear sub-buckets so every recorded value is kept to within
+    ``significant_figures`` decimal digits, in a fixed array of counts no
+    matter how many values are recorded.
+    """
+
+    def __init__(self, significant_figures: int = 2, highest_us: int = 3_600_000_000) -> None:
+        self._sub_bits = math.ceil(math.log2(2 * 10**significant_figures))
+        self._half = 1 << (self._sub_bits - 1)
+        self._highest = highest_us
+        self._counts = array("Q", bytes(8 * (self._index(highest_us) + 1)))
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def _index(self, value: int) -> int:
+        shift = max(value.bit_length() - self._sub_bits, 0)
+        return shift * self._half + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        shift = max(index // self._half - 1, 0)
+        return ((index - shift * self._half + 1) << shift) - 1
+
+    def record(self, value_us: int) -> None:
+        value_us = min(max(int(value_us), 0), self._highest)
+        self._counts[self._index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other._sub_bits != self._sub_bits or len(other._counts) != len(self._counts):
+            raise ValueError("Histograms must have the same precision and range")
+        for index, n in enumerate(other._counts):
+            if n:
+                self._counts[index] += n
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, q: float) -> Optional[int]:
+        """Smallest recorded value (to histogram precision) at or above ``q`` percent of values."""
+        if not self.count:
+            return None
+        target = max(math.ceil(self.count * q / 100), 1)
+        seen = 0
+        for index, n in enumerate(self._counts):
+            seen += n
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max_us)
+        return self.max_us
+
+    def summary_ms(self) -> dict:
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value / 1000, 3) if value is not None else None
+
+        summary = {"min": ms(self.min_us), "mean": ms(self.total_us / self.count if self.count else None)}
+        for q in PERCENTILES:
+            summary[f"p{q:g}"] = ms(self.percentile(q))
+        summary["max"] = ms(self.max_us if self.count else None)
+        return summary
+
+
+def template_payloads(template: str) -> Payloads:
+    """Payloads from a JSON template with ``$seq``, ``$uuid`` and ``$ts`` substituted."""
+    compiled = string.Template(template)
+    if compiled.pattern.search(template):
+        return lambda seq: json.loads(compiled.safe_substitute(
+            seq=seq, uuid=uuid.uuid4().hex, ts=f"{time.time():.6f}",
+        ))
+    fixed = json.loads(template)
+    return lambda seq: fixed
+
+
+def jsonl_payloads(path: str) -> Payloads:
+    """Payloads cycling through the JSON objects of a JSONL file."""
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if not records:
+        raise ValueError(f"No payloads in {path}")
+    return lambda seq: records[seq % len(records)]
+
+
+class _Recorder:
+    """Thread-safe collection of latencies and outcomes."""
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.succeeded = 0
+        self.errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, error: Optional[str]) -> None:
+        with self._lock:
+            self.histogram.record(latency * 1_000_000)
+            if error is None:
+                self.succeeded += 1
+            else:
+                self.errors[error] = self.errors.get(error, 0) + 1
+
+
+def run_load(
+    client: N8nClient,
+    path: str,
+    method: str = "POST",
+    rate: Optional[float] = None,
+    concurrency: int = 8,
+    duration: Optional[float] = 10.0,
+    requests_total: Optional[int] = None,
+    payloads: Optional[Payloads] = None,
+    params: Optional[dict] = None,
+) -> dict:
+    """Send webhook requests and report latency percentiles, errors and throughput.
+
+    Without ``rate``, ``concurrency`` workers send back to back; with
+    ``rate``, requests start every ``1 / rate`` seconds on up to
+    ``concurrency`` workers. Stops after ``duration`` seconds or
+    ``requests_total`` requests, whichever comes first. Any response below
+    400 counts as a success.
+    """
+    if duration is None and requests_total is None:
+        raise ValueError("Pass duration or requests_total")
+    if rate is not None and rate <= 0:
+        raise ValueError("rate must be positive")
+    url = client.webhook_url(path)
+    method = method.upper()
+    recorder = _Recorder()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def send(seq: int, scheduled: float) -> None:
+        body = payloads(seq) if payloads is not None else None
+        error = None
+        try:
+            response = session.request(method, url, json=body, params=params, timeout=client.timeout)
+            if response.status_code >= 400:
+                error = f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            error = type(e).__name__
+        recorder.record(time.perf_counter() - scheduled, error)
+
+    limit = requests_total if requests_total is not None else math.inf
+    start = time.perf_counter()
+    deadline = start + duration if duration is not None else math.inf
+    try:
+        if rate is None:
+            sequence = itertools.count()
+
+            def worker() -> None:
+                for seq in sequence:
+                    now = time.perf_counter()
+                    if seq >= limit or now >= deadline:
+                        return
+                    send(seq, now)
+
+            threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        else:
+            pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="n8n-loadgen")
+            for seq in itertools.count():
+                scheduled = start + seq / rate
+                if seq >= limit or scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(send, seq, scheduled)
+            pool.shutdown(wait=True)
+    finally:
+        session.close()
+    elapsed = time.perf_counter() - start
+
+    histogram = recorder.histogram
+    failed = histogram.count - recorder.succeeded
+    return {
+        "url": url,
+        "mode": "rate" if rate is not None else "concurrency",
+        "target_rate": rate,
+        "concurrency": concurrency,
+        "requests": histogram.count,
+        "succeeded": recorder.succeeded,
+        "failed": failed,
+        "error_rate": round(failed / histogram.count, 4) if histogram.count else None,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(histogram.count / elapsed, 2) if elapsed else None,
+        "latency_ms": histogram.summary_ms(),
+        "errors": dict(sorted(recorder.errors.items(), key=lambda item: -item[1])),
+    }
+
+
+class StandInServer:
+    """Local keep-alive HTTP server answering every webhook like n8n does.
+
+    Each request waits ``latency`` seconds; a ``error_rate`` fraction of
+    requests (spread evenly, not randomly) gets ``error_status``.
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, error_status: int = 500) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.received = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    def _next_status(self) -> int:
+        with self._lock:
+            n = self.received
+            self.received += 1
+        failing = math.floor((n + 1) * self.error_rate) > math.floor(n * self.error_rate)
+        return self.error_status if failing else 200
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                status = stand_in._next_status()
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                body = {"message": "Workflow was started"} if status < 400 else {"message": "Error in workflow"}
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _respond
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> StandInServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="mcp-n8n-loadgen",
+        description="Load-test an n8n webhook and report latency percentiles, errors and throughput.",
+    )
+    parser.add_argument("path", help="Webhook path (the part after /webhook/)")
+    parser.add_argument("--method", default="POST")
+    parser.add_argument("--rate", type=float, help="Target requests per second (open loop)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Workers; with --rate, the most in flight")
+    parser.add_argument("--duration", type=float, help="Seconds to run (default 10 unless --requests is set)")
+    parser.add_argument("--requests", type=int, help="Total requests to send")
+    payload = parser.add_mutually_exclusive_group()
+    payload.add_argument("--payload", help="JSON body template; $seq, $uuid and $ts are substituted")
+    payload.add_argument("--payload-file", help="JSONL file of bodies, sent in turn")
+    parser.add_argument("--stand-in", action="store_true", help="Target a local stand-in server instead of n8n")
+    parser.add_argument("--stand-in-latency-ms", type=float, default=0.0)
+    parser.add_argument("--stand-in-error-rate", type=float, default=0.0)
+    parser.add_argument("--max-error-rate", type=float, help="Exit 1 if the error rate is above this fraction")
+    parser.add_argument("--max-p99-ms", type=float, help="Exit 1 if p99 latency is above this")
+    args = parser.parse_args(argv)
+
+    duration = args.duration if args.duration is not None or args.requests is not None else 10.0
+    payloads = None
+    if args.payload:
+        payloads = template_payloads(args.payload)
+    elif args.payload_file:
+        payloads = jsonl_payloads(args.payload_file)
+
+    def run(base_url: Optional[str]) -> dict:
+        with N8nClient(base_url=base_url) as client:
+            return run_load(
+                client,
+                args.path,
+                method=args.method,
+                rate=args.rate,
+                concurrency=args.concurrency,
+                duration=duration,
+                requests_total=args.requests,
+                payloads=payloads,
+            )
+
+    if args.stand_in:
+        with StandInServer(args.stand_in_latency_ms / 1000, args.stand_in_error_rate) as server:
+            report = run(server.base_url)
+    else:
+        report = run(None)
+    print(json.dumps(report, indent=2))
+
+    breaches = []
+    if args.max_error_rate is not None and (report["error_rate"] or 0) > args.max_error_rate:
+        breaches.append(f"error rate {report['error_rate']} > {args.max_error_rate}")
+    p99 = report["latency_ms"]["p99"]
+    if args.max_p99_ms is not None and p99 is not None and p99 > args.max_p99_ms:
+        breaches.append(f"p99 {p99}ms > {args.max_p99_ms}ms")
+    if breaches:
+        print("Thresholds exceeded: " + "; ".join(breaches), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
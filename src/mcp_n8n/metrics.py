@@ -0,0 +1,246 @@
+"""Per-route request metrics for the n8n clients, with Prometheus exposition.
+
+Every HTTP attempt a client makes (retries included) is recorded against its
+host, method and route. Routes are API paths with IDs replaced by
+placeholders (``/workflows/123/activate`` becomes ``/workflows/{id}/activate``),
+and every webhook call is ``/webhook/{path}``, so the number of series stays
+bounded. Per route there is a request count, error counts by status (``transport``
+for connection failures), a latency histogram and request/response bytes.
+Response bytes of streamed reads come from ``Content-Length`` when present.
+
+Clients record through ``MetricsHook`` in their hook pipeline (see
+``mcp_n8n.hooks``). Recording takes one lock and a handful of integer
+updates; set ``N8N_METRICS_ENABLED=false`` to skip it entirely.
+
+Usage:
+    from mcp_n8n.metrics import render_prometheus, serve_metrics
+
+    print(render_prometheus())
+    serve_metrics(9464)  # GET /metrics in a background thread
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Union
+
+from .hooks import CallInfo, Hook
+from .resilience import host_key
+
+# Upper bounds in seconds of the latency histogram buckets (Prometheus defaults).
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_COLLECTIONS = frozenset({"workflows", "executions", "credentials", "tags", "users", "variables", "projects"})
+_NAMED = frozenset({"schema"})
+# Segments that are IDs wherever they appear: anything with a digit or an
+# e-mail address, or a long token like n8n's 16-character IDs.
+_ID_LIKE = re.compile(r".*[\d@].*|[A-Za-z0-9]{16,}")
+
+
+@lru_cache(maxsize=4096)
+def route_of(endpoint: str) -> str:
+    """``endpoint`` (an API path) with IDs replaced by ``{id}``/``{type}``.
+
+    A segment is an ID after a collection name (``/workflows/{id}``) or when
+    it looks like one, which also covers routes such as
+    ``/active-workflows/error/{id}``.
+    """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    route = []
+    for i, part in enumerate(parts):
+        previous = parts[i - 1] if i else None
+        if previous in _NAMED:
+            route.append("{type}")
+        elif (previous in _COLLECTIONS and part not in _NAMED) or _ID_LIKE.fullmatch(part):
+            route.append("{id}")
+        else:
+            route.append(part)
+    return "/" + "/".join(route)
+
+
+class _Route:
+    __slots__ = ("count", "errors", "buckets", "seconds", "bytes_out", "bytes_in")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors: dict[str, int] = {}
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.seconds = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+
+class RouteMetrics:
+    """Request metrics of one n8n host, keyed by method and route."""
+
+    def __init__(self, host: str = "") -> None:
+        self.host = host
+        self._routes: dict[tuple[str, str], _Route] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status: Union[int, str],
+        seconds: float,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+    ) -> None:
+        """Count one attempt; ``status`` is the HTTP status, or ``"transport"`` if none came back."""
+        bucket = bisect_left(BUCKETS, seconds)
+        with self._lock:
+            entry = self._routes.get((method, route))
+            if entry is None:
+                entry = self._routes[(method, route)] = _Route()
+            entry.count += 1
+            entry.buckets[bucket] += 1
+            entry.seconds += seconds
+            entry.bytes_out += bytes_out
+            entry.bytes_in += bytes_in
+            if not isinstance(status, int) or status >= 400:
+                key = str(status)
+                entry.errors[key] = entry.errors.get(key, 0) + 1
+
+    def snapshot(self) -> list[dict]:
+        """Per-route totals, with latency bucket counts cumulative like Prometheus."""
+        with self._lock:
+            items = [
+                (method, route, e.count, dict(e.errors), list(e.buckets), e.seconds, e.bytes_out, e.bytes_in)
+                for (method, route), e in self._routes.items()
+            ]
+        out = []
+        for method, route, count, errors, buckets, seconds, bytes_out, bytes_in in sorted(items):
+            cumulative, total = {}, 0
+            for bound, n in zip((*BUCKETS, "+Inf"), buckets):
+                total += n
+                cumulative[str(bound)] = total
+            out.append({
+                "method": method,
+                "route": route,
+                "requests": count,
+                "errors": errors,
+                "latency_buckets": cumulative,
+                "latency_sum_seconds": round(seconds, 6),
+                "mean_ms": round(seconds / count * 1000, 3) if count else None,
+                "bytes_out": bytes_out,
+                "bytes_in": bytes_in,
+            })
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+class MetricsHook(Hook):
+    """Client hook recording every request attempt in ``metrics``."""
+
+    def __init__(self, metrics: RouteMetrics) -> None:
+        self.metrics = metrics
+
+    def after(self, call: CallInfo, response: Any) -> None:
+        bytes_in = int(response.headers.get("Content-Length") or 0) if call.stream else len(response.content)
+        bytes_out = int(response.request.headers.get("Content-Length") or 0)
+        self.metrics.record(call.method, call.route, response.status_code, call.elapsed, bytes_out, bytes_in)
+
+    def error(self, call: CallInfo, exc: BaseException) -> None:
+        if isinstance(exc, Exception):  # not cancellation or interpreter exit
+            self.metrics.record(call.method, call.route, "transport", call.elapsed)
+
+
+_metrics: dict[str, RouteMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def metrics_for(url: str) -> RouteMetrics:
+    """The shared metrics of the host of ``url``."""
+    host = host_key(url)
+    with _metrics_lock:
+        metrics = _metrics.get(host)
+        if metrics is None:
+            metrics = _metrics[host] = RouteMetrics(host)
+        return metrics
+
+
+def reset_metrics() -> None:
+    """Forget all recorded metrics (e.g. between tests)."""
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def snapshot() -> dict[str, list[dict]]:
+    """``RouteMetrics.snapshot()`` of every host."""
+    with _metrics_lock:
+        hosts = list(_metrics.values())
+    return {m.host: m.snapshot() for m in hosts}
+
+
+def _labels(**labels: Any) -> str:
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in labels.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, escaped)) + "}"
+
+
+def render_prometheus() -> str:
+    """All recorded metrics in the Prometheus text exposition format."""
+    requests, errors, buckets, sums, counts, sent, received = [], [], [], [], [], [], []
+    for host, routes in snapshot().items():
+        for r in routes:
+            base = _labels(host=host, method=r["method"], route=r["route"])
+            requests.append(f"n8n_client_requests_total{base} {r['requests']}")
+            for status, n in sorted(r["errors"].items()):
+                labels = _labels(host=host, method=r["method"], route=r["route"], status=status)
+                errors.append(f"n8n_client_errors_total{labels} {n}")
+            for bound, n in r["latency_buckets"].items():
+                labels = _labels(host=host, method=r["method"], route=r["route"], le=bound)
+                buckets.append(f"n8n_client_request_duration_seconds_bucket{labels} {n}")
+            sums.append(f"n8n_client_request_duration_seconds_sum{base} {r['latency_sum_seconds']}")
+            counts.append(f"n8n_client_request_duration_seconds_count{base} {r['requests']}")
+            sent.append(f"n8n_client_request_bytes_total{base} {r['bytes_out']}")
+            received.append(f"n8n_client_response_bytes_total{base} {r['bytes_in']}")
+    lines = [
+        "# HELP n8n_client_requests_total HTTP requests sent to n8n, retries included.",
+        "# TYPE n8n_client_requests_total counter",
+        *requests,
+        "# HELP n8n_client_errors_total Requests that failed, by HTTP status or 'transport'.",
+        "# TYPE n8n_client_errors_total counter",
+        *errors,
+        "# HELP n8n_client_request_duration_seconds Request latency (to the response headers for streamed reads).",
+        "# TYPE n8n_client_request_duration_seconds histogram",
+        *buckets, *sums, *counts,
+        "# HELP n8n_client_request_bytes_total Request body bytes sent to n8n.",
+        "# TYPE n8n_client_request_bytes_total counter",
+        *sent,
+        "# HELP n8n_client_response_bytes_total Response body bytes received from n8n.",
+        "# TYPE n8n_client_response_bytes_total counter",
+        *received,
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``GET /metrics`` on ``host:port`` from a daemon thread; returns the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="n8n-metrics", daemon=True).start()
+    return server
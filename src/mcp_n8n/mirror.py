@@ -0,0 +1,262 @@
+"""Local SQLite mirror of n8n workflows with incremental sync.
+
+The mirror stores every workflow body plus indexed name, active flag, tags
+and node types. ``sync`` compares ``updatedAt`` from the live listing with
+the stored copy and only fetches bodies that changed, concurrently. Reads
+accept a ``max_age`` bound and re-sync first when the mirror is older.
+
+Usage:
+    from mcp_n8n.client import N8nClient
+    from mcp_n8n.mirror import WorkflowMirror
+
+    mirror = WorkflowMirror(N8nClient(), "workflows.db")
+    mirror.sync()
+    slack_flows = mirror.list_workflows(node_type="n8n-nodes-base.slack")
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from . import codec
+from .operations import workflows
+
+if TYPE_CHECKING:
+    from .client import N8nClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    active INTEGER,
+    created_at TEXT,
+    updated_at TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workflow_tags (
+    workflow_id TEXT NOT NULL REFERENCES workflows(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workflow_nodes (
+    workflow_id TEXT NOT NULL REFERENCES workflows(id) ON DELETE CASCADE,
+    name TEXT,
+    type TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_workflow_tags_tag ON workflow_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_workflow_nodes_type ON workflow_nodes(type);
+"""
+
+_CURSOR_PREFIX = "mirror:"
+
+
+class WorkflowMirror:
+    """SQLite-backed copy of the workflows on one n8n instance."""
+
+    def __init__(self, client: N8nClient, path: str = ":memory:", max_concurrency: int = 8) -> None:
+        self.client = client
+        self.path = path
+        self.max_concurrency = max_concurrency
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+
+    # --- Sync ---
+
+    def sync(self) -> dict:
+        """Bring the mirror up to date; only changed workflow bodies are fetched."""
+        with self._sync_lock:
+            started = time.time()
+            live = {wf["id"]: wf for wf in workflows.iter_workflows(self.client)}
+            with self._lock:
+                stored = dict(self._db.execute("SELECT id, updated_at FROM workflows"))
+
+            changed = [wid for wid, wf in live.items() if stored.get(wid) != wf.get("updatedAt")]
+            removed = [wid for wid in stored if wid not in live]
+            fetched = workflows.get_workflows_bulk(self.client, changed, self.max_concurrency)
+
+            with self._lock, self._db:
+                for result in fetched["results"]:
+                    if result["ok"]:
+                        self._upsert(result["data"])
+                for wid, wf in live.items():
+                    if wid not in changed:
+                        self._db.execute(
+                            "UPDATE workflows SET name = ?, active = ? WHERE id = ?",
+                            (wf.get("name"), int(bool(wf.get("active"))), wid),
+                        )
+                self._db.executemany("DELETE FROM workflows WHERE id = ?", [(wid,) for wid in removed])
+                if not fetched["failed"]:
+                    self._set_state("last_synced", str(started))
+
+            return {
+                "total": len(live),
+                "fetched": fetched["succeeded"],
+                "failed": fetched["failed"],
+                "removed": len(removed),
+                "unchanged": len(live) - len(changed),
+            }
+
+    def sync_in_background(self) -> threading.Thread:
+        """Start ``sync`` on a daemon thread unless one is already running."""
+        with self._lock:
+            if self._background is None or not self._background.is_alive():
+                self._background = threading.Thread(target=self._sync_quietly, name="n8n-mirror-sync", daemon=True)
+                self._background.start()
+            return self._background
+
+    def _sync_quietly(self) -> None:
+        try:
+            self.sync()
+        except Exception:
+            pass
+
+    def _upsert(self, wf: dict) -> None:
+        wid = str(wf["id"])
+        self._db.execute("DELETE FROM workflows WHERE id = ?", (wid,))
+        self._db.execute(
+            "INSERT INTO workflows (id, name, active, created_at, updated_at, body) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                wid,
+                wf.get("name"),
+                int(bool(wf.get("active"))),
+                wf.get("createdAt"),
+                wf.get("updatedAt"),
+                codec.dumps(wf),
+            ),
+        )
+        self._db.executemany(
+            "INSERT INTO workflow_tags (workflow_id, tag) VALUES (?, ?)",
+            [(wid, t.get("name")) for t in wf.get("tags") or []],
+        )
+        self._db.executemany(
+            "INSERT INTO workflow_nodes (workflow_id, name, type) VALUES (?, ?, ?)",
+            [(wid, n.get("name"), n.get("type")) for n in wf.get("nodes") or []],
+        )
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Mark one workflow as outdated; it is refetched on the next read or sync."""
+        with self._lock, self._db:
+            self._db.execute("UPDATE workflows SET updated_at = NULL WHERE id = ?", (workflow_id,))
+
+    def remove(self, workflow_id: str) -> None:
+        """Drop one workflow from the mirror (e.g. after deleting it)."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM workflows WHERE id = ?", (workflow_id,))
+
+    # --- Freshness ---
+
+    def _set_state(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    def last_synced(self) -> Optional[float]:
+        """Epoch time of the last complete sync, or None if never synced."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM sync_state WHERE key = 'last_synced'").fetchone()
+        return float(row[0]) if row else None
+
+    def age(self) -> float:
+        """Seconds since the last complete sync (infinite if never synced)."""
+        synced = self.last_synced()
+        return float("inf") if synced is None else time.time() - synced
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.age() <= max_age
+
+    def _ensure_fresh(self, max_age: Optional[float]) -> None:
+        if max_age is not None and not self.is_fresh(max_age):
+            self.sync()
+
+    # --- Reads ---
+
+    def get_workflow(self, workflow_id: str, max_age: Optional[float] = None) -> Optional[dict]:
+        """Get a mirrored workflow body, syncing first if older than ``max_age``."""
+        self._ensure_fresh(max_age)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, updated_at FROM workflows WHERE id = ?", (workflow_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        if row[1] is None:
+            wf = workflows.get_workflow(self.client, workflow_id)
+            with self._lock, self._db:
+                self._upsert(wf)
+            return wf
+        return codec.loads(row[0])
+
+    def list_workflows(
+        self,
+        active: Optional[bool] = None,
+        tags: Optional[str] = None,
+        name_contains: Optional[str] = None,
+        node_type: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ) -> dict:
+        """List mirrored workflows in the same shape as ``workflows.list_workflows``.
+
+        ``tags`` is a comma-separated list of tag names (any match).
+        """
+        self._ensure_fresh(max_age)
+        where, args = [], []
+        if active is not None:
+            where.append("w.active = ?")
+            args.append(int(active))
+        if tags:
+            names = [t.strip() for t in tags.split(",") if t.strip()]
+            where.append(
+                f"w.id IN (SELECT workflow_id FROM workflow_tags WHERE tag IN ({','.join('?' * len(names))}))"
+            )
+            args.extend(names)
+        if name_contains:
+            where.append("w.name LIKE ?")
+            args.append(f"%{name_contains}%")
+        if node_type:
+            where.append("w.id IN (SELECT workflow_id FROM workflow_nodes WHERE type = ?)")
+            args.append(node_type)
+        offset = int(cursor[len(_CURSOR_PREFIX):]) if cursor and cursor.startswith(_CURSOR_PREFIX) else 0
+        sql = "SELECT w.id, w.name, w.active, w.created_at, w.updated_at FROM workflows w"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY w.name, w.id LIMIT ? OFFSET ?"
+
+        with self._lock:
+            rows = self._db.execute(sql, [*args, limit + 1, offset]).fetchall()
+            tag_rows = self._db.execute(
+                f"SELECT workflow_id, tag FROM workflow_tags WHERE workflow_id IN ({','.join('?' * len(rows))})",
+                [r[0] for r in rows],
+            ).fetchall() if rows else []
+        tag_map: dict[str, list[str]] = {}
+        for wid, tag in tag_rows:
+            tag_map.setdefault(wid, []).append(tag)
+
+        formatted = [
+            {
+                "id": wid,
+                "name": name,
+                "active": bool(active_flag),
+                "tags": tag_map.get(wid, []),
+                "createdAt": created_at,
+                "updatedAt": updated_at,
+            }
+            for wid, name, active_flag, created_at, updated_at in rows[:limit]
+        ]
+        return {
+            "workflows": formatted,
+            "nextCursor": f"{_CURSOR_PREFIX}{offset + limit}" if len(rows) > limit else None,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -1 +1,5 @@
-"""n8n operations — pure business logic."""
+"""n8n operations — pure business logic.
+
+Every operation takes an ``N8nClient``; its async twin (same name with an
+``a`` prefix, e.g. ``alist_workflows``) takes an ``AsyncN8nClient``.
+"""
@@ -0,0 +1,106 @@
+"""Shared sync/async driver for operations.
+
+Each operation is written once as a generator that yields ``Call`` objects
+and receives the result of each call (or has its exception, cancellation
+included, thrown in so ``finally`` blocks and cleanup run in order); it may
+also yield ``Sleep`` to pause without blocking an event loop. The
+``operation`` decorator turns that generator into a plain function for
+``N8nClient`` and exposes an async twin for ``AsyncN8nClient`` as ``.aio``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Generator, Union
+
+
+class Call:
+    """A client method call requested by an operation, e.g. ``Call("get", "/tags")``."""
+
+    __slots__ = ("name", "args", "kwargs")
+
+    def __init__(self, name: str, /, *args: Any, **kwargs: Any) -> None:
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"Call({self.name!r}, *{self.args!r}, **{self.kwargs!r})"
+
+
+class Sleep:
+    """A pause requested by an operation, e.g. ``Sleep(0.5)`` between polls."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return f"Sleep({self.seconds!r})"
+
+
+OperationGen = Generator[Union[Call, Sleep], Any, Any]
+
+
+def _step(gen: OperationGen, value: Any, error: BaseException | None) -> Union[Call, Sleep]:
+    if error is not None:
+        return gen.throw(error)
+    return gen.send(value)
+
+
+def run_sync(client: Any, gen: OperationGen) -> Any:
+    """Drive an operation generator with a sync client."""
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            call = _step(gen, value, error)
+        except StopIteration as stop:
+            return stop.value
+        if isinstance(call, Sleep):
+            time.sleep(call.seconds)
+            value, error = None, None
+            continue
+        try:
+            value, error = getattr(client, call.name)(*call.args, **call.kwargs), None
+        except BaseException as exc:
+            value, error = None, exc
+
+
+async def run_async(client: Any, gen: OperationGen) -> Any:
+    """Drive an operation generator with an async client."""
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            call = _step(gen, value, error)
+        except StopIteration as stop:
+            return stop.value
+        if isinstance(call, Sleep):
+            await asyncio.sleep(call.seconds)
+            value, error = None, None
+            continue
+        try:
+            value, error = await getattr(client, call.name)(*call.args, **call.kwargs), None
+        except BaseException as exc:
+            value, error = None, exc
+
+
+def operation(func: Callable[..., OperationGen]) -> Callable[..., Any]:
+    """Build a sync operation from a generator, with its async twin on ``.aio``."""
+
+    @functools.wraps(func)
+    def sync(client: Any, *args: Any, **kwargs: Any) -> Any:
+        return run_sync(client, func(client, *args, **kwargs))
+
+    async def aio(client: Any, *args: Any, **kwargs: Any) -> Any:
+        return await run_async(client, func(client, *args, **kwargs))
+
+    functools.update_wrapper(aio, func)
+    aio.__name__ = f"a{func.__name__}"
+    aio.__qualname__ = f"a{func.__qualname__}"
+    sync.aio = aio  # type: ignore[attr-defined]
+    return sync
@@ -0,0 +1,106 @@
+"""Bounded-concurrency fan-out of a per-ID operation.
+
+Results come back in input order, one entry per ID, and a failure for one ID
+is recorded in its entry instead of aborting the batch. ``max_per_second``
+additionally spaces out the calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+
+class RateCap:
+    """Spaces calls at least ``1 / per_second`` apart across threads and tasks."""
+
+    def __init__(self, per_second: Optional[float]) -> None:
+        self._interval = 1.0 / per_second if per_second else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next start time; return how long to wait for it."""
+        if not self._interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        return start - now
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def await_turn(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _ok(item_id: str, data: Any) -> dict:
+    return {"id": item_id, "ok": True, "data": data}
+
+
+def _failed(item_id: str, exc: Exception) -> dict:
+    response = getattr(exc, "response", None)
+    return {
+        "id": item_id,
+        "ok": False,
+        "error": str(exc),
+        "status_code": getattr(response, "status_code", None),
+    }
+
+
+def _summary(results: list[dict]) -> dict:
+    succeeded = sum(1 for r in results if r["ok"])
+    return {"results": results, "succeeded": succeeded, "failed": len(results) - succeeded}
+
+
+def run_bulk(
+    func: Callable[[str], Any],
+    ids: Iterable[str],
+    max_concurrency: int = 8,
+    max_per_second: Optional[float] = None,
+) -> dict:
+    """Call ``func(id)`` for every ID on a bounded thread pool."""
+    ids = list(ids)
+    rate = RateCap(max_per_second)
+
+    def one(item_id: str) -> dict:
+        rate.wait()
+        try:
+            return _ok(item_id, func(item_id))
+        except Exception as exc:
+            return _failed(item_id, exc)
+
+    if not ids:
+        return _summary([])
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(ids)))) as executor:
+        return _summary(list(executor.map(one, ids)))
+
+
+async def arun_bulk(
+    func: Callable[[str], Awaitable[Any]],
+    ids: Iterable[str],
+    max_concurrency: int = 8,
+    max_per_second: Optional[float] = None,
+) -> dict:
+    """Async twin of ``run_bulk``; at most ``max_concurrency`` calls in flight."""
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+    rate = RateCap(max_per_second)
+
+    async def one(item_id: str) -> dict:
+        async with limit:
+            await rate.await_turn()
+            try:
+                return _ok(item_id, await func(item_id))
+            except Exception as exc:
+                return _failed(item_id, exc)
+
+    return _summary(list(await asyncio.gather(*(one(item_id) for item_id in ids))))
@@ -0,0 +1,133 @@
+"""Structural workflow diffs and node-level merge patches.
+
+Nodes are matched by ID, then by name, so reordering nodes is not a change
+and a renamed node is reported as renamed rather than removed and re-added.
+Connections are compared per source node and settings per key.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Optional
+
+_MISSING = object()
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """``target`` with the JSON merge patch (RFC 7386) ``patch`` applied; ``None`` deletes a key."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    merged = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = merge_patch(merged.get(key), value)
+    return merged
+
+
+def _rename_in_connections(connections: dict, old: str, new: str) -> dict:
+    renamed = {}
+    for source, outputs in connections.items():
+        renamed[new if source == old else source] = {
+            kind: [
+                [{**link, "node": new} if link.get("node") == old else link for link in slot or []]
+                for slot in slots
+            ]
+            for kind, slots in outputs.items()
+        }
+    return renamed
+
+
+def _drop_from_connections(connections: dict, name: str) -> dict:
+    return {
+        source: {
+            kind: [[link for link in slot or [] if link.get("node") != name] for slot in slots]
+            for kind, slots in outputs.items()
+        }
+        for source, outputs in connections.items()
+        if source != name
+    }
+
+
+def patch_nodes(nodes: list, connections: dict, patches: dict[str, Optional[dict]]) -> tuple[list, dict]:
+    """Apply per-node merge patches, keyed by node name or ID; a ``None`` patch removes the node.
+
+    Renaming a node (``{"name": ...}``) or removing it updates ``connections``
+    to match. Raises ``ValueError`` for a key that matches no node.
+    """
+    nodes = list(nodes)
+    for key, patch in patches.items():
+        index = next((i for i, n in enumerate(nodes) if n.get("id") == key), None)
+        if index is None:
+            index = next((i for i, n in enumerate(nodes) if n.get("name") == key), None)
+        if index is None:
+            raise ValueError(f"No node named or with ID {key!r} in the workflow")
+        name = nodes[index].get("name")
+        if patch is None:
+            del nodes[index]
+            connections = _drop_from_connections(connections, name)
+            continue
+        nodes[index] = merge_patch(nodes[index], patch)
+        new_name = nodes[index].get("name")
+        if new_name != name:
+            connections = _rename_in_connections(connections, name, new_name)
+    return nodes, connections
+
+
+def _match(node: dict, by_id: dict, by_name: dict) -> Optional[dict]:
+    if node.get("id") is not None and node["id"] in by_id:
+        return by_id[node["id"]]
+    return by_name.get(node.get("name"))
+
+
+def _diff_nodes(current: list, desired: list) -> dict:
+    by_id = {n["id"]: n for n in current if n.get("id") is not None}
+    by_name = {n.get("name"): n for n in current}
+    matched: set[int] = set()
+    added, renamed, changed = [], {}, {}
+    for node in desired:
+        old = _match(node, by_id, by_name)
+        if old is None or id(old) in matched:
+            added.append(node.get("name"))
+            continue
+        matched.add(id(old))
+        if old.get("name") != node.get("name"):
+            renamed[old.get("name")] = node.get("name")
+        fields = sorted(k for k in old.keys() | node.keys() if k != "name" and old.get(k) != node.get(k))
+        if fields:
+            changed[node.get("name")] = fields
+    removed = [n.get("name") for n in current if id(n) not in matched]
+    diff = {"added": added, "removed": removed, "renamed": renamed, "changed": changed}
+    return {k: v for k, v in diff.items() if v}
+
+
+def _diff_keys(current: dict, desired: dict) -> dict:
+    diff = {
+        "added": sorted(k for k in desired.keys() - current.keys()),
+        "removed": sorted(k for k in current.keys() - desired.keys()),
+        "changed": sorted(k for k in current.keys() & desired.keys() if current[k] != desired[k]),
+    }
+    return {k: v for k, v in diff.items() if v}
+
+
+def diff_workflow(current: dict, desired: dict) -> dict:
+    """What changes from ``current`` to ``desired``; empty if they are the same workflow.
+
+    Keys appear only when something changed: ``name`` and ``active``
+    (``{"from": ..., "to": ...}``), ``nodes`` (``added``/``removed`` node
+    names, ``renamed`` old -> new, ``changed`` name -> changed fields),
+    ``connections`` (source node names ``added``/``removed``/``changed``) and
+    ``settings`` (keys ``added``/``removed``/``changed``).
+    """
+    changes: dict = {}
+    for key in ("name", "active"):
+        new = desired.get(key, _MISSING)
+        if new is not _MISSING and new != current.get(key):
+            changes[key] = {"from": current.get(key), "to": new}
+    for key, differ in (("nodes", _diff_nodes), ("connections", _diff_keys), ("settings", _diff_keys)):
+        empty: Any = [] if key == "nodes" else {}
+        diff = differ(current.get(key) or empty, desired.get(key) or empty)
+        if diff:
+            changes[key] = diff
+    return changes
@@ -0,0 +1,133 @@
+"""Lazy cursor pagination with one page of background prefetch.
+
+``paginate`` and ``apaginate`` follow ``nextCursor`` across pages of a list
+operation, fetching page N+1 while page N is consumed. At most two pages are
+held at once, and items whose ``id`` was seen recently are dropped so that
+entries shifting across page boundaries are not yielded twice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+Page = dict
+StopPredicate = Callable[[dict], bool]
+
+# How many recent item IDs to remember for cross-page de-duplication.
+SEEN_WINDOW = 10_000
+
+
+class _Seen:
+    """Bounded set of recently yielded IDs."""
+
+    def __init__(self, size: int = SEEN_WINDOW) -> None:
+        self._order: deque = deque()
+        self._ids: set = set()
+        self._size = size
+
+    def add(self, item_id: Any) -> bool:
+        """Record ``item_id``; return False if it was already seen."""
+        if item_id is None:
+            return True
+        if item_id in self._ids:
+            return False
+        self._ids.add(item_id)
+        self._order.append(item_id)
+        if len(self._order) > self._size:
+            self._ids.discard(self._order.popleft())
+        return True
+
+
+class _Emitter:
+    """Applies de-duplication, ``max_items`` and ``stop`` to a stream of items."""
+
+    def __init__(self, max_items: Optional[int], stop: Optional[StopPredicate]) -> None:
+        self.max_items = max_items
+        self.stop = stop
+        self.count = 0
+        self.done = max_items is not None and max_items <= 0
+        self._seen = _Seen()
+
+    def accept(self, item: dict) -> bool:
+        if not self._seen.add(item.get("id")):
+            return False
+        if self.stop is not None and self.stop(item):
+            self.done = True
+            return False
+        self.count += 1
+        if self.max_items is not None and self.count >= self.max_items:
+            self.done = True
+        return True
+
+
+def paginate(
+    fetch_page: Callable[[Optional[str]], Page],
+    key: str,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> Iterator[dict]:
+    """Yield items from ``fetch_page(cursor)[key]`` across all pages.
+
+    Iteration ends after ``max_items`` items, or just before the first item
+    for which ``stop(item)`` is true.
+    """
+    emitter = _Emitter(max_items, stop)
+    if emitter.done:
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="n8n-prefetch")
+    try:
+        page = fetch_page(None)
+        previous: Optional[str] = None
+        while True:
+            cursor = page.get("nextCursor")
+            if cursor == previous:
+                cursor = None
+            previous = cursor
+            upcoming = executor.submit(fetch_page, cursor) if cursor else None
+            for item in page[key]:
+                if emitter.accept(item):
+                    yield item
+                if emitter.done:
+                    return
+            if upcoming is None:
+                return
+            page = upcoming.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch_page: Callable[[Optional[str]], Awaitable[Page]],
+    key: str,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> AsyncIterator[dict]:
+    """Async twin of ``paginate``; prefetches the next page as a task."""
+    emitter = _Emitter(max_items, stop)
+    if emitter.done:
+        return
+    upcoming: Optional[asyncio.Task] = None
+    try:
+        page = await fetch_page(None)
+        previous: Optional[str] = None
+        while True:
+            cursor = page.get("nextCursor")
+            if cursor == previous:
+                cursor = None
+            previous = cursor
+            upcoming = asyncio.ensure_future(fetch_page(cursor)) if cursor else None
+            for item in page[key]:
+                if emitter.accept(item):
+                    yield item
+                if emitter.done:
+                    return
+            if upcoming is None:
+                return
+            page = await upcoming
+            upcoming = None
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()
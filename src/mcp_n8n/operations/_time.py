@@ -0,0 +1,18 @@
+"""Timestamp helpers for n8n's ISO-8601 fields."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+
+def parse_timestamp(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """Parse an n8n timestamp (e.g. ``2025-01-01T10:00:00.000Z``) as an aware datetime."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = value[:-1] + "+00:00" if value.endswith("Z") else value
+        parsed = datetime.fromisoformat(text)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
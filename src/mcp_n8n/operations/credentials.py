@@ -1,12 +1,17 @@
-"""Credential operations — list, get_schema, create, delete."""
+"""Credential operations — list, iterate, get_schema, create, delete."""
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
 
-from ..client import N8nClient
+from ._base import Call, operation
+from ._pagination import StopPredicate, apaginate, paginate
 
+if TYPE_CHECKING:
+    from ..client import AsyncN8nClient, N8nClient
 
+
+@operation
 def list_credentials(
     client: N8nClient,
     limit: int = 100,
@@ -17,7 +22,7 @@ def list_credentials(
     if cursor:
         params["cursor"] = cursor
 
-    result = client.get("/credentials", params=params)
+    result = (yield Call("get", "/credentials", params=params))
     credentials = result.get("data", result) if isinstance(result, dict) else result
     if not isinstance(credentials, list):
         credentials = [credentials]
@@ -37,18 +42,55 @@ def list_credentials(
     }
 
 
+def iter_credentials(
+    client: N8nClient,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> Iterator[dict]:
+    """Iterate over all credentials, following nextCursor lazily."""
+    return paginate(
+        lambda cursor: list_credentials(client, limit=page_size, cursor=cursor),
+        "credentials", max_items=max_items, stop=stop,
+    )
+
+
+@operation
 def get_credential_schema(client: N8nClient, credential_type: str) -> dict:
     """Get the schema for a credential type."""
-    return client.get(f"/credentials/schema/{credential_type}")
+    return (yield Call("get", f"/credentials/schema/{credential_type}"))
 
 
+@operation
 def create_credential(client: N8nClient, name: str, credential_type: str, data: dict) -> dict:
     """Create a new credential."""
     payload = {"name": name, "type": credential_type, "data": data}
-    return client.post("/credentials", json=payload)
+    return (yield Call("post", "/credentials", json=payload))
 
 
+@operation
 def delete_credential(client: N8nClient, credential_id: str) -> dict:
     """Delete a credential."""
-    client.delete(f"/credentials/{credential_id}")
+    yield Call("delete", f"/credentials/{credential_id}")
     return {"status": "deleted", "credential_id": credential_id}
+
+
+# --- Async twins (for AsyncN8nClient) ---
+
+alist_credentials = list_credentials.aio
+aget_credential_schema = get_credential_schema.aio
+acreate_credential = create_credential.aio
+adelete_credential = delete_credential.aio
+
+
+def aiter_credentials(
+    client: AsyncN8nClient,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> AsyncIterator[dict]:
+    """Async twin of ``iter_credentials``."""
+    return apaginate(
+        lambda cursor: alist_credentials(client, limit=page_size, cursor=cursor),
+        "credentials", max_items=max_items, stop=stop,
+    )
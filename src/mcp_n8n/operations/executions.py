@@ -1,12 +1,114 @@
-"""Execution operations — list, get, delete, retry, stop."""
+"""Execution operations — list, iterate, get, streamed get, bulk get, wait, delete, retry, stop, bulk retry/stop."""
 
 from __future__ import annotations
 
-from typing import Optional
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, Optional, Union
 
-from ..client import N8nClient
+from ..streaming import aiter_matches, aload, compile_path, iter_matches, load
+from ._base import Call, Sleep, operation
+from ._bulk import arun_bulk, run_bulk
+from ._pagination import StopPredicate, apaginate, paginate
+from ._time import parse_timestamp
 
+if TYPE_CHECKING:
+    from ..client import AsyncN8nClient, N8nClient
 
+# Top-level fields always returned by streamed reads.
+_SUMMARY_FIELDS = {
+    "id": "id",
+    "workflowId": "workflowId",
+    "status": "status",
+    "mode": "mode",
+    "finished": "finished",
+    "startedAt": "startedAt",
+    "stoppedAt": "stoppedAt",
+    "data.resultData.lastNodeExecuted": "lastNodeExecuted",
+    "data.resultData.error": "error",
+}
+_RUN_DATA = ("data", "resultData", "runData")
+_NODE_ERROR = ("item", "error")
+
+TERMINAL_STATUSES = frozenset({"success", "error", "crashed", "canceled"})
+
+# select preset -> extra paths to stream out of the execution document.
+SELECT_PRESETS = {
+    "summary": (),
+    "errors": (".".join((*_RUN_DATA, "*", *_NODE_ERROR)),),
+    "last_node": (".".join((*_RUN_DATA, "*")),),
+}
+
+
+class _Selection:
+    """Accumulates streamed matches into a compact execution result.
+
+    ``last_node`` keeps only the most recently completed node of runData,
+    so memory stays bounded by the largest single node output.
+    """
+
+    def __init__(self, select: str = "summary", paths: Optional[list[str]] = None) -> None:
+        if select not in SELECT_PRESETS:
+            raise ValueError(f"Unknown select preset {select!r}; expected one of {sorted(SELECT_PRESETS)}")
+        self.select = select
+        self.paths = list(paths or [])
+        self.patterns = [*_SUMMARY_FIELDS, *SELECT_PRESETS[select], *self.paths]
+        self._custom = [compile_path(p) for p in self.paths]
+        self._result: dict = {}
+
+    def add(self, keys: tuple[str, ...], value: object) -> None:
+        # Node names may contain dots, so runData paths are matched per key.
+        path = ".".join(keys)
+        in_run_data = keys[:len(_RUN_DATA)] == _RUN_DATA and len(keys) > len(_RUN_DATA)
+        if path in _SUMMARY_FIELDS:
+            self._result[_SUMMARY_FIELDS[path]] = value
+        elif self.select == "errors" and in_run_data and keys[len(_RUN_DATA) + 1:] == _NODE_ERROR:
+            node = keys[len(_RUN_DATA)]
+            self._result.setdefault("nodeErrors", {}).setdefault(node, []).append(value)
+        elif self.select == "last_node" and in_run_data and len(keys) == len(_RUN_DATA) + 1:
+            self._result["lastNode"] = {"name": keys[-1], "runs": value}
+        if any(matches(keys) for matches in self._custom):
+            self._result.setdefault("selected", {})[path] = value
+
+    def result(self) -> dict:
+        return self._result
+
+
+def _window(
+    since: Union[str, datetime, None],
+    until: Union[str, datetime, None],
+) -> tuple[Callable[[dict], bool], Optional[StopPredicate]]:
+    """``(matches, stop)`` for a startedAt window over a newest-first listing."""
+    since_at, until_at = parse_timestamp(since), parse_timestamp(until)
+
+    def matches(ex: dict) -> bool:
+        if since_at is None and until_at is None:
+            return True
+        at = parse_timestamp(ex.get("startedAt"))
+        if at is None:
+            return False
+        return (since_at is None or at >= since_at) and (until_at is None or at <= until_at)
+
+    def stop(ex: dict) -> bool:
+        at = parse_timestamp(ex.get("startedAt"))
+        return at is not None and at < since_at
+
+    return matches, stop if since_at is not None else None
+
+
+def _check_selection(
+    execution_ids: Optional[list[str]],
+    workflow_id: Optional[str],
+    since: Union[str, datetime, None],
+    until: Union[str, datetime, None],
+    max_items: Optional[int],
+) -> None:
+    # status alone always has a default, so it cannot bound a bulk action.
+    if execution_ids is None and workflow_id is None and since is None and until is None and max_items is None:
+        raise ValueError("Pass execution_ids, or workflow_id, since/until or max_items to bound the selection")
+
+
+@operation
 def list_executions(
     client: N8nClient,
     workflow_id: Optional[str] = None,
@@ -23,7 +125,7 @@ def list_executions(
     if cursor:
         params["cursor"] = cursor
 
-    result = client.get("/executions", params=params)
+    result = (yield Call("get", "/executions", params=params))
     executions = result.get("data", result) if isinstance(result, dict) else result
     if not isinstance(executions, list):
         executions = [executions]
@@ -37,6 +139,8 @@ def list_executions(
             "startedAt": ex.get("startedAt"),
             "stoppedAt": ex.get("stoppedAt"),
             "finished": ex.get("finished"),
+            "retryOf": ex.get("retryOf"),
+            "retrySuccessId": ex.get("retrySuccessId"),
         }
         for ex in executions
     ]
@@ -46,26 +150,320 @@ def list_executions(
     }
 
 
+def iter_executions(
+    client: N8nClient,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> Iterator[dict]:
+    """Iterate over all executions, following nextCursor lazily."""
+    return paginate(
+        lambda cursor: list_executions(client, workflow_id=workflow_id, status=status, limit=page_size, cursor=cursor),
+        "executions", max_items=max_items, stop=stop,
+    )
+
+
+@operation
 def get_execution(client: N8nClient, execution_id: str, include_data: bool = False) -> dict:
     """Get detailed information about a specific execution."""
     params = {}
     if include_data:
         params["includeData"] = "true"
-    return client.get(f"/executions/{execution_id}", params=params or None)
+    return (yield Call("get", f"/executions/{execution_id}", params=params or None))
 
 
+def get_execution_streamed(
+    client: N8nClient,
+    execution_id: str,
+    select: str = "summary",
+    paths: Optional[list[str]] = None,
+) -> dict:
+    """Get parts of an execution's data, parsed incrementally from the response.
+
+    ``select`` is ``summary`` (status fields only), ``errors`` (plus per-node
+    errors) or ``last_node`` (plus the output of the last node in runData).
+    ``paths`` adds dotted paths to return, e.g. ``data.resultData.runData.*``.
+    The full document is never held in memory.
+    """
+    selection = _Selection(select, paths)
+    with client.get_stream(f"/executions/{execution_id}", params={"includeData": "true"}) as body:
+        for keys, value in iter_matches(body, selection.patterns, split=True):
+            selection.add(keys, value)
+    return selection.result()
+
+
+def get_execution_document(client: N8nClient, execution_id: str) -> tuple[dict, int]:
+    """Get an execution with its data, parsed straight from the response stream.
+
+    Returns the execution and the size of its JSON body in bytes.
+    """
+    with client.get_stream(f"/executions/{execution_id}", params={"includeData": "true"}) as body:
+        return load(body)
+
+
+def get_executions_bulk(
+    client: N8nClient,
+    execution_ids: list[str],
+    include_data: bool = False,
+    max_concurrency: int = 8,
+) -> dict:
+    """Get many executions concurrently; results are in input order with per-ID errors."""
+    return run_bulk(
+        lambda eid: get_execution(client, eid, include_data=include_data),
+        execution_ids, max_concurrency,
+    )
+
+
+def _emit_new_runs(execution: dict, seen: dict[str, int], on_node: Callable[[str, dict], None]) -> None:
+    """Call ``on_node(name, run)`` for runData entries not reported before."""
+    run_data = ((execution.get("data") or {}).get("resultData") or {}).get("runData") or {}
+    for name, runs in run_data.items():
+        for run in runs[seen.get(name, 0):]:
+            on_node(name, run)
+        seen[name] = len(runs)
+
+
+@operation
+def wait_for_execution(
+    client: N8nClient,
+    execution_id: str,
+    timeout: float = 300.0,
+    poll_interval: float = 0.25,
+    max_poll_interval: float = 5.0,
+    on_node: Optional[Callable[[str, dict], None]] = None,
+) -> dict:
+    """Poll an execution until it finishes; return the final execution.
+
+    Polls start every ``poll_interval`` seconds and back off by 1.5x up to
+    ``max_poll_interval``. With ``on_node``, runData is fetched too and
+    ``on_node(node_name, run)`` is called once for every newly finished node
+    run. Raises ``TimeoutError`` if the execution is still going after
+    ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    interval = poll_interval
+    params = {"includeData": "true"} if on_node is not None else None
+    seen: dict[str, int] = {}
+    while True:
+        execution = (yield Call("get", f"/executions/{execution_id}", params=params))
+        if on_node is not None:
+            _emit_new_runs(execution, seen, on_node)
+        status = execution.get("status")
+        if status in TERMINAL_STATUSES or (status is None and execution.get("stoppedAt")):
+            return execution
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Execution {execution_id} still {status or 'running'} after {timeout}s"
+            )
+        yield Sleep(min(interval, remaining))
+        interval = min(interval * 1.5, max_poll_interval)
+
+
+@operation
 def delete_execution(client: N8nClient, execution_id: str) -> dict:
     """Delete an execution."""
-    client.delete(f"/executions/{execution_id}")
+    yield Call("delete", f"/executions/{execution_id}")
     return {"status": "deleted", "execution_id": execution_id}
 
 
+@operation
 def retry_execution(client: N8nClient, execution_id: str) -> dict:
     """Retry a failed execution."""
-    return client.post(f"/executions/{execution_id}/retry")
+    return (yield Call("post", f"/executions/{execution_id}/retry", retry=True))
 
 
+@operation
 def stop_execution(client: N8nClient, execution_id: str) -> dict:
     """Stop a running execution."""
-    client.post(f"/executions/{execution_id}/stop")
+    yield Call("post", f"/executions/{execution_id}/stop", retry=True)
     return {"id": execution_id, "message": "Execution stopped"}
+
+
+def select_execution_ids(
+    client: N8nClient,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    skip_retried: bool = False,
+) -> list[str]:
+    """IDs of executions matching the filters; ``since``/``until`` bound startedAt.
+
+    ``skip_retried`` leaves out executions that already have a successful retry.
+    """
+    matches, stop = _window(since, until)
+    ids = []
+    for ex in iter_executions(client, workflow_id=workflow_id, status=status, stop=stop):
+        if matches(ex) and not (skip_retried and ex.get("retrySuccessId")):
+            ids.append(ex["id"])
+            if max_items is not None and len(ids) >= max_items:
+                break
+    return ids
+
+
+def retry_executions_bulk(
+    client: N8nClient,
+    execution_ids: Optional[list[str]] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = "error",
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> dict:
+    """Retry many executions: explicit IDs, or those matching the filters.
+
+    Without ``execution_ids`` the filters select executions (failed ones by
+    default) that have no successful retry yet; ``workflow_id``,
+    ``since``/``until`` or ``max_items`` must bound the selection. Results
+    are per ID with ``succeeded``/``failed`` counts.
+    """
+    _check_selection(execution_ids, workflow_id, since, until, max_items)
+    if execution_ids is None:
+        execution_ids = select_execution_ids(
+            client, workflow_id, status, since, until, max_items, skip_retried=True,
+        )
+    return run_bulk(lambda eid: retry_execution(client, eid), execution_ids, max_concurrency, max_per_second)
+
+
+def stop_executions_bulk(
+    client: N8nClient,
+    execution_ids: Optional[list[str]] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = "running",
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> dict:
+    """Stop many executions: explicit IDs, or those matching the filters (running by default)."""
+    _check_selection(execution_ids, workflow_id, since, until, max_items)
+    if execution_ids is None:
+        execution_ids = select_execution_ids(client, workflow_id, status, since, until, max_items)
+    return run_bulk(lambda eid: stop_execution(client, eid), execution_ids, max_concurrency, max_per_second)
+
+
+# --- Async twins (for AsyncN8nClient) ---
+
+alist_executions = list_executions.aio
+aget_execution = get_execution.aio
+await_for_execution = wait_for_execution.aio
+adelete_execution = delete_execution.aio
+aretry_execution = retry_execution.aio
+astop_execution = stop_execution.aio
+
+
+def aiter_executions(
+    client: AsyncN8nClient,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> AsyncIterator[dict]:
+    """Async twin of ``iter_executions``."""
+    return apaginate(
+        lambda cursor: alist_executions(client, workflow_id=workflow_id, status=status, limit=page_size, cursor=cursor),
+        "executions", max_items=max_items, stop=stop,
+    )
+
+
+async def aget_executions_bulk(
+    client: AsyncN8nClient,
+    execution_ids: list[str],
+    include_data: bool = False,
+    max_concurrency: int = 8,
+) -> dict:
+    """Async twin of ``get_executions_bulk``."""
+    return await arun_bulk(
+        lambda eid: aget_execution(client, eid, include_data=include_data),
+        execution_ids, max_concurrency,
+    )
+
+
+async def aget_execution_streamed(
+    client: AsyncN8nClient,
+    execution_id: str,
+    select: str = "summary",
+    paths: Optional[list[str]] = None,
+) -> dict:
+    """Async twin of ``get_execution_streamed``."""
+    selection = _Selection(select, paths)
+    async with client.get_stream(f"/executions/{execution_id}", params={"includeData": "true"}) as body:
+        async for keys, value in aiter_matches(body, selection.patterns, split=True):
+            selection.add(keys, value)
+    return selection.result()
+
+
+async def aget_execution_document(client: AsyncN8nClient, execution_id: str) -> tuple[dict, int]:
+    """Async twin of ``get_execution_document``."""
+    async with client.get_stream(f"/executions/{execution_id}", params={"includeData": "true"}) as body:
+        return await aload(body)
+
+
+async def aselect_execution_ids(
+    client: AsyncN8nClient,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    skip_retried: bool = False,
+) -> list[str]:
+    """Async twin of ``select_execution_ids``."""
+    matches, stop = _window(since, until)
+    ids = []
+    async for ex in aiter_executions(client, workflow_id=workflow_id, status=status, stop=stop):
+        if matches(ex) and not (skip_retried and ex.get("retrySuccessId")):
+            ids.append(ex["id"])
+            if max_items is not None and len(ids) >= max_items:
+                break
+    return ids
+
+
+async def aretry_executions_bulk(
+    client: AsyncN8nClient,
+    execution_ids: Optional[list[str]] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = "error",
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> dict:
+    """Async twin of ``retry_executions_bulk``."""
+    _check_selection(execution_ids, workflow_id, since, until, max_items)
+    if execution_ids is None:
+        execution_ids = await aselect_execution_ids(
+            client, workflow_id, status, since, until, max_items, skip_retried=True,
+        )
+    return await arun_bulk(
+        lambda eid: aretry_execution(client, eid), execution_ids, max_concurrency, max_per_second,
+    )
+
+
+async def astop_executions_bulk(
+    client: AsyncN8nClient,
+    execution_ids: Optional[list[str]] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = "running",
+    since: Union[str, datetime, None] = None,
+    until: Union[str, datetime, None] = None,
+    max_items: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> dict:
+    """Async twin of ``stop_executions_bulk``."""
+    _check_selection(execution_ids, workflow_id, since, until, max_items)
+    if execution_ids is None:
+        execution_ids = await aselect_execution_ids(client, workflow_id, status, since, until, max_items)
+    return await arun_bulk(
+        lambda eid: astop_execution(client, eid), execution_ids, max_concurrency, max_per_second,
+    )
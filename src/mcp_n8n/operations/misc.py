@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
 
-from ..client import N8nClient
+from ._base import Call, operation
+from ._pagination import StopPredicate, apaginate, paginate
 
+if TYPE_CHECKING:
+    from ..client import AsyncN8nClient, N8nClient
 
+
+@operation
 def list_users(
     client: N8nClient,
     limit: int = 100,
@@ -17,7 +22,7 @@ def list_users(
     if cursor:
         params["cursor"] = cursor
 
-    result = client.get("/users", params=params)
+    result = (yield Call("get", "/users", params=params))
     users = result.get("data", result) if isinstance(result, dict) else result
     if not isinstance(users, list):
         users = [users]
@@ -38,21 +43,37 @@ def list_users(
     }
 
 
+def iter_users(
+    client: N8nClient,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> Iterator[dict]:
+    """Iterate over all users, following nextCursor lazily."""
+    return paginate(
+        lambda cursor: list_users(client, limit=page_size, cursor=cursor),
+        "users", max_items=max_items, stop=stop,
+    )
+
+
+@operation
 def trigger_webhook(
     client: N8nClient,
     webhook_path: str,
     method: str = "POST",
     data: Optional[dict] = None,
     query_params: Optional[dict] = None,
+    resilient: bool = False,
 ) -> dict:
-    """Trigger a webhook endpoint."""
-    return client.webhook(webhook_path, method=method, json=data, params=query_params)
+    """Trigger a webhook endpoint; sent once unless ``resilient`` (see ``N8nClient.webhook``)."""
+    return (yield Call("webhook", webhook_path, method=method, json=data, params=query_params, resilient=resilient))
 
 
+@operation
 def status(client: N8nClient) -> dict:
     """Check n8n connection status and API availability."""
     try:
-        client.get("/workflows", params={"limit": 1})
+        yield Call("get", "/workflows", params={"limit": 1})
     except Exception as e:
         return {
             "status": "error",
@@ -61,7 +82,7 @@ def status(client: N8nClient) -> dict:
         }
 
     try:
-        active_result = client.get("/active-workflows")
+        active_result = (yield Call("get", "/active-workflows"))
         active_count = len(active_result) if isinstance(active_result, list) else 0
     except Exception:
         active_count = 0
@@ -71,3 +92,23 @@ def status(client: N8nClient) -> dict:
         "host": client.base_url,
         "active_workflows": active_count,
     }
+
+
+# --- Async twins (for AsyncN8nClient) ---
+
+alist_users = list_users.aio
+atrigger_webhook = trigger_webhook.aio
+astatus = status.aio
+
+
+def aiter_users(
+    client: AsyncN8nClient,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> AsyncIterator[dict]:
+    """Async twin of ``iter_users``."""
+    return apaginate(
+        lambda cursor: alist_users(client, limit=page_size, cursor=cursor),
+        "users", max_items=max_items, stop=stop,
+    )
@@ -1,12 +1,17 @@
-"""Tag operations — list, create, delete."""
+"""Tag operations — list, iterate, create, delete."""
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
 
-from ..client import N8nClient
+from ._base import Call, operation
+from ._pagination import StopPredicate, apaginate, paginate
 
+if TYPE_CHECKING:
+    from ..client import AsyncN8nClient, N8nClient
 
+
+@operation
 def list_tags(
     client: N8nClient,
     limit: int = 100,
@@ -17,7 +22,7 @@ def list_tags(
     if cursor:
         params["cursor"] = cursor
 
-    result = client.get("/tags", params=params)
+    result = (yield Call("get", "/tags", params=params))
     tags = result.get("data", result) if isinstance(result, dict) else result
     if not isinstance(tags, list):
         tags = [tags]
@@ -36,12 +41,47 @@ def list_tags(
     }
 
 
+def iter_tags(
+    client: N8nClient,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> Iterator[dict]:
+    """Iterate over all tags, following nextCursor lazily."""
+    return paginate(
+        lambda cursor: list_tags(client, limit=page_size, cursor=cursor),
+        "tags", max_items=max_items, stop=stop,
+    )
+
+
+@operation
 def create_tag(client: N8nClient, name: str) -> dict:
     """Create a new tag."""
-    return client.post("/tags", json={"name": name})
+    return (yield Call("post", "/tags", json={"name": name}))
 
 
+@operation
 def delete_tag(client: N8nClient, tag_id: str) -> dict:
     """Delete a tag."""
-    client.delete(f"/tags/{tag_id}")
+    yield Call("delete", f"/tags/{tag_id}")
     return {"status": "deleted", "tag_id": tag_id}
+
+
+# --- Async twins (for AsyncN8nClient) ---
+
+alist_tags = list_tags.aio
+acreate_tag = create_tag.aio
+adelete_tag = delete_tag.aio
+
+
+def aiter_tags(
+    client: AsyncN8nClient,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> AsyncIterator[dict]:
+    """Async twin of ``iter_tags``."""
+    return apaginate(
+        lambda cursor: alist_tags(client, limit=page_size, cursor=cursor),
+        "tags", max_items=max_items, stop=stop,
+    )
@@ -1,12 +1,20 @@
-"""Workflow operations — list, get, create, update, delete, activate, deactivate, execute, list_active."""
+"""Workflow operations — list, iterate, get, bulk get, create, update, delete, activate, deactivate, execute, execute and wait, list_active."""
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, Optional
 
-from ..client import N8nClient
+from ._base import Call, operation
+from ._bulk import arun_bulk, run_bulk
+from ._diff import diff_workflow, patch_nodes
+from ._pagination import StopPredicate, apaginate, paginate
+from .executions import wait_for_execution
 
+if TYPE_CHECKING:
+    from ..client import AsyncN8nClient, N8nClient
 
+
+@operation
 def list_workflows(
     client: N8nClient,
     active: Optional[bool] = None,
@@ -23,7 +31,7 @@ def list_workflows(
     if cursor:
         params["cursor"] = cursor
 
-    result = client.get("/workflows", params=params)
+    result = (yield Call("get", "/workflows", params=params))
     workflows = result.get("data", result) if isinstance(result, dict) else result
     if not isinstance(workflows, list):
         workflows = [workflows]
@@ -44,11 +52,33 @@ def list_workflows(
     }
 
 
+def iter_workflows(
+    client: N8nClient,
+    active: Optional[bool] = None,
+    tags: Optional[str] = None,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> Iterator[dict]:
+    """Iterate over all workflows, following nextCursor lazily."""
+    return paginate(
+        lambda cursor: list_workflows(client, active=active, tags=tags, limit=page_size, cursor=cursor),
+        "workflows", max_items=max_items, stop=stop,
+    )
+
+
+@operation
 def get_workflow(client: N8nClient, workflow_id: str) -> dict:
     """Get detailed information about a specific workflow."""
-    return client.get(f"/workflows/{workflow_id}")
+    return (yield Call("get", f"/workflows/{workflow_id}"))
+
+
+def get_workflows_bulk(client: N8nClient, workflow_ids: list[str], max_concurrency: int = 8) -> dict:
+    """Get many workflows concurrently; results are in input order with per-ID errors."""
+    return run_bulk(lambda wid: get_workflow(client, wid), workflow_ids, max_concurrency)
 
 
+@operation
 def create_workflow(
     client: N8nClient,
     name: str,
@@ -63,9 +93,10 @@ def create_workflow(
         data["settings"] = settings
     if static_data:
         data["staticData"] = static_data
-    return client.post("/workflows", json=data)
+    return (yield Call("post", "/workflows", json=data))
 
 
+@operation
 def update_workflow(
     client: N8nClient,
     workflow_id: str,
@@ -74,8 +105,38 @@ def update_workflow(
     connections: Optional[dict] = None,
     settings: Optional[dict] = None,
     active: Optional[bool] = None,
+    node_patches: Optional[dict[str, Optional[dict]]] = None,
+    diff: bool = False,
 ) -> dict:
-    """Update an existing workflow."""
+    """Update an existing workflow.
+
+    With ``diff`` (implied by ``node_patches``), the current workflow is
+    fetched (from the client's cache if it has one) and the given fields
+    replace its own; ``node_patches`` then merge-patches single nodes by name
+    or ID (``None`` removes a node). Nothing is sent when the result is
+    structurally the same; otherwise the merged definition is. Returns
+    ``{"id", "updated", "changes", "workflow"}`` (see ``diff_workflow``).
+    """
+    if diff or node_patches:
+        current = (yield Call("get", f"/workflows/{workflow_id}"))
+        desired = {
+            "name": current.get("name") if name is None else name,
+            "nodes": (current.get("nodes") or []) if nodes is None else nodes,
+            "connections": (current.get("connections") or {}) if connections is None else connections,
+            "settings": (current.get("settings") or {}) if settings is None else settings,
+        }
+        if node_patches:
+            desired["nodes"], desired["connections"] = patch_nodes(
+                desired["nodes"], desired["connections"], node_patches,
+            )
+        if active is not None:
+            desired["active"] = active
+        changes = diff_workflow(current, desired)
+        if not changes:
+            return {"id": workflow_id, "updated": False, "changes": {}, "workflow": current}
+        result = (yield Call("put", f"/workflows/{workflow_id}", json=desired))
+        return {"id": workflow_id, "updated": True, "changes": changes, "workflow": result}
+
     data: dict = {}
     if name is not None:
         data["name"] = name
@@ -87,41 +148,108 @@ def update_workflow(
         data["settings"] = settings
     if active is not None:
         data["active"] = active
-    return client.put(f"/workflows/{workflow_id}", json=data)
+    return (yield Call("put", f"/workflows/{workflow_id}", json=data))
 
 
+@operation
 def delete_workflow(client: N8nClient, workflow_id: str) -> dict:
     """Delete a workflow."""
-    client.delete(f"/workflows/{workflow_id}")
+    yield Call("delete", f"/workflows/{workflow_id}")
     return {"status": "deleted", "workflow_id": workflow_id}
 
 
+@operation
 def activate_workflow(client: N8nClient, workflow_id: str) -> dict:
     """Activate a workflow to enable its triggers."""
-    client.post(f"/workflows/{workflow_id}/activate")
+    yield Call("post", f"/workflows/{workflow_id}/activate", retry=True)
     return {"id": workflow_id, "active": True, "message": "Workflow activated successfully"}
 
 
+@operation
 def deactivate_workflow(client: N8nClient, workflow_id: str) -> dict:
     """Deactivate a workflow to disable its triggers."""
-    client.post(f"/workflows/{workflow_id}/deactivate")
+    yield Call("post", f"/workflows/{workflow_id}/deactivate", retry=True)
     return {"id": workflow_id, "active": False, "message": "Workflow deactivated successfully"}
 
 
+@operation
 def execute_workflow(client: N8nClient, workflow_id: str, data: Optional[dict] = None) -> dict:
     """Execute a workflow manually with optional input data."""
     payload = {}
     if data:
         payload["data"] = data
-    return client.post(f"/workflows/{workflow_id}/run", json=payload if payload else None)
+    return (yield Call("post", f"/workflows/{workflow_id}/run", json=payload if payload else None))
+
+
+def started_execution_id(result: dict) -> Optional[str]:
+    """Execution ID from a run/retry response, whichever shape n8n returned."""
+    if not isinstance(result, dict):
+        return None
+    data = result.get("data") if isinstance(result.get("data"), dict) else {}
+    found = result.get("executionId") or data.get("executionId") or result.get("id")
+    return str(found) if found is not None else None
+
 
+@operation
+def execute_workflow_and_wait(
+    client: N8nClient,
+    workflow_id: str,
+    data: Optional[dict] = None,
+    timeout: float = 300.0,
+    on_node: Optional[Callable[[str, dict], None]] = None,
+) -> dict:
+    """Execute a workflow and wait for its execution to finish (see ``wait_for_execution``)."""
+    payload = {"data": data} if data else None
+    started = (yield Call("post", f"/workflows/{workflow_id}/run", json=payload))
+    execution_id = started_execution_id(started)
+    if execution_id is None:
+        raise ValueError(f"n8n did not return an execution ID for workflow {workflow_id}: {started!r}")
+    return (yield from wait_for_execution.__wrapped__(client, execution_id, timeout=timeout, on_node=on_node))
 
+
+@operation
 def list_active_workflows(client: N8nClient) -> list:
     """List all currently active workflow IDs."""
-    result = client.get("/active-workflows")
+    result = (yield Call("get", "/active-workflows"))
     return result if isinstance(result, list) else [result]
 
 
+@operation
 def get_activation_error(client: N8nClient, workflow_id: str) -> dict:
     """Get activation error for a specific workflow."""
-    return client.get(f"/active-workflows/error/{workflow_id}")
+    return (yield Call("get", f"/active-workflows/error/{workflow_id}"))
+
+
+# --- Async twins (for AsyncN8nClient) ---
+
+alist_workflows = list_workflows.aio
+aget_workflow = get_workflow.aio
+acreate_workflow = create_workflow.aio
+aupdate_workflow = update_workflow.aio
+adelete_workflow = delete_workflow.aio
+aactivate_workflow = activate_workflow.aio
+adeactivate_workflow = deactivate_workflow.aio
+aexecute_workflow = execute_workflow.aio
+aexecute_workflow_and_wait = execute_workflow_and_wait.aio
+alist_active_workflows = list_active_workflows.aio
+aget_activation_error = get_activation_error.aio
+
+
+def aiter_workflows(
+    client: AsyncN8nClient,
+    active: Optional[bool] = None,
+    tags: Optional[str] = None,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    stop: Optional[StopPredicate] = None,
+) -> AsyncIterator[dict]:
+    """Async twin of ``iter_workflows``."""
+    return apaginate(
+        lambda cursor: alist_workflows(client, active=active, tags=tags, limit=page_size, cursor=cursor),
+        "workflows", max_items=max_items, stop=stop,
+    )
+
+
+async def aget_workflows_bulk(client: AsyncN8nClient, workflow_ids: list[str], max_concurrency: int = 8) -> dict:
+    """Async twin of ``get_workflows_bulk``."""
+    return await arun_bulk(lambda wid: aget_workflow(client, wid), workflow_ids, max_concurrency)
@@ -0,0 +1,247 @@
+"""Retention purge of executions with bounded parallel deletes.
+
+Streams execution IDs from ``list_executions`` (optionally by workflow and
+status), keeps those that started before a cutoff, and deletes them in
+batches with bounded concurrency and an optional deletes-per-second cap.
+A dry run only counts matches. With a checkpoint file, an interrupted purge
+resumes with the same cutoff and restarts the listing from the page it had
+reached. ``apurge_executions`` is the async twin for ``AsyncN8nClient``.
+
+Usage:
+    from mcp_n8n.purge import purge_executions
+
+    purge_executions(client, older_than_days=30, dry_run=True)
+    purge_executions(client, older_than_days=30, max_per_second=20)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Union
+
+from ._checkpoint import id_key, load_checkpoint, save_checkpoint
+from .operations import executions
+from .operations._bulk import arun_bulk, run_bulk
+from .operations._time import parse_timestamp
+
+if TYPE_CHECKING:
+    from .client import AsyncN8nClient, N8nClient
+
+_SAMPLE_SIZE = 10
+_PAGE_SIZE = 100
+
+
+def resolve_cutoff(
+    older_than_days: Optional[float] = None,
+    before: Union[str, datetime, None] = None,
+) -> Optional[str]:
+    """ISO-8601 cutoff from ``before`` or ``older_than_days`` (None if neither)."""
+    if before is not None:
+        return parse_timestamp(before).isoformat()
+    if older_than_days is not None:
+        return (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+    return None
+
+
+class _Purge:
+    """Filters, checkpoint and counters of one purge, shared by both drivers."""
+
+    def __init__(
+        self,
+        older_than_days: Optional[float],
+        before: Union[str, datetime, None],
+        workflow_id: Optional[str],
+        status: Optional[str],
+        dry_run: bool,
+        batch_size: int,
+        checkpoint_path: Optional[str],
+    ) -> None:
+        if older_than_days is None and before is None and workflow_id is None and status is None:
+            raise ValueError("Refusing to purge every execution: pass older_than_days, before, workflow_id or status")
+
+        filters = {
+            "older_than_days": older_than_days,
+            "before": before.isoformat() if isinstance(before, datetime) else before,
+            "workflow_id": workflow_id,
+            "status": status,
+        }
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path if not dry_run else None
+        checkpoint = load_checkpoint(checkpoint_path, filters) if self.checkpoint_path else None
+        self.state = checkpoint or {
+            "filters": filters,
+            "cutoff": resolve_cutoff(older_than_days, before),
+            "cursor": None,
+            "last_id": None,
+            "deleted": 0,
+            "failed": 0,
+        }
+        self.cutoff = parse_timestamp(self.state["cutoff"])
+        last_id = self.state["last_id"]
+        self.resume_after = id_key(last_id) if last_id is not None else None
+        # Cursor of the page holding the last deleted execution; the listing restarts there.
+        self.cursor: Optional[str] = self.state.get("cursor")
+        self.batch: list[str] = []
+        self.batch_cursor: Optional[str] = None
+        self.stats = {
+            "dry_run": dry_run,
+            "cutoff": self.state["cutoff"],
+            "matched": 0,
+            "deleted": self.state["deleted"],
+            "failed": self.state["failed"],
+            "skipped": 0,
+            "errors": [],
+        }
+        if dry_run:
+            self.stats["sample_ids"] = []
+
+    def add(self, ex: dict, cursor: Optional[str]) -> bool:
+        """Take one listed execution from the page at ``cursor``; True when a batch is due."""
+        if self.resume_after is not None and id_key(ex["id"]) >= self.resume_after:
+            self.stats["skipped"] += 1
+            return False
+        if self.cutoff is not None:
+            started = parse_timestamp(ex.get("startedAt"))
+            if started is None or started >= self.cutoff:
+                return False
+        self.stats["matched"] += 1
+        if self.dry_run:
+            if len(self.stats["sample_ids"]) < _SAMPLE_SIZE:
+                self.stats["sample_ids"].append(ex["id"])
+            return self.stats["matched"] % self.batch_size == 0
+        self.batch.append(ex["id"])
+        self.batch_cursor = cursor
+        return len(self.batch) >= self.batch_size
+
+    def take(self) -> list[str]:
+        """The pending batch of IDs to delete (empty on a dry run)."""
+        batch, self.batch = self.batch, []
+        return batch
+
+    def record(self, batch: list[str], result: dict) -> None:
+        """Count a finished batch of deletes and checkpoint past it."""
+        stats = self.stats
+        stats["deleted"] += result["succeeded"]
+        stats["failed"] += result["failed"]
+        for failure in (r for r in result["results"] if not r["ok"]):
+            if len(stats["errors"]) < _SAMPLE_SIZE:
+                stats["errors"].append({k: failure[k] for k in ("id", "error", "status_code")})
+        if self.checkpoint_path:
+            save_checkpoint(
+                self.checkpoint_path,
+                dict(
+                    self.state, cursor=self.batch_cursor, last_id=batch[-1],
+                    deleted=stats["deleted"], failed=stats["failed"],
+                ),
+            )
+
+    def finish(self) -> dict:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return self.stats
+
+
+def _next_cursor(page: dict, cursor: Optional[str]) -> Optional[str]:
+    following = page.get("nextCursor")
+    return following if following and following != cursor else None
+
+
+def purge_executions(
+    client: N8nClient,
+    older_than_days: Optional[float] = None,
+    before: Union[str, datetime, None] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    dry_run: bool = False,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+    batch_size: int = 100,
+    checkpoint_path: Optional[str] = None,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """Delete (or with ``dry_run`` count) executions matching the filters.
+
+    Executions match when they belong to ``workflow_id``, have ``status`` and
+    started before the cutoff (``before``, or ``older_than_days`` ago); at
+    least one filter is required. Deletes run ``max_concurrency`` at a time
+    and at most ``max_per_second`` per second.
+    """
+    job = _Purge(older_than_days, before, workflow_id, status, dry_run, batch_size, checkpoint_path)
+
+    def flush() -> None:
+        batch = job.take()
+        if batch:
+            job.record(batch, run_bulk(
+                lambda eid: executions.delete_execution(client, eid), batch, max_concurrency, max_per_second,
+            ))
+        if progress is not None:
+            progress(dict(job.stats))
+
+    cursor = job.cursor
+    while True:
+        page = executions.list_executions(
+            client, workflow_id=workflow_id, status=status, limit=_PAGE_SIZE, cursor=cursor,
+        )
+        for ex in page["executions"]:
+            if job.add(ex, cursor):
+                flush()
+        cursor = _next_cursor(page, cursor)
+        if cursor is None:
+            break
+    if job.batch:
+        flush()
+    return job.finish()
+
+
+async def apurge_executions(
+    client: AsyncN8nClient,
+    older_than_days: Optional[float] = None,
+    before: Union[str, datetime, None] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    dry_run: bool = False,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+    batch_size: int = 100,
+    checkpoint_path: Optional[str] = None,
+    progress: Optional[Callable[[dict], Awaitable[None]]] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+) -> dict:
+    """Async twin of ``purge_executions``; ``progress`` is awaited.
+
+    With ``limit``, each listing page and each batch of deletes holds the
+    semaphore only while it runs, so a long purge takes turns with other work.
+    """
+    job = _Purge(older_than_days, before, workflow_id, status, dry_run, batch_size, checkpoint_path)
+    turn = limit if limit is not None else contextlib.nullcontext()
+
+    async def flush() -> None:
+        batch = job.take()
+        if batch:
+            async with turn:
+                result = await arun_bulk(
+                    lambda eid: executions.adelete_execution(client, eid), batch, max_concurrency, max_per_second,
+                )
+            job.record(batch, result)
+        if progress is not None:
+            await progress(dict(job.stats))
+
+    cursor = job.cursor
+    while True:
+        async with turn:
+            page = await executions.alist_executions(
+                client, workflow_id=workflow_id, status=status, limit=_PAGE_SIZE, cursor=cursor,
+            )
+        for ex in page["executions"]:
+            if job.add(ex, cursor):
+                await flush()
+        cursor = _next_cursor(page, cursor)
+        if cursor is None:
+            break
+    if job.batch:
+        await flush()
+    return job.finish()
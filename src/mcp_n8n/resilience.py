@@ -0,0 +1,191 @@
+"""Retry with backoff and a per-host circuit breaker for the n8n clients.
+
+Transient failures (connection errors and 429/502/503/504 responses) are
+retried with exponential backoff and full jitter, honouring ``Retry-After``.
+Only idempotent methods are retried automatically; a POST is retried only when
+the caller opts in (``client.post(..., retry=True)``). Each n8n host has one
+circuit breaker shared by all clients: after ``circuit_failure_threshold``
+consecutive failures calls fail fast with ``CircuitOpenError`` until
+``circuit_reset_timeout`` has passed, then a single trial call is let through.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling n8n while its circuit breaker is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"n8n at {host} is unavailable; circuit open for another {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, at.timestamp() - (time.time() if now is None else now))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How many times and how long to wait before retrying a request."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> RetryPolicy:
+        return cls(
+            max_retries=settings.retry_max_retries,
+            backoff_base=settings.retry_backoff_base,
+            backoff_max=settings.retry_backoff_max,
+        )
+
+    def should_retry(self, method: str, attempt: int, opt_in: bool = False) -> bool:
+        """Whether a failed ``attempt`` (0-based) of ``method`` may be retried."""
+        return attempt < self.max_retries and (opt_in or method.upper() in IDEMPOTENT_METHODS)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Seconds to sleep before retry number ``attempt + 1``, or None to give up.
+
+        ``Retry-After`` is honoured as given; a server asking for longer than
+        ``backoff_max`` is not retried.
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.backoff_max else None
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one host."""
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.state = CLOSED
+
+    def before_call(self) -> bool:
+        """Raise ``CircuitOpenError`` unless a call may go through now.
+
+        Returns True if the call is the half-open trial; a trial that ends
+        without ``record_success``/``record_failure`` must ``release_trial``.
+        """
+        if self.failure_threshold <= 0:
+            return False
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            raise CircuitOpenError(self.host, max(0.0, remaining))
+
+    def release_trial(self) -> None:
+        """Let another call be the trial after one ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_running = False
+            self.state = CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self.state == HALF_OPEN or (
+                self.failure_threshold > 0 and self._failures >= self.failure_threshold
+            ):
+                self.state = OPEN
+                self._opened_at = self._clock()
+
+    def reset(self) -> None:
+        self.record_success()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"host": self.host, "state": self.state, "failures": self._failures}
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def host_key(url: str) -> str:
+    """``scheme://host:port`` of ``url``, the key for per-host state."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def breaker_for(url: str, settings: Any) -> CircuitBreaker:
+    """The shared circuit breaker for the host of ``url``."""
+    host = host_key(url)
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=settings.circuit_failure_threshold,
+                reset_timeout=settings.circuit_reset_timeout,
+            )
+        return breaker
+
+
+def reset_breakers() -> None:
+    """Forget all circuit breaker state (e.g. between tests)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def is_host_failure(status_code: Optional[int]) -> bool:
+    """Whether a response (None for a connection error) counts against the breaker."""
+    return status_code is None or status_code >= 500
+
+
+def is_overload(status_code: int) -> bool:
+    """Whether a response says the host is overloaded (429 or 5xx)."""
+    return status_code == 429 or status_code >= 500
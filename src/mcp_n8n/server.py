@@ -1,56 +1,306 @@
 """n8n MCP Server — backward-compatible @mcp.tool wrappers.
 
-Tool names match the original server.py for drop-in replacement.
+Tool names match the original server.py for drop-in replacement. Tools are
+coroutines backed by AsyncN8nClient, so a slow call does not stall the others;
+at most ``N8N_MAX_CONCURRENT_TOOLS`` calls hit n8n at once. The client, the
+mirror and the operation, view and budget modules are imported by the tools
+that use them, keeping them out of server start-up.
+
+With ``N8N_MIRROR_PATH`` set, workflow reads are served from a local SQLite
+mirror while it is younger than ``N8N_MIRROR_MAX_AGE``; the mirror is warmed
+in the background at startup.
+
+Results are compact JSON (``N8N_JSON_INDENT`` to indent). Read tools take a
+``view`` preset and ``fields`` projection (see ``mcp_n8n.views``); encoded
+workflows and finished executions are cached until they change. Workflow and
+execution reads also take a byte or token budget (see ``mcp_n8n.budget``).
+
+``n8n_client_metrics`` reports per-route request metrics; with
+``N8N_METRICS_PORT`` set they are also served as Prometheus text on
+``/metrics``. Tool calls run the tool hooks (see ``mcp_n8n.hooks``), which
+write cProfile/tracemalloc profiles of the tools in ``N8N_PROFILE_TOOLS`` to
+``N8N_PROFILE_DIR``.
 """
 
 from __future__ import annotations
 
-import json
-from typing import Optional
+import asyncio
+import secrets
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional, Sequence
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from fastmcp.server.middleware import Middleware
 
-from .client import N8nClient
-from .operations import credentials, executions, misc, tags, workflows
+from .config import get_settings
+
+if TYPE_CHECKING:
+    from .budget import SourceCache
+    from .client import AsyncN8nClient
+    from .hooks import Hook
+    from .mirror import WorkflowMirror
+    from .views import OutputCache
 
 mcp = FastMCP("n8n-mcp")
 
-_client: N8nClient | None = None
+_client: AsyncN8nClient | None = None
+_limit: asyncio.Semaphore | None = None
+_mirror: WorkflowMirror | None = None
+_output_cache: OutputCache | None = None
+_source_cache: SourceCache | None = None
+_tool_hooks: list[Hook] | None = None
+# Purge confirmation token -> (filters it was issued for, monotonic expiry).
+_purge_tokens: dict[str, tuple[dict, int, float]] = {}
+PURGE_TOKEN_TTL = 600.0
 
 
-def _get_client() -> N8nClient:
+def _get_client() -> AsyncN8nClient:
     global _client
     if _client is None:
-        _client = N8nClient()
+        from .client import AsyncN8nClient
+
+        _client = AsyncN8nClient()
     return _client
 
 
+def _get_limit() -> asyncio.Semaphore:
+    """Cap on tool calls talking to n8n at the same time."""
+    global _limit
+    if _limit is None:
+        _limit = asyncio.Semaphore(get_settings().max_concurrent_tools)
+    return _limit
+
+
+def _get_output_cache() -> OutputCache:
+    global _output_cache
+    if _output_cache is None:
+        from .views import OutputCache
+
+        _output_cache = OutputCache(get_settings().output_cache_entries)
+    return _output_cache
+
+
+def _get_source_cache() -> SourceCache:
+    """Documents recently trimmed to a budget, for n8n_get_omitted."""
+    global _source_cache
+    if _source_cache is None:
+        from .budget import SourceCache
+
+        _source_cache = SourceCache(get_settings().budget_source_cache_bytes)
+    return _source_cache
+
+
+def _get_tool_hooks() -> list[Hook]:
+    global _tool_hooks
+    if _tool_hooks is None:
+        from .hooks import tool_hooks
+
+        _tool_hooks = tool_hooks(get_settings())
+    return _tool_hooks
+
+
+class _ToolHooks(Middleware):
+    """Runs the tool hooks (N8N_PROFILE_TOOLS profiling) around every tool call."""
+
+    async def on_call_tool(self, context: Any, call_next: Callable[[Any], Awaitable[Any]]) -> Any:
+        hooks = _get_tool_hooks()
+        if not hooks:
+            return await call_next(context)
+        from .hooks import CallInfo, run_after, run_before, run_error
+
+        call = CallInfo("tool", context.message.name)
+        run_before(hooks, call)
+        try:
+            result = await call_next(context)
+        except BaseException as e:
+            run_error(hooks, call, e)
+            raise
+        run_after(hooks, call, result)
+        return result
+
+
+mcp.add_middleware(_ToolHooks())
+
+
+def _encode(
+    result: Any,
+    kind: Optional[str] = None,
+    view: str = "full",
+    fields: Optional[Sequence[str]] = None,
+    cached: bool = False,
+) -> str:
+    """Shape a result with a view or field projection and encode it as JSON."""
+    from .views import render
+
+    cache = _get_output_cache() if cached else None
+    return render(result, kind, view, fields, get_settings().json_indent, cache)
+
+
+def _encode_budgeted(
+    result: Any,
+    kind: str,
+    doc_id: str,
+    view: str,
+    fields: Optional[Sequence[str]],
+    max_bytes: Optional[int],
+    max_tokens: Optional[int],
+    size: Optional[int] = None,
+) -> str:
+    """Like ``_encode`` for one document, trimmed to the byte/token budget if one is given."""
+    from .budget import budget_bytes, trim
+    from .views import document_version, shape
+
+    limit = budget_bytes(max_bytes, max_tokens)
+    if limit is None:
+        return _encode(result, kind, view, fields, cached=True)
+    shaped = shape(result, kind, view, fields)
+    trimmed = trim(shaped, limit, kind, doc_id, size=size if shaped is result else None)
+    if trimmed is not shaped and document_version(result, kind) is not None:
+        # Continuations are served from this copy instead of fetching the document again.
+        budget = trimmed.get("_budget", {}) if isinstance(trimmed, dict) else {}
+        _get_source_cache().put(kind, doc_id, result, size or budget.get("original_bytes", 0))
+    return _encode(trimmed)
+
+
+async def _call(op: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+    """Run an async operation under the concurrency cap."""
+    async with _get_limit():
+        return await op(_get_client(), *args, **kwargs)
+
+
+async def _run(op: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> str:
+    """Run an async operation under the concurrency cap and encode the result."""
+    return _encode(await _call(op, *args, **kwargs))
+
+
+async def _collect(
+    iterate: Callable[..., AsyncIterator[dict]],
+    key: str,
+    kind: Optional[str] = None,
+    view: str = "full",
+    fields: Optional[Sequence[str]] = None,
+    **kwargs: Any,
+) -> str:
+    """Follow every page of a list operation, up to ``N8N_MAX_LIST_ITEMS`` items."""
+    cap = get_settings().max_list_items
+    async with _get_limit():
+        items = [item async for item in iterate(_get_client(), max_items=cap + 1, **kwargs)]
+    return _encode({key: items[:cap], "nextCursor": None, "truncated": len(items) > cap}, kind, view, fields)
+
+
+def _get_mirror() -> WorkflowMirror | None:
+    """Local workflow mirror, if N8N_MIRROR_PATH is set."""
+    global _mirror
+    if _mirror is None:
+        path = get_settings().mirror_path
+        if path:
+            from .client import N8nClient
+            from .mirror import WorkflowMirror
+
+            _mirror = WorkflowMirror(N8nClient(), path)
+    return _mirror
+
+
+def _fresh_mirror() -> WorkflowMirror | None:
+    """Mirror to read from, or None (starting a background sync) if it is too old."""
+    mirror = _get_mirror()
+    if mirror is None:
+        return None
+    if mirror.is_fresh(get_settings().mirror_max_age):
+        return mirror
+    mirror.sync_in_background()
+    return None
+
+
+def _mirror_changed(workflow_id: str, removed: bool = False) -> None:
+    mirror = _get_mirror()
+    if mirror is None:
+        return
+    if removed:
+        mirror.remove(workflow_id)
+    else:
+        mirror.invalidate(workflow_id)
+
+
 # --- Workflows ---
 
 @mcp.tool
-def n8n_list_workflows(
+async def n8n_list_workflows(
     active: Optional[bool] = None,
     tags: Optional[str] = None,
     limit: int = 100,
     cursor: Optional[str] = None,
+    all_pages: bool = False,
+    view: str = "standard",
+    fields: Optional[list[str]] = None,
 ) -> str:
-    """List all workflows with optional filtering."""
-    return json.dumps(
-        workflows.list_workflows(
-            _get_client(), active=active, tags=tags, limit=limit, cursor=cursor,
-        ),
-        indent=2,
-    )
+    """List all workflows with optional filtering.
+
+    Set all_pages to follow every page (capped by N8N_MAX_LIST_ITEMS).
+    view is summary (names, tags, node types), standard or full; fields
+    (e.g. ["id", "name", "nodes.type"]) keeps only those paths.
+    """
+    from .operations import workflows
+
+    if all_pages:
+        return await _collect(
+            workflows.aiter_workflows, "workflows", "workflow", view, fields,
+            active=active, tags=tags, page_size=limit,
+        )
+    # Mirror lookups touch SQLite and wait on a running sync, so keep them off the event loop.
+    if cursor and cursor.startswith("mirror:"):
+        mirror = await asyncio.to_thread(_get_mirror)
+    else:
+        mirror = await asyncio.to_thread(_fresh_mirror) if cursor is None else None
+    if mirror is not None:
+        result = await asyncio.to_thread(
+            mirror.list_workflows, active=active, tags=tags, limit=limit, cursor=cursor,
+        )
+    else:
+        result = await _call(workflows.alist_workflows, active=active, tags=tags, limit=limit, cursor=cursor)
+    return _encode(result, "workflow", view, fields)
+
+
+@mcp.tool
+async def n8n_get_workflow(
+    workflow_id: str,
+    view: str = "standard",
+    fields: Optional[list[str]] = None,
+    max_bytes: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Get detailed information about a specific workflow.
+
+    view: summary (names, tags, node types), standard (without pinned/static
+    data) or full; fields (e.g. ["nodes.name", "nodes.parameters"]) keeps
+    only those paths. With max_bytes/max_tokens, a larger result is trimmed
+    and omitted parts carry a handle for n8n_get_omitted.
+    """
+    from .operations import workflows
+
+    mirror = await asyncio.to_thread(_fresh_mirror)
+    workflow = await asyncio.to_thread(mirror.get_workflow, workflow_id) if mirror is not None else None
+    if workflow is None:
+        workflow = await _call(workflows.aget_workflow, workflow_id)
+    return _encode_budgeted(workflow, "workflow", workflow_id, view, fields, max_bytes, max_tokens)
 
 
 @mcp.tool
-def n8n_get_workflow(workflow_id: str) -> str:
-    """Get detailed information about a specific workflow."""
-    return json.dumps(workflows.get_workflow(_get_client(), workflow_id), indent=2)
+async def n8n_get_workflows_bulk(
+    workflow_ids: list[str],
+    max_concurrency: int = 8,
+    view: str = "standard",
+    fields: Optional[list[str]] = None,
+) -> str:
+    """Get many workflows in one call; results are in input order with per-ID errors."""
+    from .operations import workflows
+
+    result = await _call(workflows.aget_workflows_bulk, workflow_ids, max_concurrency=max_concurrency)
+    return _encode(result, "workflow", view, fields)
 
 
 @mcp.tool
-def n8n_create_workflow(
+async def n8n_create_workflow(
     name: str,
     nodes: list,
     connections: dict,
@@ -58,203 +308,558 @@ def n8n_create_workflow(
     static_data: Optional[dict] = None,
 ) -> str:
     """Create a new workflow."""
-    return json.dumps(
-        workflows.create_workflow(
-            _get_client(), name, nodes, connections,
-            settings=settings, static_data=static_data,
-        ),
-        indent=2,
+    from .operations import workflows
+
+    return await _run(
+        workflows.acreate_workflow,
+        name, nodes, connections,
+        settings=settings, static_data=static_data,
     )
 
 
 @mcp.tool
-def n8n_update_workflow(
+async def n8n_update_workflow(
     workflow_id: str,
     name: Optional[str] = None,
     nodes: Optional[list] = None,
     connections: Optional[dict] = None,
     settings: Optional[dict] = None,
     active: Optional[bool] = None,
+    node_patches: Optional[dict[str, Optional[dict]]] = None,
+    diff: bool = False,
 ) -> str:
-    """Update an existing workflow."""
-    return json.dumps(
-        workflows.update_workflow(
-            _get_client(), workflow_id,
-            name=name, nodes=nodes, connections=connections,
-            settings=settings, active=active,
-        ),
-        indent=2,
+    """Update an existing workflow.
+
+    Given fields replace the workflow's own; node_patches merge-patches
+    single nodes by name or ID (e.g. {"HTTP Request": {"parameters": {"url":
+    "..."}}}; null removes a key, or the whole node). With diff (implied by
+    node_patches) nothing is written when the result is unchanged, and the
+    reply lists what changed instead of returning the workflow.
+    """
+    from .operations import workflows
+
+    result = await _call(
+        workflows.aupdate_workflow,
+        workflow_id,
+        name=name, nodes=nodes, connections=connections,
+        settings=settings, active=active, node_patches=node_patches, diff=diff,
     )
+    if not diff and not node_patches:
+        await asyncio.to_thread(_mirror_changed, workflow_id)
+        return _encode(result)
+    if result["updated"]:
+        await asyncio.to_thread(_mirror_changed, workflow_id)
+    workflow = result["workflow"] if isinstance(result["workflow"], dict) else {}
+    result["workflow"] = {k: workflow.get(k) for k in ("id", "name", "active", "versionId", "updatedAt")}
+    return _encode(result)
 
 
 @mcp.tool
-def n8n_delete_workflow(workflow_id: str) -> str:
+async def n8n_delete_workflow(workflow_id: str) -> str:
     """Delete a workflow."""
-    return json.dumps(workflows.delete_workflow(_get_client(), workflow_id), indent=2)
+    from .operations import workflows
+
+    result = await _run(workflows.adelete_workflow, workflow_id)
+    await asyncio.to_thread(_mirror_changed, workflow_id, removed=True)
+    return result
 
 
 @mcp.tool
-def n8n_activate_workflow(workflow_id: str) -> str:
+async def n8n_activate_workflow(workflow_id: str) -> str:
     """Activate a workflow to enable its triggers."""
-    return json.dumps(workflows.activate_workflow(_get_client(), workflow_id), indent=2)
+    from .operations import workflows
+
+    result = await _run(workflows.aactivate_workflow, workflow_id)
+    await asyncio.to_thread(_mirror_changed, workflow_id)
+    return result
 
 
 @mcp.tool
-def n8n_deactivate_workflow(workflow_id: str) -> str:
+async def n8n_deactivate_workflow(workflow_id: str) -> str:
     """Deactivate a workflow to disable its triggers."""
-    return json.dumps(workflows.deactivate_workflow(_get_client(), workflow_id), indent=2)
+    from .operations import workflows
+
+    result = await _run(workflows.adeactivate_workflow, workflow_id)
+    await asyncio.to_thread(_mirror_changed, workflow_id)
+    return result
 
 
 @mcp.tool
-def n8n_execute_workflow(workflow_id: str, data: Optional[dict] = None) -> str:
+async def n8n_execute_workflow(workflow_id: str, data: Optional[dict] = None) -> str:
     """Execute a workflow manually with optional input data."""
-    return json.dumps(workflows.execute_workflow(_get_client(), workflow_id, data=data), indent=2)
+    from .operations import workflows
+
+    return await _run(workflows.aexecute_workflow, workflow_id, data=data)
 
 
 @mcp.tool
-def n8n_list_active_workflows() -> str:
+async def n8n_execute_workflow_and_wait(
+    workflow_id: str,
+    data: Optional[dict] = None,
+    timeout: float = 60.0,
+    select: str = "summary",
+) -> str:
+    """Execute a workflow and wait for it to finish, instead of polling n8n_get_execution.
+
+    Returns the finished execution shaped by select (summary, errors or
+    last_node), or its last status with timedOut set after timeout seconds.
+    """
+    from .operations import executions, workflows
+
+    async with _get_limit():
+        started = await workflows.aexecute_workflow(_get_client(), workflow_id, data=data)
+    execution_id = workflows.started_execution_id(started)
+    if execution_id is None:
+        return _encode(started)
+    try:
+        await executions.await_for_execution(_get_client(), execution_id, timeout=timeout)
+    except TimeoutError:
+        async with _get_limit():
+            last = await executions.aget_execution(_get_client(), execution_id)
+        return _encode(dict(last, timedOut=True))
+    return await _run(executions.aget_execution_streamed, execution_id, select=select)
+
+
+@mcp.tool
+async def n8n_list_active_workflows() -> str:
     """List all currently active workflow IDs."""
-    return json.dumps(workflows.list_active_workflows(_get_client()), indent=2)
+    from .operations import workflows
+
+    return await _run(workflows.alist_active_workflows)
 
 
 @mcp.tool
-def n8n_get_activation_error(workflow_id: str) -> str:
+async def n8n_get_activation_error(workflow_id: str) -> str:
     """Get activation error for a specific workflow."""
-    return json.dumps(workflows.get_activation_error(_get_client(), workflow_id), indent=2)
+    from .operations import workflows
+
+    return await _run(workflows.aget_activation_error, workflow_id)
 
 
 # --- Executions ---
 
 @mcp.tool
-def n8n_list_executions(
+async def n8n_list_executions(
     workflow_id: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = 20,
     cursor: Optional[str] = None,
+    all_pages: bool = False,
+    view: str = "standard",
+    fields: Optional[list[str]] = None,
 ) -> str:
-    """List workflow executions with optional filtering."""
-    return json.dumps(
-        executions.list_executions(
-            _get_client(), workflow_id=workflow_id, status=status, limit=limit, cursor=cursor,
-        ),
-        indent=2,
+    """List workflow executions with optional filtering.
+
+    Set all_pages to follow every page (capped by N8N_MAX_LIST_ITEMS).
+    view is summary, standard or full; fields keeps only those paths.
+    """
+    from .operations import executions
+
+    if all_pages:
+        return await _collect(
+            executions.aiter_executions, "executions", "execution", view, fields,
+            workflow_id=workflow_id, status=status, page_size=limit,
+        )
+    result = await _call(
+        executions.alist_executions,
+        workflow_id=workflow_id, status=status, limit=limit, cursor=cursor,
     )
+    return _encode(result, "execution", view, fields)
+
+
+@mcp.tool
+async def n8n_get_execution(
+    execution_id: str,
+    include_data: bool = False,
+    select: Optional[str] = None,
+    paths: Optional[list[str]] = None,
+    view: str = "standard",
+    fields: Optional[list[str]] = None,
+    max_bytes: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Get detailed information about a specific execution.
+
+    view: summary (status, timing, error), standard (without the workflow
+    copy) or full; fields keeps only those paths. With max_bytes/max_tokens,
+    a larger result is trimmed (binary data first, then long arrays; failed
+    nodes are kept whole) and omitted parts carry a handle for
+    n8n_get_omitted. For large executions, set select to "summary", "errors"
+    or "last_node" (and/or paths such as "data.resultData.runData.*") to
+    stream out only those parts instead of the full data.
+    """
+    from .budget import budget_bytes
+    from .operations import executions
+
+    if select or paths:
+        result = await _call(
+            executions.aget_execution_streamed, execution_id, select=select or "summary", paths=paths,
+        )
+        return _encode(result, fields=fields)
+    size = None
+    if include_data and budget_bytes(max_bytes, max_tokens) is not None:
+        result, size = await _call(executions.aget_execution_document, execution_id)
+    else:
+        result = await _call(executions.aget_execution, execution_id, include_data=include_data)
+    return _encode_budgeted(result, "execution", execution_id, view, fields, max_bytes, max_tokens, size)
 
 
 @mcp.tool
-def n8n_get_execution(execution_id: str, include_data: bool = False) -> str:
-    """Get detailed information about a specific execution."""
-    return json.dumps(
-        executions.get_execution(_get_client(), execution_id, include_data=include_data),
-        indent=2,
+async def n8n_get_omitted(handle: str, max_bytes: Optional[int] = None, max_tokens: Optional[int] = None) -> str:
+    """Fetch a part omitted from a trimmed workflow or execution by its handle.
+
+    The part is trimmed to max_bytes/max_tokens the same way, with handles
+    for what is still omitted.
+    """
+    from .budget import budget_bytes, parse_handle, resolve
+    from .operations import executions, workflows
+    from .views import document_version
+
+    kind, doc_id, _, _, _ = parse_handle(handle)
+    doc = _get_source_cache().get(kind, doc_id)
+    if doc is None and kind == "execution":
+        doc, size = await _call(executions.aget_execution_document, doc_id)
+        if document_version(doc, kind) is not None:
+            _get_source_cache().put(kind, doc_id, doc, size)
+    elif doc is None:
+        doc = await _call(workflows.aget_workflow, doc_id)
+    return _encode(resolve(doc, handle, budget_bytes(max_bytes, max_tokens)))
+
+
+@mcp.tool
+async def n8n_get_executions_bulk(
+    execution_ids: list[str],
+    include_data: bool = False,
+    max_concurrency: int = 8,
+    view: str = "standard",
+    fields: Optional[list[str]] = None,
+) -> str:
+    """Get many executions in one call; results are in input order with per-ID errors."""
+    from .operations import executions
+
+    result = await _call(
+        executions.aget_executions_bulk,
+        execution_ids, include_data=include_data, max_concurrency=max_concurrency,
     )
+    return _encode(result, "execution", view, fields)
 
 
 @mcp.tool
-def n8n_delete_execution(execution_id: str) -> str:
+async def n8n_delete_execution(execution_id: str) -> str:
     """Delete an execution."""
-    return json.dumps(executions.delete_execution(_get_client(), execution_id), indent=2)
+    from .operations import executions
+
+    return await _run(executions.adelete_execution, execution_id)
 
 
 @mcp.tool
-def n8n_retry_execution(execution_id: str) -> str:
+async def n8n_retry_execution(execution_id: str) -> str:
     """Retry a failed execution."""
-    return json.dumps(executions.retry_execution(_get_client(), execution_id), indent=2)
+    from .operations import executions
+
+    return await _run(executions.aretry_execution, execution_id)
 
 
 @mcp.tool
-def n8n_stop_execution(execution_id: str) -> str:
+async def n8n_stop_execution(execution_id: str) -> str:
     """Stop a running execution."""
-    return json.dumps(executions.stop_execution(_get_client(), execution_id), indent=2)
+    from .operations import executions
 
+    return await _run(executions.astop_execution, execution_id)
 
-# --- Credentials ---
 
 @mcp.tool
-def n8n_list_credentials(limit: int = 100, cursor: Optional[str] = None) -> str:
-    """List all credentials (without sensitive data)."""
-    return json.dumps(
-        credentials.list_credentials(_get_client(), limit=limit, cursor=cursor),
-        indent=2,
+async def n8n_retry_executions_bulk(
+    execution_ids: Optional[list[str]] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = "error",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_items: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> str:
+    """Retry many executions: the given IDs, or those matching the filters.
+
+    Without execution_ids, executions with the status (default error) and no
+    successful retry yet are selected; bound them by workflow_id, a startedAt
+    window (ISO-8601 since/until) or max_items. Returns per-ID results plus
+    succeeded/failed counts.
+    """
+    from .operations import executions
+
+    return await _run(
+        executions.aretry_executions_bulk,
+        execution_ids, workflow_id=workflow_id, status=status, since=since, until=until,
+        max_items=max_items, max_concurrency=max_concurrency, max_per_second=max_per_second,
     )
 
 
 @mcp.tool
-def n8n_get_credential_schema(credential_type: str) -> str:
+async def n8n_stop_executions_bulk(
+    execution_ids: Optional[list[str]] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = "running",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_items: Optional[int] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> str:
+    """Stop many executions: the given IDs, or those matching the filters (default running).
+
+    Without execution_ids, bound the selection by workflow_id, since/until or
+    max_items. Returns per-ID results plus succeeded/failed counts.
+    """
+    from .operations import executions
+
+    return await _run(
+        executions.astop_executions_bulk,
+        execution_ids, workflow_id=workflow_id, status=status, since=since, until=until,
+        max_items=max_items, max_concurrency=max_concurrency, max_per_second=max_per_second,
+    )
+
+
+@mcp.tool
+async def n8n_execution_stats(
+    workflow_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    hours: float = 24,
+    top: int = 20,
+) -> str:
+    """Run-time percentiles (p50/p95/p99), error rate, status/mode counts and throughput per workflow.
+
+    The window is since..until (ISO-8601); without since it is the last
+    `hours` hours. Returns a compact summary for the `top` busiest workflows.
+    """
+    from .analytics import aexecution_stats
+    from .purge import resolve_cutoff
+
+    if since is None:
+        since = resolve_cutoff(older_than_days=hours / 24)
+    async with _get_limit():
+        result = await aexecution_stats(_get_client(), workflow_id=workflow_id, since=since, until=until, top=top)
+    return _encode(result)
+
+
+@mcp.tool
+async def n8n_purge_executions(
+    ctx: Context,
+    older_than_days: Optional[float] = None,
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    confirm_token: Optional[str] = None,
+    max_concurrency: int = 4,
+    max_per_second: Optional[float] = None,
+) -> str:
+    """Delete executions older than N days and/or of a workflow or status.
+
+    Always call first without confirm_token: this is a dry run that returns
+    the number of matching executions and a confirm_token. Call again with
+    the same filters and that token (valid 10 minutes) to delete them.
+    """
+    from .purge import apurge_executions, resolve_cutoff
+
+    now = time.monotonic()
+    for token, (_, _, expires) in list(_purge_tokens.items()):
+        if expires < now:
+            del _purge_tokens[token]
+
+    # The purge takes a tool slot per listing page and per batch of deletes,
+    # not for its whole run, so other tools keep going during a long purge.
+    request = {"older_than_days": older_than_days, "workflow_id": workflow_id, "status": status}
+    if confirm_token is None:
+        cutoff = resolve_cutoff(older_than_days)
+        result = await apurge_executions(
+            _get_client(), before=cutoff, workflow_id=workflow_id, status=status, dry_run=True, limit=_get_limit(),
+        )
+        if result["matched"]:
+            token = secrets.token_urlsafe(12)
+            _purge_tokens[token] = (dict(request, before=cutoff), result["matched"], now + PURGE_TOKEN_TTL)
+            result["confirm_token"] = token
+        return _encode(result)
+
+    issued = _purge_tokens.get(confirm_token)
+    if issued is None or {k: v for k, v in issued[0].items() if k != "before"} != request:
+        raise ValueError("Unknown or expired confirm_token for these filters; run a dry run first")
+    del _purge_tokens[confirm_token]
+    filters, matched, _ = issued
+
+    async def report(stats: dict) -> None:
+        await ctx.report_progress(stats["deleted"] + stats["failed"], matched)
+
+    result = await apurge_executions(
+        _get_client(),
+        before=filters["before"],
+        workflow_id=workflow_id,
+        status=status,
+        max_concurrency=max_concurrency,
+        max_per_second=max_per_second,
+        progress=report,
+        limit=_get_limit(),
+    )
+    return _encode(result)
+
+
+# --- Credentials ---
+
+@mcp.tool
+async def n8n_list_credentials(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    all_pages: bool = False,
+    fields: Optional[list[str]] = None,
+) -> str:
+    """List all credentials (without sensitive data).
+
+    Set all_pages to follow every page (capped by N8N_MAX_LIST_ITEMS);
+    fields (e.g. ["id", "name"]) keeps only those paths.
+    """
+    from .operations import credentials
+
+    if all_pages:
+        return await _collect(credentials.aiter_credentials, "credentials", fields=fields, page_size=limit)
+    return _encode(await _call(credentials.alist_credentials, limit=limit, cursor=cursor), fields=fields)
+
+
+@mcp.tool
+async def n8n_get_credential_schema(credential_type: str, fields: Optional[list[str]] = None) -> str:
     """Get the schema for a credential type."""
-    return json.dumps(credentials.get_credential_schema(_get_client(), credential_type), indent=2)
+    from .operations import credentials
+
+    return _encode(await _call(credentials.aget_credential_schema, credential_type), fields=fields)
 
 
 @mcp.tool
-def n8n_create_credential(name: str, credential_type: str, data: dict) -> str:
+async def n8n_create_credential(name: str, credential_type: str, data: dict) -> str:
     """Create a new credential."""
-    return json.dumps(
-        credentials.create_credential(_get_client(), name, credential_type, data),
-        indent=2,
-    )
+    from .operations import credentials
+
+    return await _run(credentials.acreate_credential, name, credential_type, data)
 
 
 @mcp.tool
-def n8n_delete_credential(credential_id: str) -> str:
+async def n8n_delete_credential(credential_id: str) -> str:
     """Delete a credential."""
-    return json.dumps(credentials.delete_credential(_get_client(), credential_id), indent=2)
+    from .operations import credentials
+
+    return await _run(credentials.adelete_credential, credential_id)
 
 
 # --- Tags ---
 
 @mcp.tool
-def n8n_list_tags(limit: int = 100, cursor: Optional[str] = None) -> str:
-    """List all tags."""
-    return json.dumps(tags.list_tags(_get_client(), limit=limit, cursor=cursor), indent=2)
+async def n8n_list_tags(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    all_pages: bool = False,
+    fields: Optional[list[str]] = None,
+) -> str:
+    """List all tags.
+
+    Set all_pages to follow every page (capped by N8N_MAX_LIST_ITEMS);
+    fields (e.g. ["id", "name"]) keeps only those paths.
+    """
+    from .operations import tags
+
+    if all_pages:
+        return await _collect(tags.aiter_tags, "tags", fields=fields, page_size=limit)
+    return _encode(await _call(tags.alist_tags, limit=limit, cursor=cursor), fields=fields)
 
 
 @mcp.tool
-def n8n_create_tag(name: str) -> str:
+async def n8n_create_tag(name: str) -> str:
     """Create a new tag."""
-    return json.dumps(tags.create_tag(_get_client(), name), indent=2)
+    from .operations import tags
+
+    return await _run(tags.acreate_tag, name)
 
 
 @mcp.tool
-def n8n_delete_tag(tag_id: str) -> str:
+async def n8n_delete_tag(tag_id: str) -> str:
     """Delete a tag."""
-    return json.dumps(tags.delete_tag(_get_client(), tag_id), indent=2)
+    from .operations import tags
+
+    return await _run(tags.adelete_tag, tag_id)
 
 
 # --- Users ---
 
 @mcp.tool
-def n8n_list_users(limit: int = 100, cursor: Optional[str] = None) -> str:
-    """List all users (admin only)."""
-    return json.dumps(misc.list_users(_get_client(), limit=limit, cursor=cursor), indent=2)
+async def n8n_list_users(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    all_pages: bool = False,
+    fields: Optional[list[str]] = None,
+) -> str:
+    """List all users (admin only).
+
+    Set all_pages to follow every page (capped by N8N_MAX_LIST_ITEMS);
+    fields (e.g. ["id", "name"]) keeps only those paths.
+    """
+    from .operations import misc
+
+    if all_pages:
+        return await _collect(misc.aiter_users, "users", fields=fields, page_size=limit)
+    return _encode(await _call(misc.alist_users, limit=limit, cursor=cursor), fields=fields)
 
 
 # --- Webhooks ---
 
 @mcp.tool
-def n8n_trigger_webhook(
+async def n8n_trigger_webhook(
     webhook_path: str,
     method: str = "POST",
     data: Optional[dict] = None,
     query_params: Optional[dict] = None,
 ) -> str:
     """Trigger a webhook endpoint."""
-    return json.dumps(
-        misc.trigger_webhook(
-            _get_client(), webhook_path, method=method, data=data, query_params=query_params,
-        ),
-        indent=2,
+    from .operations import misc
+
+    return await _run(
+        misc.atrigger_webhook,
+        webhook_path, method=method, data=data, query_params=query_params,
     )
 
 
 # --- Status ---
 
 @mcp.tool
-def n8n_status() -> str:
+async def n8n_status() -> str:
     """Check n8n connection status and API availability."""
-    return json.dumps(misc.status(_get_client()), indent=2)
+    from .operations import misc
+
+    return await _run(misc.astatus)
+
+
+@mcp.tool
+async def n8n_client_metrics(format: str = "json") -> str:
+    """Client-side metrics of the calls this server made to n8n.
+
+    Per route (IDs replaced by {id}): request and error counts, latency
+    histogram and bytes, plus concurrency limiter, circuit breaker, cache and
+    request-coalescing state. format="prometheus" returns the Prometheus text
+    exposition of all hosts instead.
+    """
+    if format == "prometheus":
+        from .metrics import render_prometheus
+
+        return render_prometheus()
+    if format != "json":
+        raise ValueError(f"Unknown format {format!r}; expected 'json' or 'prometheus'")
+    return _encode(_get_client().stats())
 
 
 def main():
+    settings = get_settings()
+    if settings.metrics_enabled and settings.metrics_port:
+        from .metrics import serve_metrics
+
+        serve_metrics(settings.metrics_port)
+    mirror = _get_mirror()
+    if mirror is not None:
+        mirror.sync_in_background()
     mcp.run()
 
 
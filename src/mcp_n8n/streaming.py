@@ -0,0 +1,175 @@
+"""Incremental JSON extraction from large response bodies.
+
+Parses a byte stream with ijson and yields only the values whose path
+matches one of the requested patterns, so a multi-hundred-MB execution never
+has to be loaded as a whole. Paths use ijson's dotted prefixes (array
+elements are ``item``) and ``*`` matches any single key, e.g.
+``data.resultData.runData.*.item.error``. Matching follows the document's
+own keys (from ``map_key`` events), so ``*`` also matches keys that contain
+dots, such as node names. Requires the ``stream`` extra.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
+
+_START = ("start_map", "start_array")
+_END = ("end_map", "end_array")
+_MATCH_CACHE_SIZE = 100_000
+
+Keys = tuple[str, ...]
+
+
+def _ijson():
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError("Streaming reads require ijson: pip install 'mcp-n8n[stream]'") from e
+    return ijson
+
+
+def compile_path(pattern: str) -> Callable[[Keys], bool]:
+    """Compile a dotted path pattern (``*`` = any single key) to a predicate over key tuples."""
+    parts = tuple(pattern.split(".")) if pattern else ()
+
+    def matches(keys: Keys) -> bool:
+        return len(keys) == len(parts) and all(p == "*" or p == k for p, k in zip(parts, keys))
+
+    return matches
+
+
+class _Extractor:
+    """Event-driven state machine that rebuilds values at matching paths."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._ijson = _ijson()
+        self._patterns = [compile_path(p) for p in patterns]
+        self._cache: dict[Keys, bool] = {}
+        self._builder: Any = None
+        self._depth = 0
+        self._keys: list[str] = []
+        self._path: Keys = ()
+
+    def _wanted(self, keys: Keys) -> bool:
+        hit = self._cache.get(keys)
+        if hit is None:
+            hit = any(p(keys) for p in self._patterns)
+            if len(self._cache) < _MATCH_CACHE_SIZE:
+                self._cache[keys] = hit
+        return hit
+
+    def feed(self, event: str, value: Any) -> Optional[tuple[Keys, Any]]:
+        """Consume one parser event; return ``(keys, value)`` when a match completes."""
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if event in _START:
+                self._depth += 1
+            elif event in _END:
+                self._depth -= 1
+                if self._depth == 0:
+                    done, self._builder = self._builder.value, None
+                    return self._path, done
+            return None
+        if event == "map_key":
+            self._keys[-1] = value
+            return None
+        if event in _END:
+            self._keys.pop()
+            return None
+        keys = tuple(self._keys)
+        if self._wanted(keys):
+            if event not in _START:
+                return keys, value
+            self._builder = self._ijson.ObjectBuilder()
+            self._builder.event(event, value)
+            self._depth = 1
+            self._path = keys
+            return None
+        if event in _START:
+            self._keys.append("" if event == "start_map" else "item")
+        return None
+
+
+def _format(keys: Keys, split: bool) -> Union[str, Keys]:
+    return keys if split else ".".join(keys)
+
+
+def iter_matches(stream: Any, patterns: Iterable[str], split: bool = False) -> Iterator[tuple[Any, Any]]:
+    """Yield ``(path, value)`` for every value in ``stream`` matching ``patterns``.
+
+    ``stream`` is a binary file-like object (e.g. ``response.raw``). Paths are
+    dotted strings, or with ``split`` tuples of keys (exact for keys that
+    contain dots).
+    """
+    extractor = _Extractor(patterns)
+    for event, value in extractor._ijson.basic_parse(stream, use_float=True):
+        match = extractor.feed(event, value)
+        if match is not None:
+            yield _format(match[0], split), match[1]
+
+
+async def aiter_matches(stream: Any, patterns: Iterable[str], split: bool = False) -> AsyncIterator[tuple[Any, Any]]:
+    """Async twin of ``iter_matches``; ``stream`` must have an async ``read``."""
+    extractor = _Extractor(patterns)
+    async for event, value in extractor._ijson.basic_parse_async(stream, use_float=True):
+        match = extractor.feed(event, value)
+        if match is not None:
+            yield _format(match[0], split), match[1]
+
+
+class _CountingReader:
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self.count += len(data)
+        return data
+
+
+class _AsyncCountingReader(_CountingReader):
+    async def read(self, size: int = -1) -> bytes:
+        data = await self._stream.read(size)
+        self.count += len(data)
+        return data
+
+
+def load(stream: Any) -> tuple[Any, int]:
+    """Build the whole document from ``stream``; return it with the number of bytes read.
+
+    Unlike ``json.loads(response.content)`` the raw body is never buffered
+    next to the parsed document.
+    """
+    reader = _CountingReader(stream)
+    value = next(_ijson().items(reader, "", use_float=True))
+    return value, reader.count
+
+
+async def aload(stream: Any) -> tuple[Any, int]:
+    """Async twin of ``load``; ``stream`` must have an async ``read``."""
+    reader = _AsyncCountingReader(stream)
+    async for value in _ijson().items_async(reader, "", use_float=True):
+        return value, reader.count
+    raise ValueError("Empty JSON document")
+
+
+class AsyncByteReader:
+    """Adapts an async iterator of byte chunks to an object with ``async read(n)``."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+        self._done = False
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._done = True
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
@@ -0,0 +1,217 @@
+"""View presets, field projection and compact encoding for tool output.
+
+Workflow and execution documents carry a lot an agent rarely needs: node
+positions, pinned data, static data and, on executions, a full copy of the
+workflow. ``render`` shapes a result with a view preset (``summary``,
+``standard`` or ``full``) or an explicit list of dotted ``fields`` and
+encodes it as compact JSON. Pages (lists next to ``nextCursor``) and bulk
+results are shaped item by item.
+
+With an ``OutputCache``, the encoded text of a document is kept per view and
+reused while the document's version (``updatedAt``/``versionId`` for
+workflows, ``stoppedAt`` for finished executions) is unchanged.
+
+Usage:
+    from mcp_n8n.views import render
+
+    render(workflow, "workflow", view="summary")
+    render(page, "execution", fields=["id", "status", "startedAt"])
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from . import codec
+
+VIEWS = ("summary", "standard", "full")
+
+_WORKFLOW_HEAVY = ("pinData", "staticData", "meta", "shared")
+_EXECUTION_SUMMARY = (
+    "id", "workflowId", "workflowName", "status", "mode", "finished",
+    "startedAt", "stoppedAt", "retryOf", "retrySuccessId",
+)
+
+
+def encode(value: Any, indent: Optional[int] = None) -> str:
+    """JSON text; compact separators unless ``indent`` is given."""
+    return codec.dumps(value, indent)
+
+
+def _field_tree(fields: Sequence[str]) -> dict:
+    """Nested dict of path segments; ``None`` marks a whole subtree."""
+    tree: dict = {}
+    for field in fields:
+        node = tree
+        *parents, leaf = field.split(".")
+        for part in parents:
+            child = node.get(part, {})
+            if child is None:
+                break
+            node = node.setdefault(part, child)
+        else:
+            node[leaf] = None
+    return tree
+
+
+def _apply(value: Any, tree: Optional[dict]) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_apply(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: _apply(value[key], sub) for key, sub in tree.items() if key in value}
+
+
+def project(value: Any, fields: Sequence[str]) -> Any:
+    """Keep only ``fields`` (dotted paths; lists are projected element-wise)."""
+    return _apply(value, _field_tree(fields))
+
+
+def _tag_names(tags: Any) -> Any:
+    if isinstance(tags, list):
+        return [t.get("name") if isinstance(t, dict) else t for t in tags]
+    return tags
+
+
+def workflow_view(wf: dict, view: str) -> dict:
+    """``summary``: metadata and node names/types; ``standard``: editable parts only."""
+    if view == "full":
+        return wf
+    if view == "summary":
+        nodes = wf.get("nodes") or []
+        summary = {key: wf[key] for key in ("id", "name", "active", "createdAt", "updatedAt") if key in wf}
+        summary["tags"] = _tag_names(wf.get("tags") or [])
+        summary["nodeCount"] = len(nodes)
+        summary["nodes"] = [{"name": n.get("name"), "type": n.get("type")} for n in nodes]
+        return summary
+    standard = {key: value for key, value in wf.items() if key not in _WORKFLOW_HEAVY}
+    if "tags" in standard:
+        standard["tags"] = _tag_names(standard["tags"])
+    return standard
+
+
+def execution_view(ex: dict, view: str) -> dict:
+    """``summary``: status and timing; ``standard``: without the embedded workflow copy."""
+    if view == "full":
+        return ex
+    workflow = ex.get("workflowData") or {}
+    if view == "summary":
+        summary = {key: ex[key] for key in _EXECUTION_SUMMARY if key in ex}
+        if workflow.get("name"):
+            summary["workflowName"] = workflow["name"]
+        result = (ex.get("data") or {}).get("resultData") or {}
+        if result.get("lastNodeExecuted"):
+            summary["lastNodeExecuted"] = result["lastNodeExecuted"]
+        if (result.get("error") or {}).get("message"):
+            summary["error"] = result["error"]["message"]
+        return summary
+    standard = {key: value for key, value in ex.items() if key != "workflowData"}
+    if workflow:
+        standard["workflowData"] = {key: workflow[key] for key in ("id", "name") if key in workflow}
+    return standard
+
+
+_SHAPERS = {"workflow": workflow_view, "execution": execution_view}
+
+
+def _shape_one(item: Any, kind: Optional[str], view: str, fields: Optional[Sequence[str]]) -> Any:
+    if fields:
+        return project(item, fields)
+    shaper = _SHAPERS.get(kind)
+    if shaper is None or not isinstance(item, dict):
+        return item
+    return shaper(item, view)
+
+
+def shape(
+    result: Any,
+    kind: Optional[str] = None,
+    view: str = "standard",
+    fields: Optional[Sequence[str]] = None,
+) -> Any:
+    """Apply a view (or ``fields``, which take precedence) to a document, page or bulk result."""
+    if view not in VIEWS:
+        raise ValueError(f"Unknown view {view!r}; expected one of {', '.join(VIEWS)}")
+    if view == "full" and not fields:
+        return result
+    if isinstance(result, dict):
+        if "nextCursor" in result:
+            return {
+                key: [_shape_one(item, kind, view, fields) for item in value] if isinstance(value, list) else value
+                for key, value in result.items()
+            }
+        if isinstance(result.get("results"), list):
+            return dict(result, results=[
+                dict(r, data=_shape_one(r["data"], kind, view, fields)) if r.get("ok") else r
+                for r in result["results"]
+            ])
+    if isinstance(result, list):
+        return [_shape_one(item, kind, view, fields) for item in result]
+    return _shape_one(result, kind, view, fields)
+
+
+def document_version(result: Any, kind: Optional[str]) -> Optional[tuple]:
+    """What changes when the document does, or None if it may change unseen."""
+    if not isinstance(result, dict) or result.get("id") is None:
+        return None
+    if kind == "workflow" and result.get("updatedAt"):
+        return (result["updatedAt"], result.get("versionId"))
+    if kind == "execution" and result.get("stoppedAt"):
+        return (result["stoppedAt"], result.get("status"), "data" in result)
+    return None
+
+
+class OutputCache:
+    """LRU of encoded documents, reused while the document version is unchanged."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[tuple, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, version: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, version: tuple, text: str) -> None:
+        with self._lock:
+            self._entries[key] = (version, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def render(
+    result: Any,
+    kind: Optional[str] = None,
+    view: str = "standard",
+    fields: Optional[Sequence[str]] = None,
+    indent: Optional[int] = None,
+    cache: Optional[OutputCache] = None,
+) -> str:
+    """Shape ``result`` and encode it, reusing ``cache`` for unchanged documents."""
+    version = document_version(result, kind) if cache is not None else None
+    if version is None:
+        return encode(shape(result, kind, view, fields), indent)
+    key = (kind, str(result["id"]), view, tuple(fields or ()), indent)
+    text = cache.get(key, version)
+    if text is None:
+        text = encode(shape(result, kind, view, fields), indent)
+        cache.put(key, version, text)
+    return text
@@ -0,0 +1,16 @@
+import pytest
+
+from mcp_n8n.limiter import reset_limiters
+from mcp_n8n.metrics import reset_metrics
+from mcp_n8n.resilience import reset_breakers
+
+
+@pytest.fixture(autouse=True)
+def _fresh_host_state():
+    reset_breakers()
+    reset_limiters()
+    reset_metrics()
+    yield
+    reset_breakers()
+    reset_limiters()
+    reset_metrics()
@@ -0,0 +1,40 @@
+"""A local HTTP server that plays scripted n8n responses.
+
+Each ``(method, path)`` gets a list of steps returned in order (the last one
+repeats). A step is ``(status, body)``, ``(status, body, headers)`` or
+``RESET`` to drop the connection without answering.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from benchmarks.stand_in import StandInServer
+
+RESET = "reset"
+
+
+class FakeN8n(StandInServer):
+    def __init__(self) -> None:
+        self._scripts: dict[tuple[str, str], list] = {}
+        self.requests: list[tuple[str, str]] = []
+        super().__init__()
+
+    def script(self, method: str, path: str, *steps: Any) -> None:
+        with self._lock:
+            self._scripts[(method.upper(), path)] = list(steps)
+
+    def count(self, method: str, path: str) -> int:
+        with self._lock:
+            return self.requests.count((method.upper(), path))
+
+    def answer(self, method: str, target: str, body: Optional[bytes]) -> Optional[tuple]:
+        path = urlsplit(target).path
+        with self._lock:
+            self.requests.append((method, path))
+            steps = self._scripts.get((method, path))
+            if not steps:
+                return (404, {"message": "not found"})
+            step = steps.pop(0) if len(steps) > 1 else steps[0]
+        return None if step == RESET else step
@@ -0,0 +1,46 @@
+"""Synthetic n8n payloads generated on the fly for streaming tests."""
+
+import io
+import json
+
+
+def execution_chunks(target_bytes, nodes=20, item_size=1024):
+    """Yield the JSON of an execution with ~``target_bytes`` of runData, in chunks."""
+    per_node = target_bytes // nodes
+    filler = "x" * item_size
+    yield b'{"id":"1","workflowId":"w1","status":"error","mode":"manual","finished":false,'
+    yield b'"startedAt":"2025-01-01T00:00:00.000Z","data":{"resultData":{"runData":{'
+    for n in range(nodes):
+        prefix = "," if n else ""
+        yield f'{prefix}"Node {n}":[{{"startTime":1,"data":{{"main":[['.encode()
+        written, k = 0, 0
+        while written < per_node:
+            item = f'{"," if k else ""}{{"json":{{"n":{k},"value":"{filler}"}}}}'.encode()
+            yield item
+            written += len(item)
+            k += 1
+        error = f',"error":{json.dumps({"message": f"failed at node {n}"})}' if n == nodes - 1 else ""
+        yield f']]}}{error}}}]'.encode()
+    yield f'}},"lastNodeExecuted":"Node {nodes - 1}","error":{{"message":"boom"}}}}}}}}'.encode()
+
+
+class ChunkStream(io.RawIOBase):
+    """Binary file-like object reading from an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
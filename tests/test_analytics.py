@@ -0,0 +1,106 @@
+"""Tests for execution latency and failure-rate analytics."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import responses
+from fastmcp import Client
+
+from mcp_n8n import server
+from mcp_n8n.analytics import ExecutionStats, execution_stats, percentile
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+def _execution(i, workflow_id="w1", status="success", seconds=1, mode="trigger", hour=0):
+    return {
+        "id": str(i),
+        "workflowId": workflow_id,
+        "workflowData": {"name": f"Flow {workflow_id}"},
+        "status": status,
+        "mode": mode,
+        "startedAt": f"2025-01-01T{hour:02d}:00:00.000Z",
+        "stoppedAt": f"2025-01-01T{hour:02d}:00:{seconds:02d}.000Z",
+    }
+
+
+def test_percentile_interpolates():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.5
+    assert percentile(values, 99) == 99.01
+    assert percentile([7.0], 95) == 7.0
+    assert percentile([], 50) is None
+
+
+def test_stats_per_workflow():
+    stats = ExecutionStats()
+    for i in range(10):
+        stats.add(_execution(i, seconds=i + 1, status="error" if i < 2 else "success", hour=i % 2))
+    stats.add({"id": "r", "workflowId": "w2", "status": "running", "startedAt": "2025-01-01T00:30:00.000Z"})
+    summary = stats.summary()
+
+    w1 = next(w for w in summary["workflows"] if w["workflowId"] == "w1")
+    assert w1["count"] == 10
+    assert w1["error_rate"] == 0.2
+    assert w1["duration_ms"]["p50"] == 5500.0
+    assert w1["duration_ms"]["max"] == 10000.0
+    assert w1["by_status"] == {"success": 8, "error": 2}
+    assert w1["per_hour"] == {"mean": 5.0, "peak": 5, "peak_hour": "2025-01-01T01:00:00+00:00"}
+
+    w2 = next(w for w in summary["workflows"] if w["workflowId"] == "w2")
+    assert w2["duration_ms"]["p50"] is None
+    assert summary["overall"]["count"] == 11
+    assert summary["overall"]["workflows"] == 2
+
+
+def test_window_excludes_outside_executions():
+    stats = ExecutionStats(since="2025-01-01T01:00:00Z", until="2025-01-01T02:00:00Z")
+    for hour in range(4):
+        stats.add(_execution(hour, hour=hour))
+    assert stats.summary()["overall"]["count"] == 2
+
+
+def test_many_executions_stay_compact():
+    stats = ExecutionStats()
+    for i in range(50_000):
+        stats.add(_execution(i, workflow_id=str(i % 5), seconds=i % 60, hour=i % 24))
+    summary = stats.summary(top=2)
+    assert summary["overall"]["count"] == 50_000
+    assert len(summary["workflows"]) == 2
+    assert len(json.dumps(summary)) < 4000
+
+
+@responses.activate
+def test_execution_stats_stops_listing_at_since():
+    responses.get(f"{API}/executions", json={
+        "data": [_execution(3, hour=3), _execution(2, hour=2), _execution(1, hour=1)],
+        "nextCursor": "more",
+    })
+    summary = execution_stats(N8nClient(base_url=BASE, api_key="k"), since="2025-01-01T02:00:00Z")
+    # The next page was already being prefetched; let it land while the mock is active.
+    for thread in threading.enumerate():
+        if thread.name.startswith("n8n-prefetch"):
+            thread.join(timeout=5)
+    assert summary["overall"]["count"] == 2
+    assert len(responses.calls) == 2
+
+
+def test_execution_stats_tool(monkeypatch):
+    def handler(request):
+        return httpx.Response(200, json={"data": [_execution(1, status="error")], "nextCursor": None})
+
+    client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_limit", None)
+
+    async def run():
+        async with Client(server.mcp) as mcp_client:
+            return await mcp_client.call_tool("n8n_execution_stats", {"since": "2025-01-01T00:00:00Z"})
+
+    result = json.loads(asyncio.run(run()).content[0].text)
+    assert result["overall"]["error_rate"] == 1.0
+    assert result["workflows"][0]["workflowName"] == "Flow w1"
@@ -0,0 +1,77 @@
+"""Tests for the streaming execution archiver."""
+
+import gzip
+import json
+import os
+
+import responses
+
+from mcp_n8n.archive import CHECKPOINT_FILE, archive_executions
+from mcp_n8n.client import N8nClient
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+def _serve_executions(count):
+    listing = [
+        {"id": str(i), "workflowId": "w1", "status": "error", "startedAt": f"2025-01-{i:02d}T00:00:00.000Z"}
+        for i in range(count, 0, -1)
+    ]
+    responses.get(f"{API}/executions", json={"data": listing, "nextCursor": None})
+    for ex in listing:
+        responses.get(f"{API}/executions/{ex['id']}", json=dict(ex, data={"resultData": {"runData": {}}}))
+
+
+def _read(files):
+    records = []
+    for path in files:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+def _client():
+    return N8nClient(base_url=BASE, api_key="test-key")
+
+
+@responses.activate
+def test_archive_rotates_files_and_filters_dates(tmp_path):
+    _serve_executions(6)
+    stats = archive_executions(
+        _client(), str(tmp_path), compression="gzip",
+        since="2025-01-02T00:00:00Z", until="2025-01-05T00:00:00Z",
+        max_records_per_file=3, batch_size=2,
+    )
+    assert stats["archived"] == 4
+    assert len(stats["files"]) == 2
+    assert [r["id"] for r in _read(stats["files"])] == ["5", "4", "3", "2"]
+    assert all("data" in r for r in _read(stats["files"]))
+    assert not os.path.exists(tmp_path / CHECKPOINT_FILE)
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".partial")]
+    fetched = [c.request.url for c in responses.calls if "/executions/" in c.request.url]
+    assert all("includeData=true" in url for url in fetched)
+
+
+@responses.activate
+def test_archive_resumes_from_checkpoint(tmp_path):
+    _serve_executions(5)
+    filters = {"workflow_id": None, "status": None, "since": None, "until": None}
+    (tmp_path / CHECKPOINT_FILE).write_text(json.dumps(
+        {"filters": filters, "last_id": "4", "file_index": 2, "archived": 2}
+    ))
+    stats = archive_executions(_client(), str(tmp_path), compression="gzip")
+    assert stats["skipped"] == 2
+    assert stats["archived"] == 5
+    assert [os.path.basename(f) for f in stats["files"]] == ["executions-00002.jsonl.gz"]
+    assert [r["id"] for r in _read(stats["files"])] == ["3", "2", "1"]
+
+
+@responses.activate
+def test_second_run_continues_numbering(tmp_path):
+    _serve_executions(4)
+    first = archive_executions(_client(), str(tmp_path), compression="gzip", max_records_per_file=3)
+    second = archive_executions(_client(), str(tmp_path), compression="gzip", since="2025-01-03T00:00:00Z")
+    assert [os.path.basename(f) for f in first["files"]] == ["executions-00001.jsonl.gz", "executions-00002.jsonl.gz"]
+    assert [os.path.basename(f) for f in second["files"]] == ["executions-00003.jsonl.gz"]
+    assert [r["id"] for r in _read(first["files"] + second["files"])] == ["4", "3", "2", "1", "4", "3"]
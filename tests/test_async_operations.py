@@ -0,0 +1,136 @@
+"""Tests for AsyncN8nClient and the async operation twins."""
+
+import asyncio
+import time
+
+import httpx
+
+from mcp_n8n.client import AsyncN8nClient
+from mcp_n8n.operations import executions, misc, workflows
+from mcp_n8n.resilience import RetryPolicy
+
+BASE = "http://localhost:5678"
+
+
+def _client(handler, retry_policy=None):
+    return AsyncN8nClient(
+        base_url=BASE, api_key="test-key", transport=httpx.MockTransport(handler), retry_policy=retry_policy,
+    )
+
+
+def test_async_list_workflows():
+    def handler(request):
+        assert request.url.path == "/api/v1/workflows"
+        assert request.url.params["active"] == "true"
+        assert request.headers["X-N8N-API-KEY"] == "test-key"
+        return httpx.Response(200, json={
+            "data": [{"id": "1", "name": "WF", "active": True, "tags": [{"name": "prod"}]}],
+            "nextCursor": "abc",
+        })
+
+    async def run():
+        async with _client(handler) as client:
+            return await workflows.alist_workflows(client, active=True)
+
+    result = asyncio.run(run())
+    assert result["workflows"][0]["tags"] == ["prod"]
+    assert result["nextCursor"] == "abc"
+
+
+def test_async_stop_execution():
+    def handler(request):
+        assert request.method == "POST"
+        return httpx.Response(200, text="")
+
+    async def run():
+        async with _client(handler) as client:
+            return await executions.astop_execution(client, "ex1")
+
+    assert asyncio.run(run()) == {"id": "ex1", "message": "Execution stopped"}
+
+
+def test_async_status_error_is_handled():
+    def handler(request):
+        raise httpx.ConnectError("refused")
+
+    async def run():
+        async with _client(handler, RetryPolicy(max_retries=0)) as client:
+            return await misc.astatus(client)
+
+    assert asyncio.run(run())["status"] == "error"
+
+
+def test_async_calls_run_concurrently():
+    async def handler(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    async def run():
+        async with _client(handler) as client:
+            return await asyncio.gather(*(workflows.aget_workflow(client, str(i)) for i in range(20)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    assert [r["id"] for r in results] == [str(i) for i in range(20)]
+    assert time.perf_counter() - start < 1.0
+
+
+def test_async_bulk_respects_concurrency():
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        if request.url.path.endswith("/bad"):
+            return httpx.Response(500)
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    async def run():
+        async with _client(handler) as client:
+            return await executions.aget_executions_bulk(client, ["a", "bad", "c", "d", "e"], max_concurrency=2)
+
+    result = asyncio.run(run())
+    assert [r["id"] for r in result["results"]] == ["a", "bad", "c", "d", "e"]
+    assert result["failed"] == 1 and result["results"][1]["status_code"] == 500
+    assert peak == 2
+
+
+def test_async_bulk_retry_is_rate_capped():
+    started = []
+
+    async def handler(request):
+        started.append(time.perf_counter())
+        return httpx.Response(200, json={"id": "new"})
+
+    async def run():
+        async with _client(handler) as client:
+            return await executions.aretry_executions_bulk(
+                client, ["1", "2", "3", "4"], max_concurrency=4, max_per_second=20,
+            )
+
+    result = asyncio.run(run())
+    assert result["succeeded"] == 4
+    assert started[-1] - started[0] >= 3 / 20 - 0.01
+
+
+def test_async_wait_for_execution_polls_without_blocking():
+    polls = []
+
+    async def handler(request):
+        polls.append(request.url.path)
+        status = "success" if len(polls) >= 3 else "running"
+        return httpx.Response(200, json={"id": "5", "status": status})
+
+    async def run():
+        async with _client(handler) as client:
+            ticker = asyncio.ensure_future(asyncio.sleep(0.01))
+            result = await executions.await_for_execution(client, "5", poll_interval=0.02)
+            return result, ticker.done()
+
+    result, ticked = asyncio.run(run())
+    assert result["status"] == "success"
+    assert len(polls) == 3
+    assert ticked
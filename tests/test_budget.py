@@ -0,0 +1,195 @@
+"""Tests for budgeted (trimmed) workflow and execution output."""
+
+import asyncio
+import copy
+import io
+import json
+
+import httpx
+import pytest
+from fastmcp import Client
+
+from mcp_n8n import server
+from mcp_n8n.budget import SourceCache, budget_bytes, make_handle, parse_handle, resolve, trim
+from mcp_n8n.client import AsyncN8nClient
+from mcp_n8n.streaming import load
+
+BASE = "http://localhost:5678"
+
+
+def _execution(items=200, binary_size=20_000):
+    return {
+        "id": "7",
+        "status": "error",
+        "data": {"resultData": {
+            "runData": {
+                "Fetch": [{"data": {"main": [[
+                    {"json": {"i": i}, "binary": {"file": {"mimeType": "image/png", "data": "A" * binary_size}}}
+                    if i == 0 else {"json": {"i": i}}
+                    for i in range(items)
+                ]]}}],
+                "Broken": [{"error": {"message": "boom"}, "data": {"main": [[{"json": {"i": i}} for i in range(items)]]}}],
+            },
+            "lastNodeExecuted": "Broken",
+        }},
+    }
+
+
+def _size(value):
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def _utf8_size(value):
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode())
+
+
+def test_budget_from_bytes_or_tokens():
+    assert budget_bytes() is None
+    assert budget_bytes(max_tokens=100) == 400
+    assert budget_bytes(max_bytes=300, max_tokens=100) == 300
+
+
+def test_handles_round_trip():
+    handle = make_handle("execution", "7", ("data", "runData", "Set v1.2", 0), 3, 9)
+    assert parse_handle(handle) == ("execution", "7", ("data", "runData", "Set v1.2", 0), 3, 9)
+    with pytest.raises(ValueError):
+        parse_handle("not a handle")
+
+
+def test_documents_under_budget_are_untouched():
+    doc = _execution(items=2, binary_size=10)
+    assert trim(doc, 100_000, "execution", "7") is doc
+
+
+def test_binary_data_goes_first():
+    doc = _execution(items=5)
+    trimmed = trim(doc, 5_000, "execution", "7")
+    entry = trimmed["data"]["resultData"]["runData"]["Fetch"][0]["data"]["main"][0][0]["binary"]["file"]
+    assert entry["mimeType"] == "image/png"
+    assert entry["data"]["omitted"] == "binary"
+    assert trimmed["_budget"]["steps"] == ["binary"]
+    assert trimmed["_budget"]["fits"]
+
+
+def test_long_arrays_are_cut_but_failed_nodes_kept_whole():
+    doc = _execution()
+    before = copy.deepcopy(doc)
+    trimmed = trim(doc, 4_500, "execution", "7")
+    run_data = trimmed["data"]["resultData"]["runData"]
+    fetched = run_data["Fetch"][0]["data"]["main"][0]
+    marker = next(item for item in fetched if "omitted" in item)
+    assert len(fetched) < 200
+    assert marker["omitted"] == 200 - len(fetched) + 1
+    assert run_data["Broken"] == doc["data"]["resultData"]["runData"]["Broken"]
+    assert _size(trimmed) <= 4_500 + 200
+    assert doc == before
+
+
+@pytest.mark.parametrize("max_bytes", [100, 4_500, 30_000])
+def test_reported_size_matches_the_encoded_result(max_bytes):
+    doc = _execution()
+    doc["notes"] = ['quote " and \\ escapes\n' * 60, "ünïcödé ✓ " * 120, 1.5, -7, True, None]
+    trimmed = trim(doc, max_bytes, "execution", "7")
+    budget = trimmed.pop("_budget")
+    assert budget["original_bytes"] == _utf8_size(doc)
+    assert budget["bytes"] == _utf8_size(trimmed)
+
+
+def test_omitted_parts_resolve_by_handle():
+    doc = _execution()
+    trimmed = trim(doc, 4_500, "execution", "7")
+    fetched = trimmed["data"]["resultData"]["runData"]["Fetch"][0]["data"]["main"][0]
+    marker = next(item for item in fetched if "omitted" in item)
+    part = resolve(doc, marker["handle"])
+    assert [item["json"]["i"] for item in part["value"]] == list(range(part["start"], part["end"]))
+    assert len(part["value"]) == marker["omitted"]
+
+    nested = resolve(doc, marker["handle"], max_bytes=500)
+    inner = next(item for item in nested["value"] if "omitted" in item)
+    again = resolve(doc, inner["handle"])
+    assert again["value"][0]["json"]["i"] == again["start"]
+
+
+def test_long_strings_continue_in_chunks():
+    doc = {"id": "1", "nodes": [{"parameters": {"jsCode": "x" * 5000}}]}
+    trimmed = trim(doc, 1_000, "workflow", "1")
+    cut = trimmed["nodes"][0]["parameters"]["jsCode"]
+    part = resolve(doc, cut["handle"], max_bytes=1000)
+    assert len(part["value"]) == 1000
+    rest = resolve(doc, part["next"])
+    assert part["value"] + rest["value"] == "x" * (5000 - 500)
+
+
+def test_stream_load_counts_bytes():
+    body = json.dumps(_execution(items=3)).encode()
+    doc, size = load(io.BytesIO(body))
+    assert doc == _execution(items=3)
+    assert size == len(body)
+
+
+def test_budgeted_execution_tool_and_continuation(monkeypatch):
+    body = json.dumps(_execution()).encode()
+
+    def handler(request):
+        assert request.url.params.get("includeData") == "true"
+        return httpx.Response(200, content=body)
+
+    client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_limit", None)
+
+    async def run(tool, args):
+        async with Client(server.mcp) as mcp_client:
+            return json.loads((await mcp_client.call_tool(tool, args)).content[0].text)
+
+    trimmed = asyncio.run(run("n8n_get_execution", {"execution_id": "7", "include_data": True, "max_tokens": 1_100, "view": "full"}))
+    assert trimmed["_budget"]["original_bytes"] == len(body)
+    assert trimmed["_budget"]["fits"]
+    fetched = trimmed["data"]["resultData"]["runData"]["Fetch"][0]["data"]["main"][0]
+    marker = next(item for item in fetched if "omitted" in item)
+
+    part = asyncio.run(run("n8n_get_omitted", {"handle": marker["handle"]}))
+    assert len(part["value"]) == marker["omitted"]
+
+
+def test_source_cache_is_bounded_by_bytes():
+    cache = SourceCache(max_bytes=100)
+    cache.put("execution", "1", {"id": "1"}, 60)
+    cache.put("execution", "2", {"id": "2"}, 30)
+    assert cache.get("execution", "1") == {"id": "1"}
+    cache.put("execution", "3", {"id": "3"}, 30)
+    assert cache.get("execution", "2") is None
+    assert cache.get("execution", "1") == {"id": "1"}
+    cache.put("workflow", "4", {"id": "4"}, 500)
+    assert cache.get("workflow", "4") is None
+
+
+def test_continuations_of_finished_executions_are_served_from_cache(monkeypatch):
+    execution = dict(_execution(), stoppedAt="2025-01-01T00:00:01.000Z")
+    body = json.dumps(execution).encode()
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        return httpx.Response(200, content=body)
+
+    client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_limit", None)
+    monkeypatch.setattr(server, "_source_cache", None)
+
+    async def run():
+        async with Client(server.mcp) as mcp_client:
+            text = (await mcp_client.call_tool(
+                "n8n_get_execution", {"execution_id": "7", "include_data": True, "max_bytes": 4_500, "view": "full"},
+            )).content[0].text
+            fetched = json.loads(text)["data"]["resultData"]["runData"]["Fetch"][0]["data"]["main"][0]
+            marker = next(item for item in fetched if "omitted" in item)
+            part = await mcp_client.call_tool("n8n_get_omitted", {"handle": marker["handle"], "max_bytes": 500})
+            inner = next(item for item in json.loads(part.content[0].text)["value"] if "omitted" in item)
+            await mcp_client.call_tool("n8n_get_omitted", {"handle": inner["handle"]})
+            return marker
+
+    marker = asyncio.run(run())
+    assert marker["omitted"] > 0
+    assert requests == ["/api/v1/executions/7"]
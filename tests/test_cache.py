@@ -0,0 +1,116 @@
+"""Tests for the opt-in response cache."""
+
+import time
+
+import responses
+
+from mcp_n8n.cache import CacheRule, ResponseCache
+from mcp_n8n.client import N8nClient
+from mcp_n8n.operations import credentials, workflows
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cached_client(clock, max_entries=16):
+    cache = ResponseCache(
+        rules=[
+            CacheRule(r"/workflows/[^/]+", ttl=60, stale_ttl=30),
+            CacheRule(r"/credentials/schema/[^/]+", ttl=3600),
+        ],
+        max_entries=max_entries,
+        clock=clock,
+    )
+    return N8nClient(base_url=BASE, api_key="test-key", cache=cache)
+
+
+@responses.activate
+def test_fresh_hits_skip_the_network_and_return_copies():
+    responses.get(f"{API}/credentials/schema/slackApi", json={"properties": {}})
+    client = _cached_client(FakeClock())
+    first = credentials.get_credential_schema(client, "slackApi")
+    first["mutated"] = True
+    second = credentials.get_credential_schema(client, "slackApi")
+    assert "mutated" not in second
+    assert len(responses.calls) == 1
+    assert client.cache.stats()["hits"] == 1
+    assert client.cache.stats()["misses"] == 1
+
+
+@responses.activate
+def test_stale_entry_is_served_while_revalidating():
+    responses.get(f"{API}/workflows/1", json={"id": "1", "name": "old"})
+    clock = FakeClock()
+    client = _cached_client(clock)
+    workflows.get_workflow(client, "1")
+
+    responses.replace(responses.GET, f"{API}/workflows/1", json={"id": "1", "name": "new"})
+    clock.now += 70
+    assert workflows.get_workflow(client, "1")["name"] == "old"
+    client._refresher.shutdown(wait=True)
+    assert workflows.get_workflow(client, "1")["name"] == "new"
+    assert client.cache.stats()["stale_hits"] == 1
+
+
+@responses.activate
+def test_expired_entry_is_refetched():
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    clock = FakeClock()
+    client = _cached_client(clock)
+    workflows.get_workflow(client, "1")
+    clock.now += 100
+    workflows.get_workflow(client, "1")
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_writes_invalidate_the_workflow():
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    responses.post(f"{API}/workflows/1/activate", json={})
+    responses.put(f"{API}/workflows/1", json={"id": "1"})
+    client = _cached_client(FakeClock())
+    workflows.get_workflow(client, "1")
+    workflows.activate_workflow(client, "1")
+    workflows.get_workflow(client, "1")
+    workflows.update_workflow(client, "1", name="x")
+    workflows.get_workflow(client, "1")
+    assert [c.request.method for c in responses.calls] == ["GET", "POST", "GET", "PUT", "GET"]
+
+
+@responses.activate
+def test_listing_renews_unchanged_and_evicts_changed():
+    responses.get(f"{API}/workflows/1", json={"id": "1", "updatedAt": "t1"})
+    responses.get(f"{API}/workflows/2", json={"id": "2", "updatedAt": "t1"})
+    responses.get(f"{API}/workflows", json={"data": [
+        {"id": "1", "updatedAt": "t1"},
+        {"id": "2", "updatedAt": "t2"},
+    ]})
+    clock = FakeClock()
+    client = _cached_client(clock)
+    workflows.get_workflow(client, "1")
+    workflows.get_workflow(client, "2")
+    clock.now += 50
+    workflows.list_workflows(client)
+    clock.now += 50
+    workflows.get_workflow(client, "1")
+    workflows.get_workflow(client, "2")
+    fetched = [c.request.url for c in responses.calls]
+    assert fetched.count(f"{API}/workflows/1") == 1
+    assert fetched.count(f"{API}/workflows/2") == 2
+
+
+def test_lru_bound():
+    cache = ResponseCache([CacheRule(r"/workflows/[^/]+", ttl=60)], max_entries=2, clock=time.monotonic)
+    for i in range(3):
+        cache.store(f"/workflows/{i}", None, {"id": i})
+    assert cache.lookup("/workflows/0")[0] == "miss"
+    assert cache.lookup("/workflows/2")[0] == "fresh"
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,52 @@
+"""Tests for N8nClient transport behaviour."""
+
+import responses
+
+from mcp_n8n.client import N8nClient
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+def _client():
+    return N8nClient(base_url=BASE, api_key="test-key")
+
+
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("N8N_POOL_CONNECTIONS", "3")
+    monkeypatch.setenv("N8N_POOL_MAXSIZE", "7")
+    monkeypatch.setenv("N8N_TIMEOUT", "5")
+    client = _client()
+    adapter = client._session.get_adapter(API)
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert client.timeout == 5
+
+
+@responses.activate
+def test_requests_share_one_session():
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    responses.get(f"{API}/workflows/2", json={"id": "2"})
+    client = _client()
+    session = client._session
+    client.get("/workflows/1")
+    client.get("/workflows/2")
+    assert client._get_session() is session
+    assert responses.calls[0].request.headers["X-N8N-API-KEY"] == "test-key"
+
+
+@responses.activate
+def test_webhook_does_not_send_api_key():
+    responses.post(f"{BASE}/webhook/hook", json={"ok": True})
+    _client().webhook("hook", json={"a": 1})
+    assert "X-N8N-API-KEY" not in responses.calls[0].request.headers
+
+
+def test_idle_pools_are_dropped(monkeypatch):
+    client = _client()
+    closed = []
+    for adapter in client._session.adapters.values():
+        monkeypatch.setattr(adapter, "close", lambda a=adapter: closed.append(a))
+    client._last_used -= client.pool_idle_timeout + 1
+    client._get_session()
+    assert closed
@@ -0,0 +1,124 @@
+"""Tests for single-flight coalescing of identical GET requests."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import responses
+
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.coalesce import SingleFlight
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+def _slow_workflow(request):
+    time.sleep(0.2)
+    return 200, {}, json.dumps({"id": "1", "nodes": [{"name": "Start"}]})
+
+
+def _after_followers(client, followers, response):
+    """Callback that answers once ``followers`` callers are waiting on the request."""
+    def callback(request):
+        deadline = time.monotonic() + 5
+        while client.coalescer.stats()["coalesced"] < followers and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return response
+    return callback
+
+
+@responses.activate
+def test_concurrent_threads_share_one_call_and_get_private_copies():
+    client = N8nClient(base_url=BASE, api_key="k")
+    body = json.dumps({"id": "1", "nodes": [{"name": "Start"}]})
+    responses.add_callback(responses.GET, f"{API}/workflows/1", callback=_after_followers(client, 7, (200, {}, body)))
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: client.get("/workflows/1"), range(8)))
+
+    assert len(responses.calls) == 1
+    assert all(r == {"id": "1", "nodes": [{"name": "Start"}]} for r in results)
+    results[0]["nodes"].append({"name": "Mutated"})
+    assert all(len(r["nodes"]) == 1 for r in results[1:])
+    assert client.coalescer.stats() == {"sent": 1, "coalesced": 7, "in_flight": 0}
+
+
+@responses.activate
+def test_different_params_and_writes_are_not_coalesced():
+    responses.add_callback(responses.GET, f"{API}/workflows", callback=_slow_workflow)
+    responses.add_callback(responses.POST, f"{API}/workflows/1/activate", callback=_slow_workflow)
+    client = N8nClient(base_url=BASE, api_key="k")
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda i: client.get("/workflows", params={"limit": i}), range(2)))
+        list(pool.map(lambda _: client.post("/workflows/1/activate"), range(2)))
+
+    assert len(responses.calls) == 4
+    assert client.coalescer.stats()["coalesced"] == 0
+
+
+@responses.activate
+def test_errors_reach_every_waiting_thread():
+    client = N8nClient(base_url=BASE, api_key="k")
+    not_found = (404, {}, json.dumps({"message": "not found"}))
+    responses.add_callback(responses.GET, f"{API}/workflows/x", callback=_after_followers(client, 3, not_found))
+
+    def call(_):
+        try:
+            client.get("/workflows/x")
+        except Exception as e:
+            return type(e)
+
+    with ThreadPoolExecutor(4) as pool:
+        errors = list(pool.map(call, range(4)))
+    assert errors == [errors[0]] * 4 and errors[0] is not None
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_disabled_by_setting(monkeypatch):
+    monkeypatch.setenv("N8N_COALESCE_REQUESTS", "false")
+    responses.add_callback(responses.GET, f"{API}/workflows/1", callback=_slow_workflow)
+    client = N8nClient(base_url=BASE, api_key="k")
+    with ThreadPoolExecutor(3) as pool:
+        list(pool.map(lambda _: client.get("/workflows/1"), range(3)))
+    assert client.coalescer is None
+    assert len(responses.calls) == 3
+
+
+def test_async_tasks_share_one_call_and_survive_leader_cancellation():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"id": "1", "tags": []})
+
+    async def run():
+        client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+        async with client:
+            leader = asyncio.ensure_future(client.get("/workflows/1"))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(client.get("/workflows/1")) for _ in range(4)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return client.coalescer.stats(), results
+
+    stats, results = asyncio.run(run())
+    assert calls == 1
+    assert stats == {"sent": 1, "coalesced": 4, "in_flight": 0}
+    results[0]["tags"].append("x")
+    assert results[1] == {"id": "1", "tags": []}
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    assert flight.do(("GET", "/a", ()), lambda: {"n": 1}) == {"n": 1}
+    assert flight.do(("GET", "/a", ()), lambda: {"n": 2}) == {"n": 2}
+    assert flight.stats() == {"sent": 2, "coalesced": 0, "in_flight": 0}
@@ -0,0 +1,67 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+
+import pytest
+import responses
+
+from mcp_n8n import codec
+from mcp_n8n.client import N8nClient
+
+DOC = {"id": "1", "name": "Café ☕", "nodes": [{"position": [0, 1.5]}], "pinData": None, "active": True}
+
+
+def _installed():
+    names = []
+    for name in codec.BACKENDS:
+        try:
+            codec.use(name)
+        except ImportError:
+            continue
+        names.append(name)
+    codec.use()
+    return names
+
+
+@pytest.fixture(params=_installed())
+def backend(request):
+    codec.use(request.param)
+    yield request.param
+    codec.use()
+
+
+def test_round_trip_from_bytes(backend):
+    encoded = codec.dumpb(DOC)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == DOC
+    assert codec.loads(encoded.decode()) == DOC
+
+
+def test_output_matches_stdlib(backend):
+    assert codec.dumps(DOC) == json.dumps(DOC, separators=(",", ":"), ensure_ascii=False)
+    assert codec.dumps(DOC, indent=2) == json.dumps(DOC, indent=2, ensure_ascii=False)
+    assert codec.dumps({"a": 1}, indent=4) == json.dumps({"a": 1}, indent=4)
+
+
+def test_non_string_keys_are_converted(backend):
+    assert codec.loads(codec.dumpb({1: "a"})) == {"1": "a"}
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        codec.loads(b"not json")
+
+
+def test_auto_prefers_an_installed_fast_backend():
+    assert codec.use() == _installed()[0]
+    with pytest.raises(ValueError):
+        codec.use("yaml")
+
+
+@responses.activate
+def test_client_decodes_with_the_codec(backend):
+    responses.get("http://localhost:5678/api/v1/workflows/1", body=json.dumps(DOC).encode())
+    responses.post("http://localhost:5678/webhook/hook", body=b"accepted")
+    client = N8nClient(base_url="http://localhost:5678", api_key="k")
+    assert client.get("/workflows/1") == DOC
+    assert client.webhook("hook") == {"response": "accepted"}
@@ -0,0 +1,180 @@
+"""Tests for the request/tool hook pipeline and the shipped hooks."""
+
+import asyncio
+import pstats
+import sys
+
+import httpx
+import pytest
+import requests
+import responses
+from fastmcp import Client
+from opentelemetry import trace
+
+from mcp_n8n import server
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.hooks import Hook, OpenTelemetryHook, ProfileHook
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+class Recorder(Hook):
+    def __init__(self):
+        self.events = []
+
+    def before(self, call):
+        self.events.append(("before", call.name, call.attempt))
+
+    def after(self, call, result):
+        self.events.append(("after", call.name, call.status))
+
+    def error(self, call, exc):
+        self.events.append(("error", call.name, type(exc).__name__))
+
+
+class FakeSpan(trace.NonRecordingSpan):
+    def __init__(self, name, parent, attributes):
+        super().__init__(trace.INVALID_SPAN_CONTEXT)
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.status = None
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, status):
+        self.status = status.status_code.name
+
+    def record_exception(self, exc):
+        self.attributes["exception"] = repr(exc)
+
+    def end(self, end_time=None):
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, kind=None, attributes=None):
+        parent = trace.get_current_span()
+        span = FakeSpan(name, parent if isinstance(parent, FakeSpan) else None, attributes)
+        self.spans.append(span)
+        return span
+
+
+@responses.activate
+def test_hooks_see_every_attempt(monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_BACKOFF_BASE", "0")
+    responses.get(f"{API}/workflows/1", status=503)
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    recorder = Recorder()
+    client = N8nClient(base_url=BASE, api_key="k", hooks=[recorder])
+    client.get("/workflows/1")
+    assert recorder.events == [
+        ("before", "GET /workflows/{id}", 0),
+        ("after", "GET /workflows/{id}", 503),
+        ("before", "GET /workflows/{id}", 1),
+        ("after", "GET /workflows/{id}", 200),
+    ]
+
+
+@responses.activate
+def test_error_hooks_run_on_transport_failure(monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "0")
+    responses.get(f"{API}/tags", body=requests.ConnectionError("refused"))
+    recorder = Recorder()
+    client = N8nClient(base_url=BASE, api_key="k", hooks=[recorder])
+    with pytest.raises(requests.ConnectionError):
+        client.get("/tags")
+    assert recorder.events[-1] == ("error", "GET /tags", "ConnectionError")
+
+
+def test_cancelled_async_request_releases_its_slot():
+    recorder = Recorder()
+    started = asyncio.Event()
+
+    async def handler(request):
+        started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200, json={})
+
+    async def run():
+        client = AsyncN8nClient(
+            base_url=BASE, api_key="k", transport=httpx.MockTransport(handler), hooks=[recorder],
+        )
+        # Not a GET: a coalesced GET keeps running for other callers when one cancels.
+        task = asyncio.ensure_future(client.post("/tags", json={"name": "t"}))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return client.limiter.stats()["in_flight"]
+
+    assert asyncio.run(run()) == 0
+    assert recorder.events == [("before", "POST /tags", 0), ("error", "POST /tags", "CancelledError")]
+
+
+@responses.activate
+def test_otel_hook_spans_requests_under_the_current_span(monkeypatch):
+    monkeypatch.setenv("N8N_OTEL_ENABLED", "false")  # only the hook with the fake tracer
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "0")
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    responses.get(f"{API}/workflows/missing", status=404)
+    responses.get(f"{API}/tags", body=requests.ConnectionError("refused"))
+    tracer = FakeTracer()
+    client = N8nClient(base_url=BASE, api_key="k", hooks=[OpenTelemetryHook(tracer)])
+
+    outer = tracer.start_span("outer")
+    with trace.use_span(outer):
+        client.get("/workflows/1")
+    with pytest.raises(requests.HTTPError):
+        client.get("/workflows/missing")
+    with pytest.raises(requests.ConnectionError):
+        client.get("/tags")
+
+    _, ok, missing, failed = tracer.spans
+    assert ok.name == "GET /workflows/{id}" and ok.parent is outer
+    assert ok.attributes["url.full"] == f"{API}/workflows/1"
+    assert ok.attributes["http.response.status_code"] == 200 and ok.status is None
+    assert missing.parent is None and missing.status == "ERROR"
+    assert failed.status == "ERROR" and failed.attributes["error.type"] == "ConnectionError"
+    assert all(span.ended for span in (ok, missing, failed))
+    assert trace.get_current_span() is trace.INVALID_SPAN
+
+
+def test_otel_hook_is_a_noop_without_opentelemetry(monkeypatch):
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+    hook = OpenTelemetryHook()
+    assert not hook.enabled
+    client = N8nClient(base_url=BASE, api_key="k")
+    assert not any(isinstance(h, OpenTelemetryHook) for h in client.hooks)
+
+
+def test_profile_hook_writes_profiles_for_selected_tools(monkeypatch, tmp_path):
+    monkeypatch.setenv("N8N_PROFILE_TOOLS", "n8n_list_tags")
+    monkeypatch.setenv("N8N_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(server, "_tool_hooks", None)
+    monkeypatch.setattr(server, "_limit", None)
+    client = AsyncN8nClient(
+        base_url=BASE, api_key="k",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"data": [], "nextCursor": None})),
+    )
+    monkeypatch.setattr(server, "_client", client)
+
+    async def run():
+        async with Client(server.mcp) as mcp_client:
+            await mcp_client.call_tool("n8n_list_tags", {})
+            await mcp_client.call_tool("n8n_list_users", {})
+
+    asyncio.run(run())
+    profiler = next(h for h in server._tool_hooks if isinstance(h, ProfileHook))
+    assert len(profiler.written) == 1
+    prof = profiler.written[0]
+    assert prof.startswith(str(tmp_path / "n8n_list_tags-"))
+    assert pstats.Stats(prof).total_calls > 0
+    with open(prof.replace(".prof", ".alloc.txt")) as f:
+        assert f.readline().startswith("# tool n8n_list_tags: ok")
@@ -6,7 +6,7 @@ from mcp_n8n.langchain_tools import TOOLS
 
 
 def test_tools_count():
-    assert len(TOOLS) == 25
+    assert len(TOOLS) == 29
 
 
 def test_all_tools_are_base_tool():
@@ -30,6 +30,7 @@ def test_expected_tools_present():
         # Workflows
         "n8n_list_workflows",
         "n8n_get_workflow",
+        "n8n_get_workflows_bulk",
         "n8n_create_workflow",
         "n8n_update_workflow",
         "n8n_delete_workflow",
@@ -41,9 +42,12 @@ def test_expected_tools_present():
         # Executions
         "n8n_list_executions",
         "n8n_get_execution",
+        "n8n_get_executions_bulk",
         "n8n_delete_execution",
         "n8n_retry_execution",
         "n8n_stop_execution",
+        "n8n_retry_executions_bulk",
+        "n8n_stop_executions_bulk",
         # Credentials
         "n8n_list_credentials",
         "n8n_get_credential_schema",
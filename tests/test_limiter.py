@@ -0,0 +1,157 @@
+"""Tests for the adaptive per-host concurrency limiter."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.limiter import AdaptiveLimiter
+
+from .fake_n8n import FakeN8n
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_in_flight_never_exceeds_limit():
+    limiter = AdaptiveLimiter(floor=3, ceiling=3, initial=3)
+    peak, current, lock = [0], [0], threading.Lock()
+
+    def work():
+        limiter.acquire()
+        with lock:
+            current[0] += 1
+            peak[0] = max(peak[0], current[0])
+        time.sleep(0.005)
+        with lock:
+            current[0] -= 1
+        limiter.release(0.005)
+
+    threads = [threading.Thread(target=work) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 3
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_waiters_are_served_in_arrival_order():
+    limiter = AdaptiveLimiter(floor=1, ceiling=1)
+    limiter.acquire()
+    order = []
+
+    def work(i):
+        limiter.acquire()
+        order.append(i)
+        limiter.release(0.001)
+
+    threads = []
+    for i in range(5):
+        t = threading.Thread(target=work, args=(i,))
+        t.start()
+        threads.append(t)
+        _wait_for(lambda: limiter.stats()["queued"] == i + 1)
+    limiter.release(0.001)
+    for t in threads:
+        t.join()
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_limit_grows_while_saturated_and_fast():
+    limiter = AdaptiveLimiter(floor=1, ceiling=4, initial=2)
+    for _ in range(20):
+        held = limiter.limit
+        for _ in range(held):
+            limiter.acquire()
+        for _ in range(held):
+            limiter.release(0.01)
+    assert limiter.limit == 4
+
+
+def test_limit_does_not_grow_when_idle():
+    limiter = AdaptiveLimiter(floor=1, ceiling=10, initial=2)
+    for _ in range(50):
+        limiter.acquire()
+        limiter.release(0.01)
+    assert limiter.limit == 2
+
+
+def test_overload_shrinks_limit_once_per_round_trip_down_to_floor():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(floor=2, ceiling=16, initial=16, backoff=0.5, clock=clock)
+    for _ in range(4):
+        limiter.acquire()
+    clock.now = 10.0
+    for _ in range(4):
+        limiter.release(0.1, overloaded=True)
+    assert limiter.limit == 8
+
+    for _ in range(5):
+        clock.now += 1.0
+        limiter.acquire()
+        limiter.release(0.1, overloaded=True)
+    assert limiter.limit == 2
+
+
+def test_rising_latency_shrinks_limit():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(floor=1, ceiling=16, initial=8, clock=clock)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(0.02)
+    for _ in range(20):
+        clock.now += 1.0
+        limiter.acquire()
+        limiter.release(0.5)
+    assert limiter.limit < 8
+    assert limiter.stats()["decreases"] > 0
+
+
+def test_cancelled_async_waiter_leaves_the_queue():
+    async def main():
+        limiter = AdaptiveLimiter(floor=1, ceiling=1)
+        await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        assert limiter.stats()["queued"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(0.01)
+        return limiter.stats()
+
+    stats = asyncio.run(main())
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 0
+
+
+def test_sync_and_async_clients_share_the_host_limiter(monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "0")
+    with FakeN8n() as fake:
+        fake.script("GET", "/api/v1/workflows/1", (429, {}), (200, {"id": "1"}))
+        client = N8nClient(base_url=fake.base_url, api_key="k")
+        async_client = AsyncN8nClient(base_url=fake.base_url, api_key="k")
+        assert client.limiter is async_client.limiter
+
+        start = client.limiter.limit
+        with pytest.raises(requests.HTTPError):
+            client.get("/workflows/1")
+        assert client.limiter.limit < start
+        assert asyncio.run(async_client.get("/workflows/1")) == {"id": "1"}
+        assert client.limiter.stats()["in_flight"] == 0
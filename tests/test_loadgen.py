@@ -0,0 +1,120 @@
+"""Tests for the webhook load generator."""
+
+import json
+import time
+
+import pytest
+
+from mcp_n8n.client import N8nClient
+from mcp_n8n.loadgen import (
+    LatencyHistogram,
+    StandInServer,
+    jsonl_payloads,
+    main,
+    run_load,
+    template_payloads,
+)
+
+from .fake_n8n import FakeN8n
+
+
+def test_histogram_percentiles_within_precision():
+    histogram = LatencyHistogram()
+    for value in range(1, 100_001):
+        histogram.record(value)
+    assert histogram.count == 100_000
+    for q, exact in ((50, 50_000), (99, 99_000), (99.9, 99_900)):
+        assert abs(histogram.percentile(q) - exact) / exact < 0.01
+    assert histogram.percentile(100) == 100_000
+    assert histogram.min_us == 1
+
+
+def test_histogram_merge_and_empty_summary():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    assert a.summary_ms()["p99"] is None
+    a.record(1000)
+    b.record(3000)
+    a.merge(b)
+    summary = a.summary_ms()
+    assert summary["min"] == 1.0
+    assert summary["max"] == 3.0
+    assert summary["mean"] == 2.0
+
+
+def test_template_payloads_substitute_per_request():
+    payloads = template_payloads('{"n": $seq, "id": "$uuid"}')
+    first, second = payloads(0), payloads(1)
+    assert (first["n"], second["n"]) == (0, 1)
+    assert first["id"] != second["id"]
+    assert template_payloads('{"fixed": true}')(5) == {"fixed": True}
+
+
+def test_jsonl_payloads_cycle(tmp_path):
+    path = tmp_path / "bodies.jsonl"
+    path.write_text('{"a": 1}\n\n{"a": 2}\n')
+    payloads = jsonl_payloads(str(path))
+    assert [payloads(i)["a"] for i in range(4)] == [1, 2, 1, 2]
+
+
+def test_fixed_concurrency_sends_exact_total():
+    with StandInServer(error_rate=0.1) as server:
+        report = run_load(
+            N8nClient(base_url=server.base_url), "hook", concurrency=4, duration=None, requests_total=200,
+        )
+        assert server.received == 200
+    assert report["requests"] == 200
+    assert report["failed"] == 20
+    assert report["errors"] == {"HTTP 500": 20}
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["max"]
+
+
+def test_target_rate_paces_requests():
+    with StandInServer() as server:
+        start = time.monotonic()
+        report = run_load(N8nClient(base_url=server.base_url), "hook", rate=100, duration=0.3)
+        assert time.monotonic() - start >= 0.29
+    assert report["mode"] == "rate"
+    assert 25 <= report["requests"] <= 30
+    assert report["failed"] == 0
+
+
+def test_rate_latency_includes_queueing_delay():
+    with StandInServer(latency=0.02) as server:
+        report = run_load(
+            N8nClient(base_url=server.base_url), "hook", rate=200, concurrency=1, duration=None, requests_total=10,
+        )
+    assert report["latency_ms"]["max"] > 100
+
+
+def test_payloads_and_errors_reach_the_webhook():
+    with FakeN8n() as fake:
+        fake.script("POST", "/webhook/orders", (200, {}), (404, {"message": "not registered"}))
+        report = run_load(
+            N8nClient(base_url=fake.base_url),
+            "orders",
+            concurrency=1,
+            duration=None,
+            requests_total=3,
+            payloads=template_payloads('{"n": $seq}'),
+        )
+    assert report["succeeded"] == 1
+    assert report["errors"] == {"HTTP 404": 2}
+
+
+def test_connection_errors_are_counted():
+    with StandInServer() as server:
+        base_url = server.base_url
+    report = run_load(N8nClient(base_url=base_url), "hook", concurrency=1, duration=None, requests_total=2)
+    assert report["errors"] == {"ConnectionError": 2}
+
+
+def test_cli_fails_when_thresholds_are_exceeded(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["hook", "--stand-in", "--requests", "50", "--stand-in-error-rate", "0.2", "--max-error-rate", "0.05"])
+    assert exc.value.code == 1
+    assert json.loads(capsys.readouterr().out)["failed"] == 10
+
+
+def test_cli_passes_within_thresholds(capsys):
+    main(["hook", "--stand-in", "--requests", "20", "--payload", '{"n": $seq}', "--max-error-rate", "0"])
+    assert json.loads(capsys.readouterr().out)["succeeded"] == 20
@@ -0,0 +1,117 @@
+"""Tests for per-route client metrics and their Prometheus exposition."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests
+import responses
+from fastmcp import Client
+
+from mcp_n8n import server
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.metrics import render_prometheus, route_of, serve_metrics, snapshot
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+@pytest.mark.parametrize("endpoint, route", [
+    ("/workflows", "/workflows"),
+    ("/workflows/aBc123", "/workflows/{id}"),
+    ("/workflows/aBc123/activate", "/workflows/{id}/activate"),
+    ("/executions/42/retry", "/executions/{id}/retry"),
+    ("/credentials/schema/slackApi", "/credentials/schema/{type}"),
+    ("/users/me@example.com?includeRole=true", "/users/{id}"),
+    ("/active-workflows", "/active-workflows"),
+    ("/active-workflows/error/42", "/active-workflows/error/{id}"),
+    ("/active-workflows/error/aBcDeFgHiJkLmNoP", "/active-workflows/error/{id}"),
+])
+def test_route_normalization(endpoint, route):
+    assert route_of(endpoint) == route
+
+
+@responses.activate
+def test_sync_client_records_count_errors_latency_and_bytes():
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    responses.get(f"{API}/workflows/2", json={"message": "not found"}, status=404)
+    responses.post(f"{API}/workflows", json={"id": "3"})
+    responses.post(f"{BASE}/webhook/orders/new", json={"ok": True})
+    client = N8nClient(base_url=BASE, api_key="k")
+    client.get("/workflows/1")
+    with pytest.raises(requests.HTTPError):
+        client.get("/workflows/2")
+    client.post("/workflows", json={"name": "WF"})
+    client.webhook("orders/new", json={"n": 1})
+
+    routes = {(r["method"], r["route"]): r for r in client.metrics.snapshot()}
+    assert set(routes) == {("GET", "/workflows/{id}"), ("POST", "/workflows"), ("POST", "/webhook/{path}")}
+    get = routes[("GET", "/workflows/{id}")]
+    assert get["requests"] == 2
+    assert get["errors"] == {"404": 1}
+    assert get["latency_buckets"]["+Inf"] == 2
+    assert get["bytes_in"] == len(b'{"id": "1"}') + len(b'{"message": "not found"}')
+    assert routes[("POST", "/workflows")]["bytes_out"] == len(json.dumps({"name": "WF"}))
+
+
+@responses.activate
+def test_transport_errors_are_counted(monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "0")
+    responses.get(f"{API}/tags", body=requests.ConnectionError("refused"))
+    client = N8nClient(base_url=BASE, api_key="k")
+    with pytest.raises(requests.ConnectionError):
+        client.get("/tags")
+    assert client.metrics.snapshot()[0]["errors"] == {"transport": 1}
+
+
+def test_disabled_by_setting(monkeypatch):
+    monkeypatch.setenv("N8N_METRICS_ENABLED", "false")
+    client = N8nClient(base_url=BASE, api_key="k")
+    assert client.metrics is None
+    assert client.stats()["routes"] == []
+
+
+@responses.activate
+def test_prometheus_text_and_http_endpoint():
+    responses.get(f"{API}/executions/7", json={"id": "7"})
+    N8nClient(base_url=BASE, api_key="k").get("/executions/7")
+    text = render_prometheus()
+    labels = f'host="{BASE}",method="GET",route="/executions/{{id}}"'
+    assert f"n8n_client_requests_total{{{labels}}} 1" in text
+    assert f'n8n_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert "# TYPE n8n_client_request_duration_seconds histogram" in text
+
+    responses.add_passthru("http://127.0.0.1")
+    endpoint = serve_metrics(0)
+    try:
+        response = requests.get(f"http://127.0.0.1:{endpoint.server_address[1]}/metrics", timeout=5)
+    finally:
+        endpoint.shutdown()
+    assert response.status_code == 200
+    assert response.text.startswith("# HELP n8n_client_requests_total")
+
+
+def test_async_client_and_mcp_tool(monkeypatch):
+    def handler(request):
+        return httpx.Response(200, json={"data": [], "nextCursor": None})
+
+    client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_limit", None)
+
+    async def run():
+        async with Client(server.mcp) as mcp_client:
+            await mcp_client.call_tool("n8n_list_tags", {})
+            as_json = await mcp_client.call_tool("n8n_client_metrics", {})
+            as_text = await mcp_client.call_tool("n8n_client_metrics", {"format": "prometheus"})
+            return json.loads(as_json.content[0].text), as_text.content[0].text
+
+    stats, text = asyncio.run(run())
+    assert stats["routes"][0]["route"] == "/tags"
+    assert stats["routes"][0]["requests"] == 1
+    assert stats["breaker"]["state"] == "closed"
+    assert stats["coalescing"] == {"sent": 1, "coalesced": 0, "in_flight": 0}
+    assert "limit" in stats["limiter"]
+    assert 'route="/tags"' in text
+    assert list(snapshot()) == [BASE]
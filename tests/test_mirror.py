@@ -0,0 +1,87 @@
+"""Tests for the local SQLite workflow mirror."""
+
+import responses
+
+from mcp_n8n.client import N8nClient
+from mcp_n8n.mirror import WorkflowMirror
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+def _workflow(wid, updated, name=None, active=False, tags=(), node_type="n8n-nodes-base.noOp"):
+    return {
+        "id": wid,
+        "name": name or f"WF {wid}",
+        "active": active,
+        "tags": [{"name": t} for t in tags],
+        "updatedAt": updated,
+        "nodes": [{"name": "Node", "type": node_type}],
+        "connections": {},
+    }
+
+
+def _serve(*wfs):
+    responses.upsert(responses.GET, f"{API}/workflows", json={"data": list(wfs), "nextCursor": None})
+    for wf in wfs:
+        responses.upsert(responses.GET, f"{API}/workflows/{wf['id']}", json=wf)
+
+
+def _body_fetches():
+    return sum(1 for c in responses.calls if "/workflows/" in c.request.url)
+
+
+@responses.activate
+def test_incremental_sync():
+    mirror = WorkflowMirror(N8nClient(base_url=BASE, api_key="k"))
+
+    _serve(_workflow("1", "t1"), _workflow("2", "t1"))
+    assert mirror.sync()["fetched"] == 2
+    assert mirror.last_synced() is not None
+
+    responses.calls.reset()
+    _serve(_workflow("1", "t1"), _workflow("2", "t2", name="Renamed"))
+    stats = mirror.sync()
+    assert (stats["fetched"], stats["unchanged"]) == (1, 1)
+    assert _body_fetches() == 1
+    assert mirror.get_workflow("2")["name"] == "Renamed"
+
+    _serve(_workflow("2", "t2", name="Renamed"))
+    assert mirror.sync()["removed"] == 1
+    assert mirror.get_workflow("1") is None
+
+
+@responses.activate
+def test_filtered_list_and_pagination():
+    mirror = WorkflowMirror(N8nClient(base_url=BASE, api_key="k"))
+    _serve(
+        _workflow("1", "t", name="Alpha", active=True, tags=["prod"], node_type="n8n-nodes-base.slack"),
+        _workflow("2", "t", name="Beta", tags=["dev"]),
+        _workflow("3", "t", name="Gamma", active=True, tags=["prod"]),
+    )
+    mirror.sync()
+
+    assert [w["id"] for w in mirror.list_workflows(active=True)["workflows"]] == ["1", "3"]
+    assert [w["id"] for w in mirror.list_workflows(tags="dev")["workflows"]] == ["2"]
+    assert [w["id"] for w in mirror.list_workflows(node_type="n8n-nodes-base.slack")["workflows"]] == ["1"]
+    assert mirror.list_workflows(name_contains="amm")["workflows"][0]["tags"] == ["prod"]
+
+    page = mirror.list_workflows(limit=2)
+    assert len(page["workflows"]) == 2
+    rest = mirror.list_workflows(limit=2, cursor=page["nextCursor"])
+    assert [w["id"] for w in rest["workflows"]] == ["3"]
+    assert rest["nextCursor"] is None
+
+
+@responses.activate
+def test_max_age_triggers_sync_and_invalidate_refetches():
+    _serve(_workflow("1", "t1"))
+    mirror = WorkflowMirror(N8nClient(base_url=BASE, api_key="k"))
+    assert mirror.get_workflow("1", max_age=60)["id"] == "1"
+    assert mirror.is_fresh(60)
+
+    responses.calls.reset()
+    _serve(_workflow("1", "t2", name="Changed"))
+    mirror.invalidate("1")
+    assert mirror.get_workflow("1")["name"] == "Changed"
+    assert _body_fetches() == 1
@@ -1,5 +1,8 @@
 """Tests for n8n operations using responses mocks."""
 
+import json
+
+import pytest
 import responses
 
 from mcp_n8n.client import N8nClient
@@ -70,6 +73,80 @@ def test_update_workflow():
     assert result["name"] == "Updated"
 
 
+CURRENT_WF = {
+    "id": "1",
+    "name": "Orders",
+    "active": True,
+    "nodes": [
+        {"id": "a", "name": "Trigger", "type": "n8n-nodes-base.webhook", "parameters": {"path": "orders"}},
+        {"id": "b", "name": "Fetch", "type": "n8n-nodes-base.httpRequest", "parameters": {"url": "https://x", "method": "GET"}},
+    ],
+    "connections": {"Trigger": {"main": [[{"node": "Fetch", "type": "main", "index": 0}]]}},
+    "settings": {"executionOrder": "v1"},
+    "updatedAt": "2025-01-02",
+}
+
+
+@responses.activate
+def test_update_workflow_diff_skips_unchanged_definition():
+    responses.get(f"{API}/workflows/1", json=CURRENT_WF)
+    result = workflows.update_workflow(
+        _client(), "1", name="Orders", nodes=list(reversed(CURRENT_WF["nodes"])),
+        connections=CURRENT_WF["connections"], diff=True,
+    )
+    assert result["updated"] is False and result["changes"] == {}
+    assert [c.request.method for c in responses.calls] == ["GET"]
+
+
+@responses.activate
+def test_update_workflow_node_patches_send_merged_workflow():
+    responses.get(f"{API}/workflows/1", json=CURRENT_WF)
+    responses.put(f"{API}/workflows/1", json={"id": "1", "versionId": "v2"})
+    result = workflows.update_workflow(_client(), "1", node_patches={
+        "b": {"name": "Fetch order", "parameters": {"url": "https://y", "method": None}},
+    })
+    sent = json.loads(responses.calls[1].request.body)
+    assert set(sent) == {"name", "nodes", "connections", "settings"}
+    assert sent["nodes"][1]["parameters"] == {"url": "https://y"}
+    assert sent["nodes"][0] == CURRENT_WF["nodes"][0]
+    assert sent["connections"]["Trigger"]["main"][0][0]["node"] == "Fetch order"
+    assert result["updated"] is True
+    assert result["changes"] == {
+        "nodes": {"renamed": {"Fetch": "Fetch order"}, "changed": {"Fetch order": ["parameters"]}},
+        "connections": {"changed": ["Trigger"]},
+    }
+
+
+@responses.activate
+def test_update_workflow_diff_reports_added_removed_and_settings():
+    responses.get(f"{API}/workflows/1", json=CURRENT_WF)
+    responses.put(f"{API}/workflows/1", json={"id": "1"})
+    nodes = [CURRENT_WF["nodes"][0], {"id": "c", "name": "Notify", "type": "n8n-nodes-base.slack"}]
+    result = workflows.update_workflow(
+        _client(), "1", nodes=nodes, connections={}, settings={"executionOrder": "v1", "timezone": "UTC"},
+        active=False, diff=True,
+    )
+    assert result["changes"] == {
+        "active": {"from": True, "to": False},
+        "nodes": {"added": ["Notify"], "removed": ["Fetch"]},
+        "connections": {"removed": ["Trigger"]},
+        "settings": {"added": ["timezone"]},
+    }
+
+
+@responses.activate
+def test_update_workflow_node_patch_removes_node_and_rejects_unknown():
+    responses.get(f"{API}/workflows/1", json=CURRENT_WF)
+    responses.put(f"{API}/workflows/1", json={"id": "1"})
+    result = workflows.update_workflow(_client(), "1", node_patches={"Fetch": None})
+    sent = json.loads(responses.calls[1].request.body)
+    assert [n["name"] for n in sent["nodes"]] == ["Trigger"]
+    assert sent["connections"] == {"Trigger": {"main": [[]]}}
+    assert result["changes"]["nodes"] == {"removed": ["Fetch"]}
+    with pytest.raises(ValueError, match="Missing"):
+        workflows.update_workflow(_client(), "1", node_patches={"Missing": {"disabled": True}})
+
+
 @responses.activate
 def test_delete_workflow():
     responses.delete(f"{API}/workflows/1", json={})
@@ -272,3 +349,140 @@ def test_status_error():
     responses.get(f"{API}/workflows", body=ConnectionError("refused"))
     result = misc.status(_client())
     assert result["status"] == "error"
+
+
+# =============================================================================
+# Bulk operations
+# =============================================================================
+
+
+@responses.activate
+def test_get_workflows_bulk_keeps_order_and_reports_errors():
+    responses.get(f"{API}/workflows/1", json={"id": "1"})
+    responses.get(f"{API}/workflows/2", status=404, json={"message": "not found"})
+    responses.get(f"{API}/workflows/3", json={"id": "3"})
+    result = workflows.get_workflows_bulk(_client(), ["3", "2", "1"], max_concurrency=2)
+    assert [r["id"] for r in result["results"]] == ["3", "2", "1"]
+    assert result["results"][1]["ok"] is False
+    assert result["results"][1]["status_code"] == 404
+    assert result["results"][2]["data"] == {"id": "1"}
+    assert (result["succeeded"], result["failed"]) == (2, 1)
+
+
+@responses.activate
+def test_get_executions_bulk_include_data():
+    responses.get(f"{API}/executions/ex1", json={"id": "ex1", "data": {}})
+    result = executions.get_executions_bulk(_client(), ["ex1"], include_data=True)
+    assert result["succeeded"] == 1
+    assert responses.calls[0].request.params == {"includeData": "true"}
+
+
+def _serve_execution_listing(status):
+    listing = [
+        {"id": str(i), "workflowId": "w1", "status": status, "startedAt": f"2025-01-{i:02d}T00:00:00.000Z"}
+        for i in range(5, 0, -1)
+    ]
+    responses.get(f"{API}/executions", json={"data": listing, "nextCursor": None})
+
+
+@responses.activate
+def test_retry_executions_bulk_by_ids():
+    responses.post(f"{API}/executions/1/retry", json={"id": "11"})
+    responses.post(f"{API}/executions/2/retry", status=409, json={"message": "already running"})
+    result = executions.retry_executions_bulk(_client(), ["1", "2"])
+    assert [r["ok"] for r in result["results"]] == [True, False]
+    assert result["results"][0]["data"] == {"id": "11"}
+    assert (result["succeeded"], result["failed"]) == (1, 1)
+    assert not [c for c in responses.calls if c.request.method == "GET"]
+
+
+@responses.activate
+def test_retry_executions_bulk_by_filter_and_window():
+    _serve_execution_listing("error")
+    for i in range(1, 6):
+        responses.post(f"{API}/executions/{i}/retry", json={"id": f"r{i}"})
+    result = executions.retry_executions_bulk(
+        _client(), workflow_id="w1", since="2025-01-02T00:00:00Z", until="2025-01-04T00:00:00Z",
+    )
+    assert [r["id"] for r in result["results"]] == ["4", "3", "2"]
+    assert "status=error" in responses.calls[0].request.url
+
+
+@responses.activate
+def test_stop_executions_bulk_defaults_to_running():
+    _serve_execution_listing("running")
+    for i in range(1, 6):
+        responses.post(f"{API}/executions/{i}/stop", json={})
+    result = executions.stop_executions_bulk(_client(), max_items=2, max_per_second=100)
+    assert result["succeeded"] == 2
+    assert "status=running" in responses.calls[0].request.url
+
+
+@responses.activate
+def test_bulk_retry_skips_executions_already_retried():
+    listing = [
+        {"id": "2", "workflowId": "w1", "status": "error", "startedAt": "2025-01-02T00:00:00.000Z",
+         "retryOf": None, "retrySuccessId": "9"},
+        {"id": "1", "workflowId": "w1", "status": "error", "startedAt": "2025-01-01T00:00:00.000Z",
+         "retryOf": None, "retrySuccessId": None},
+    ]
+    responses.get(f"{API}/executions", json={"data": listing, "nextCursor": None})
+    responses.post(f"{API}/executions/1/retry", json={"id": "10"})
+    assert executions.list_executions(_client())["executions"][0]["retrySuccessId"] == "9"
+    result = executions.retry_executions_bulk(_client(), workflow_id="w1")
+    assert [r["id"] for r in result["results"]] == ["1"]
+
+
+def test_bulk_action_requires_ids_or_filter():
+    with pytest.raises(ValueError):
+        executions.retry_executions_bulk(_client(), status=None)
+    with pytest.raises(ValueError):
+        executions.retry_executions_bulk(_client())
+    with pytest.raises(ValueError):
+        executions.stop_executions_bulk(_client(), status="running")
+
+
+# =============================================================================
+# Waiting for executions
+# =============================================================================
+
+
+def _run_data(*nodes):
+    return {"resultData": {"runData": {name: [{"executionTime": 1}] * runs for name, runs in nodes}}}
+
+
+@responses.activate
+def test_wait_for_execution_backs_off_and_streams_nodes(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("mcp_n8n.operations._base.time.sleep", sleeps.append)
+    url = f"{API}/executions/7"
+    responses.get(url, json={"id": "7", "status": "running", "data": _run_data(("Start", 1))})
+    responses.get(url, json={"id": "7", "status": "running", "data": _run_data(("Start", 1))})
+    responses.get(url, json={"id": "7", "status": "running", "data": _run_data(("Start", 1), ("HTTP", 2))})
+    responses.get(url, json={"id": "7", "status": "success", "data": _run_data(("Start", 1), ("HTTP", 2), ("End", 1))})
+
+    seen = []
+    result = executions.wait_for_execution(
+        _client(), "7", poll_interval=0.1, max_poll_interval=0.2, on_node=lambda name, run: seen.append(name),
+    )
+    assert result["status"] == "success"
+    assert seen == ["Start", "HTTP", "HTTP", "End"]
+    assert sleeps == pytest.approx([0.1, 0.15, 0.2])
+    assert all(c.request.params == {"includeData": "true"} for c in responses.calls)
+
+
+@responses.activate
+def test_wait_for_execution_times_out():
+    responses.get(f"{API}/executions/7", json={"id": "7", "status": "waiting"})
+    with pytest.raises(TimeoutError, match="still waiting"):
+        executions.wait_for_execution(_client(), "7", timeout=0.05, poll_interval=0.01)
+    assert "includeData" not in responses.calls[0].request.url
+
+
+@responses.activate
+def test_execute_workflow_and_wait():
+    responses.post(f"{API}/workflows/1/run", json={"data": {"executionId": 9}})
+    responses.get(f"{API}/executions/9", json={"id": "9", "status": "error"})
+    result = workflows.execute_workflow_and_wait(_client(), "1", data={"a": 1})
+    assert result["status"] == "error"
+    assert json.loads(responses.calls[0].request.body) == {"data": {"a": 1}}
@@ -0,0 +1,63 @@
+"""Tests for auto-paginating iterators."""
+
+import asyncio
+import json
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import responses
+
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.operations import executions, workflows
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+PAGES = {
+    None: {"data": [{"id": "1"}, {"id": "2"}], "nextCursor": "c1"},
+    "c1": {"data": [{"id": "2"}, {"id": "3"}], "nextCursor": "c2"},
+    "c2": {"data": [{"id": "4"}], "nextCursor": None},
+}
+
+
+def _page_callback(request):
+    cursor = parse_qs(urlparse(request.url).query).get("cursor", [None])[0]
+    return 200, {}, json.dumps(PAGES[cursor])
+
+
+def _client():
+    return N8nClient(base_url=BASE, api_key="test-key")
+
+
+@responses.activate
+def test_iter_follows_cursor_and_drops_repeats():
+    responses.add_callback(responses.GET, f"{API}/workflows", callback=_page_callback)
+    ids = [wf["id"] for wf in workflows.iter_workflows(_client(), page_size=2)]
+    assert ids == ["1", "2", "3", "4"]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_iter_max_items():
+    responses.add_callback(responses.GET, f"{API}/executions", callback=_page_callback)
+    ids = [ex["id"] for ex in executions.iter_executions(_client(), max_items=3)]
+    assert ids == ["1", "2", "3"]
+
+
+@responses.activate
+def test_iter_stop_predicate():
+    responses.add_callback(responses.GET, f"{API}/workflows", callback=_page_callback)
+    ids = [wf["id"] for wf in workflows.iter_workflows(_client(), stop=lambda wf: wf["id"] == "3")]
+    assert ids == ["1", "2"]
+
+
+def test_aiter_follows_cursor():
+    def handler(request):
+        return httpx.Response(200, json=PAGES[request.url.params.get("cursor")])
+
+    async def run():
+        client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+        async with client:
+            return [wf["id"] async for wf in workflows.aiter_workflows(client)]
+
+    assert asyncio.run(run()) == ["1", "2", "3", "4"]
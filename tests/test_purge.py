@@ -0,0 +1,173 @@
+"""Tests for the parallel execution retention purge."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+import responses
+
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.purge import apurge_executions, purge_executions
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+
+
+def _serve_executions(count, status="success"):
+    listing = [
+        {"id": str(i), "workflowId": "w1", "status": status, "startedAt": f"2025-01-{i:02d}T00:00:00.000Z"}
+        for i in range(count, 0, -1)
+    ]
+    responses.get(f"{API}/executions", json={"data": listing, "nextCursor": None})
+    for ex in listing:
+        responses.delete(f"{API}/executions/{ex['id']}", json={})
+
+
+def _deleted():
+    return sorted(
+        c.request.url.rsplit("/", 1)[-1] for c in responses.calls if c.request.method == "DELETE"
+    )
+
+
+def _client():
+    return N8nClient(base_url=BASE, api_key="test-key")
+
+
+def test_refuses_to_purge_without_filters():
+    with pytest.raises(ValueError):
+        purge_executions(_client())
+
+
+@responses.activate
+def test_dry_run_counts_without_deleting():
+    _serve_executions(6)
+    stats = purge_executions(_client(), before="2025-01-04T00:00:00Z", dry_run=True)
+    assert stats["matched"] == 3
+    assert stats["sample_ids"] == ["3", "2", "1"]
+    assert _deleted() == []
+
+
+@responses.activate
+def test_deletes_executions_before_cutoff():
+    _serve_executions(6)
+    seen = []
+    stats = purge_executions(
+        _client(), before="2025-01-04T00:00:00Z", batch_size=2, progress=seen.append,
+    )
+    assert stats["deleted"] == 3
+    assert stats["failed"] == 0
+    assert _deleted() == ["1", "2", "3"]
+    assert [p["deleted"] for p in seen] == [2, 3]
+
+
+@responses.activate
+def test_status_filter_is_sent_to_n8n():
+    _serve_executions(2, status="error")
+    stats = purge_executions(_client(), status="error")
+    assert stats["deleted"] == 2
+    assert "status=error" in responses.calls[0].request.url
+
+
+@responses.activate
+def test_failures_are_counted_and_reported():
+    _serve_executions(3)
+    responses.upsert(responses.DELETE, f"{API}/executions/2", status=404)
+    stats = purge_executions(_client(), workflow_id="w1")
+    assert stats["deleted"] == 2
+    assert stats["failed"] == 1
+    assert stats["errors"][0]["id"] == "2"
+    assert stats["errors"][0]["status_code"] == 404
+
+
+@responses.activate
+def test_rate_cap_spaces_deletes():
+    _serve_executions(5)
+    start = time.monotonic()
+    purge_executions(_client(), workflow_id="w1", max_per_second=50, max_concurrency=5)
+    assert time.monotonic() - start >= 4 / 50
+
+
+@responses.activate
+def test_resumes_from_checkpoint(tmp_path):
+    _serve_executions(5)
+    checkpoint = tmp_path / "purge.json"
+    filters = {"older_than_days": None, "before": None, "workflow_id": "w1", "status": None}
+    checkpoint.write_text(json.dumps(
+        {"filters": filters, "cutoff": None, "last_id": "4", "deleted": 2, "failed": 0}
+    ))
+    stats = purge_executions(_client(), workflow_id="w1", checkpoint_path=str(checkpoint))
+    assert stats["skipped"] == 2
+    assert stats["deleted"] == 5
+    assert _deleted() == ["1", "2", "3"]
+    assert not checkpoint.exists()
+
+
+@responses.activate
+def test_resume_restarts_listing_at_checkpoint_cursor(tmp_path):
+    first = [{"id": str(i), "startedAt": "2025-01-01T00:00:00.000Z"} for i in (6, 5, 4)]
+    second = [{"id": str(i), "startedAt": "2025-01-01T00:00:00.000Z"} for i in (3, 2, 1)]
+    responses.get(
+        f"{API}/executions", json={"data": second, "nextCursor": None},
+        match=[responses.matchers.query_param_matcher({"limit": "100", "workflowId": "w1", "cursor": "p2"})],
+    )
+    responses.get(f"{API}/executions", json={"data": first, "nextCursor": "p2"})
+    for ex in first + second:
+        responses.delete(f"{API}/executions/{ex['id']}", json={})
+    checkpoint = tmp_path / "purge.json"
+    filters = {"older_than_days": None, "before": None, "workflow_id": "w1", "status": None}
+    checkpoint.write_text(json.dumps(
+        {"filters": filters, "cutoff": None, "cursor": "p2", "last_id": "3", "deleted": 4, "failed": 0}
+    ))
+    stats = purge_executions(_client(), workflow_id="w1", checkpoint_path=str(checkpoint))
+    listed = [c.request.url for c in responses.calls if c.request.method == "GET"]
+    assert len(listed) == 1 and "cursor=p2" in listed[0]
+    assert stats["skipped"] == 1
+    assert stats["deleted"] == 6
+    assert _deleted() == ["1", "2"]
+
+
+@responses.activate
+def test_checkpoint_records_page_cursor(tmp_path):
+    responses.get(
+        f"{API}/executions", json={"data": [{"id": "1"}], "nextCursor": None},
+        match=[responses.matchers.query_param_matcher({"limit": "100", "status": "error", "cursor": "p2"})],
+    )
+    responses.get(f"{API}/executions", json={"data": [{"id": "3"}, {"id": "2"}], "nextCursor": "p2"})
+    for eid in "123":
+        responses.delete(f"{API}/executions/{eid}", json={})
+    checkpoint = tmp_path / "purge.json"
+    saved = []
+    purge_executions(
+        _client(), status="error", batch_size=1, checkpoint_path=str(checkpoint),
+        progress=lambda stats: saved.append(json.loads(checkpoint.read_text())),
+    )
+    assert [(c["cursor"], c["last_id"]) for c in saved] == [(None, "3"), (None, "2"), ("p2", "1")]
+
+
+def test_async_purge_takes_the_limit_per_batch():
+    limit = asyncio.Semaphore(1)
+    held = []
+
+    async def handler(request):
+        held.append(limit.locked())
+        if request.method == "DELETE":
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json={"data": [{"id": str(i)} for i in range(4, 0, -1)], "nextCursor": None})
+
+    async def run():
+        client = AsyncN8nClient(base_url=BASE, api_key="test-key", transport=httpx.MockTransport(handler))
+        seen = []
+
+        async def progress(stats):
+            seen.append((stats["deleted"], limit.locked()))
+
+        stats = await apurge_executions(client, status="error", batch_size=2, progress=progress, limit=limit)
+        await client.aclose()
+        return stats, seen
+
+    stats, seen = asyncio.run(run())
+    assert stats["deleted"] == 4
+    assert all(held)
+    assert seen == [(2, False), (4, False)]
@@ -0,0 +1,191 @@
+"""Tests for retries, backoff and the circuit breaker against a scripted server."""
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+import requests
+
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.operations import executions, workflows
+from mcp_n8n.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+from .fake_n8n import RESET, FakeN8n
+
+WF = "/api/v1/workflows/1"
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_BACKOFF_BASE", "0.01")
+    with FakeN8n() as server:
+        yield server
+
+
+def _client(fake):
+    return N8nClient(base_url=fake.base_url, api_key="k")
+
+
+def test_get_is_retried_until_success(fake):
+    fake.script("GET", WF, (503, {}), (502, {}), (200, {"id": "1"}))
+    assert _client(fake).get("/workflows/1") == {"id": "1"}
+    assert fake.count("GET", WF) == 3
+
+
+def test_connection_reset_is_retried(fake):
+    fake.script("GET", WF, RESET, (200, {"id": "1"}))
+    assert _client(fake).get("/workflows/1") == {"id": "1"}
+    assert fake.count("GET", WF) == 2
+
+
+def test_gives_up_after_max_retries(fake, monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "2")
+    fake.script("GET", WF, (503, {}))
+    with pytest.raises(requests.HTTPError):
+        _client(fake).get("/workflows/1")
+    assert fake.count("GET", WF) == 3
+
+
+def test_retry_after_is_respected(fake):
+    fake.script("GET", WF, (429, {}, {"Retry-After": "0.3"}), (200, {"id": "1"}))
+    start = time.monotonic()
+    _client(fake).get("/workflows/1")
+    assert time.monotonic() - start >= 0.3
+
+
+def test_retry_after_beyond_backoff_max_is_not_waited_for(fake):
+    fake.script("GET", WF, (429, {}, {"Retry-After": "3600"}), (200, {"id": "1"}))
+    with pytest.raises(requests.HTTPError):
+        _client(fake).get("/workflows/1")
+    assert fake.count("GET", WF) == 1
+
+
+def test_post_is_not_retried_by_default(fake):
+    fake.script("POST", "/api/v1/workflows", (503, {}), (200, {"id": "2"}))
+    with pytest.raises(requests.HTTPError):
+        workflows.create_workflow(_client(fake), "wf", nodes=[], connections={})
+    assert fake.count("POST", "/api/v1/workflows") == 1
+
+
+def test_retry_execution_opts_in(fake):
+    path = "/api/v1/executions/9/retry"
+    fake.script("POST", path, (502, {}), (200, {"id": "10"}))
+    assert executions.retry_execution(_client(fake), "9") == {"id": "10"}
+    assert fake.count("POST", path) == 2
+
+
+def test_client_errors_are_not_retried(fake):
+    fake.script("GET", WF, (404, {"message": "nope"}))
+    with pytest.raises(requests.HTTPError):
+        _client(fake).get("/workflows/1")
+    assert fake.count("GET", WF) == 1
+
+
+def test_circuit_opens_and_recovers(fake, monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "0")
+    monkeypatch.setenv("N8N_CIRCUIT_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("N8N_CIRCUIT_RESET_TIMEOUT", "0.2")
+    fake.script("GET", WF, (503, {}), (503, {}), (200, {"id": "1"}))
+    client = _client(fake)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get("/workflows/1")
+
+    with pytest.raises(CircuitOpenError):
+        _client(fake).get("/workflows/1")
+    assert fake.count("GET", WF) == 2
+
+    time.sleep(0.25)
+    assert client.get("/workflows/1") == {"id": "1"}
+    assert client._breaker.state == "closed"
+
+
+def test_async_client_retries(fake):
+    fake.script("GET", WF, (503, {}), RESET, (200, {"id": "1"}))
+
+    async def main():
+        async with AsyncN8nClient(base_url=fake.base_url, api_key="k") as client:
+            return await client.get("/workflows/1")
+
+    assert asyncio.run(main()) == {"id": "1"}
+    assert fake.count("GET", WF) == 3
+
+
+def test_webhooks_are_sent_once_and_kept_out_of_the_breaker(fake, monkeypatch):
+    monkeypatch.setenv("N8N_CIRCUIT_FAILURE_THRESHOLD", "2")
+    fake.script("GET", "/webhook/g", (503, {}))
+    fake.script("POST", "/webhook/hook", (500, {"message": "Error in workflow"}))
+    fake.script("GET", WF, (200, {"id": "1"}))
+    client = _client(fake)
+    with pytest.raises(requests.HTTPError):
+        client.webhook("g", method="GET")
+    assert fake.count("GET", "/webhook/g") == 1
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            client.webhook("hook")
+    assert client._breaker.state == "closed"
+    assert client.limiter.decreases == 0
+    assert client.get("/workflows/1") == {"id": "1"}
+
+
+def test_resilient_webhook_opts_into_retries(fake):
+    fake.script("POST", "/webhook/hook", (503, {}), (200, {"ok": True}))
+    assert _client(fake).webhook("hook", resilient=True) == {"ok": True}
+    assert fake.count("POST", "/webhook/hook") == 2
+
+
+def test_cancelled_half_open_trial_releases_the_breaker(monkeypatch):
+    monkeypatch.setenv("N8N_RETRY_MAX_RETRIES", "0")
+    monkeypatch.setenv("N8N_COALESCE_REQUESTS", "false")
+    monkeypatch.setenv("N8N_CIRCUIT_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("N8N_CIRCUIT_RESET_TIMEOUT", "0.05")
+    mode = ["fail"]
+
+    async def handler(request):
+        if mode[0] == "fail":
+            return httpx.Response(503)
+        if mode[0] == "hang":
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"id": "1"})
+
+    async def main():
+        client = AsyncN8nClient(base_url="http://n8n.test", api_key="k", transport=httpx.MockTransport(handler))
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/workflows/1")
+        await asyncio.sleep(0.1)
+        mode[0] = "hang"
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get("/workflows/1"), 0.1)
+        mode[0] = "ok"
+        return await client.get("/workflows/1"), client._breaker.state
+
+    assert asyncio.run(main()) == ({"id": "1"}, "closed")
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(max_retries=10, backoff_base=1.0, backoff_max=4.0)
+    assert all(0 <= policy.delay(0) <= 1.0 for _ in range(50))
+    assert all(0 <= policy.delay(8) <= 4.0 for _ in range(50))
+    assert policy.delay(0, retry_after=2.0) == 2.0
+
+
+def test_parse_retry_after_http_date():
+    now = time.time()
+    assert parse_retry_after(formatdate(now + 10, usegmt=True), now=now) == pytest.approx(10, abs=1)
+    assert parse_retry_after("garbage") is None
+
+
+def test_half_open_allows_one_trial():
+    clock = [0.0]
+    breaker = CircuitBreaker("h", failure_threshold=1, reset_timeout=5, clock=lambda: clock[0])
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock[0] = 6
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
@@ -0,0 +1,277 @@
+"""Tests for the MCP server tools through FastMCP's in-process client."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import responses
+from fastmcp import Client
+
+from mcp_n8n import server
+from mcp_n8n.client import AsyncN8nClient, N8nClient
+from mcp_n8n.mirror import WorkflowMirror
+
+BASE = "http://localhost:5678"
+
+
+@pytest.fixture
+def n8n(monkeypatch):
+    """Install an AsyncN8nClient whose requests go to ``handler``."""
+
+    def install(handler):
+        client = AsyncN8nClient(base_url=BASE, api_key="test-key", transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(server, "_client", client)
+        monkeypatch.setattr(server, "_limit", None)
+        return client
+
+    return install
+
+
+def _text(result):
+    return json.loads(result.content[0].text)
+
+
+def test_tool_returns_json(n8n):
+    n8n(lambda request: httpx.Response(200, json={"id": "1", "name": "WF"}))
+
+    async def run():
+        async with Client(server.mcp) as client:
+            return await client.call_tool("n8n_get_workflow", {"workflow_id": "1"})
+
+    assert _text(asyncio.run(run()))["name"] == "WF"
+
+
+def test_concurrent_tool_calls_overlap(n8n):
+    delays = {str(i): 0.1 + 0.05 * i for i in range(8)}
+
+    async def handler(request):
+        workflow_id = request.url.path.rsplit("/", 1)[-1]
+        await asyncio.sleep(delays[workflow_id])
+        return httpx.Response(200, json={"id": workflow_id})
+
+    n8n(handler)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            return await asyncio.gather(*(
+                client.call_tool("n8n_get_workflow", {"workflow_id": workflow_id})
+                for workflow_id in delays
+            ))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    assert [_text(r)["id"] for r in results] == list(delays)
+    assert elapsed < max(delays.values()) + 0.3
+    assert elapsed < sum(delays.values()) / 2
+
+
+def test_concurrency_cap(n8n, monkeypatch):
+    monkeypatch.setenv("N8N_MAX_CONCURRENT_TOOLS", "2")
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(200, json={"id": "1"})
+
+    n8n(handler)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            await asyncio.gather(*(
+                client.call_tool("n8n_get_workflow", {"workflow_id": str(i)}) for i in range(6)
+            ))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_list_all_pages_is_capped(n8n, monkeypatch):
+    monkeypatch.setenv("N8N_MAX_LIST_ITEMS", "3")
+
+    def handler(request):
+        page = int(request.url.params.get("cursor", "0"))
+        return httpx.Response(200, json={
+            "data": [{"id": f"{page}-{i}", "name": "t"} for i in range(2)],
+            "nextCursor": str(page + 1),
+        })
+
+    n8n(handler)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            return await client.call_tool("n8n_list_tags", {"all_pages": True, "limit": 2})
+
+    result = _text(asyncio.run(run()))
+    assert [t["id"] for t in result["tags"]] == ["0-0", "0-1", "1-0"]
+    assert result["truncated"] is True
+
+
+@responses.activate
+def test_get_workflow_served_from_fresh_mirror(n8n, monkeypatch):
+    responses.get(f"{BASE}/api/v1/workflows", json={"data": [{"id": "1", "updatedAt": "t"}]})
+    responses.get(f"{BASE}/api/v1/workflows/1", json={"id": "1", "name": "Mirrored", "updatedAt": "t"})
+    mirror = WorkflowMirror(N8nClient(base_url=BASE, api_key="test-key"))
+    mirror.sync()
+    monkeypatch.setattr(server, "_mirror", mirror)
+    n8n(lambda request: httpx.Response(500))
+
+    async def run():
+        async with Client(server.mcp) as client:
+            return await client.call_tool("n8n_get_workflow", {"workflow_id": "1"})
+
+    assert _text(asyncio.run(run()))["name"] == "Mirrored"
+
+
+@responses.activate
+def test_mirror_lock_does_not_block_the_event_loop(n8n, monkeypatch):
+    responses.get(f"{BASE}/api/v1/workflows", json={"data": [{"id": "1", "updatedAt": "t"}]})
+    responses.get(f"{BASE}/api/v1/workflows/1", json={"id": "1", "name": "Mirrored", "updatedAt": "t"})
+    mirror = WorkflowMirror(N8nClient(base_url=BASE, api_key="test-key"))
+    mirror.sync()
+    monkeypatch.setattr(server, "_mirror", mirror)
+    n8n(lambda request: httpx.Response(200, json={"id": "1"}))
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.02)
+            ticks += 1
+
+    def hold_lock():
+        # Stands in for a sync holding the lock for its whole transaction.
+        with mirror._lock:
+            time.sleep(0.3)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            ticker = asyncio.create_task(tick())
+            holder = threading.Thread(target=hold_lock)
+            holder.start()
+            await asyncio.sleep(0.02)
+            await client.call_tool("n8n_get_workflow", {"workflow_id": "1"})
+            await client.call_tool("n8n_activate_workflow", {"workflow_id": "1"})
+            ticker.cancel()
+            holder.join()
+
+    asyncio.run(run())
+    assert ticks >= 5
+
+
+def test_purge_requires_dry_run_token(n8n):
+    deleted = []
+
+    def handler(request):
+        if request.method == "DELETE":
+            deleted.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json={"data": [
+            {"id": "2", "status": "error", "startedAt": "2025-01-02T00:00:00.000Z"},
+            {"id": "1", "status": "error", "startedAt": "2025-01-01T00:00:00.000Z"},
+        ], "nextCursor": None})
+
+    n8n(handler)
+    progress = []
+
+    async def on_progress(done, total, message):
+        progress.append((done, total))
+
+    async def run():
+        async with Client(server.mcp) as client:
+            dry = _text(await client.call_tool("n8n_purge_executions", {"status": "error"}))
+            bad = await client.call_tool(
+                "n8n_purge_executions", {"status": "success", "confirm_token": dry["confirm_token"]},
+                raise_on_error=False,
+            )
+            done = _text(await client.call_tool(
+                "n8n_purge_executions", {"status": "error", "confirm_token": dry["confirm_token"]},
+                progress_handler=on_progress,
+            ))
+            reused = await client.call_tool(
+                "n8n_purge_executions", {"status": "error", "confirm_token": dry["confirm_token"]},
+                raise_on_error=False,
+            )
+            return dry, bad, done, reused
+
+    dry, bad, done, reused = asyncio.run(run())
+    assert dry["matched"] == 2 and dry["dry_run"]
+    assert bad.is_error and reused.is_error
+    assert done["deleted"] == 2
+    assert sorted(deleted) == ["1", "2"]
+    assert progress == [(2, 2)]
+
+
+def test_execute_workflow_and_wait_returns_selected_result(n8n):
+    polls = []
+
+    def handler(request):
+        if request.method == "POST":
+            return httpx.Response(200, json={"executionId": "12"})
+        polls.append(request.url.params.get("includeData"))
+        status = "error" if len(polls) >= 2 else "running"
+        return httpx.Response(200, json={"id": "12", "status": status, "data": {"resultData": {"runData": {}}}})
+
+    n8n(handler)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            return await client.call_tool("n8n_execute_workflow_and_wait", {"workflow_id": "1", "timeout": 5})
+
+    result = _text(asyncio.run(run()))
+    assert result["status"] == "error" and result["id"] == "12"
+    assert polls[-1] == "true"
+
+
+def test_execute_workflow_and_wait_reports_timeout(n8n):
+    def handler(request):
+        if request.method == "POST":
+            return httpx.Response(200, json={"executionId": "12"})
+        return httpx.Response(200, json={"id": "12", "status": "running"})
+
+    n8n(handler)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            return await client.call_tool("n8n_execute_workflow_and_wait", {"workflow_id": "1", "timeout": 0.1})
+
+    result = _text(asyncio.run(run()))
+    assert result["timedOut"] is True and result["status"] == "running"
+
+
+def test_update_workflow_writes_only_changes(n8n):
+    current = {"id": "1", "name": "WF", "nodes": [{"id": "a", "name": "Start"}], "connections": {}, "settings": {}}
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        if request.method == "PUT":
+            return httpx.Response(200, json={**json.loads(request.content), "id": "1", "versionId": "v2"})
+        return httpx.Response(200, json=current)
+
+    n8n(handler)
+
+    async def run():
+        async with Client(server.mcp) as client:
+            same = await client.call_tool(
+                "n8n_update_workflow", {"workflow_id": "1", "nodes": current["nodes"], "diff": True},
+            )
+            patched = await client.call_tool(
+                "n8n_update_workflow", {"workflow_id": "1", "node_patches": {"Start": {"disabled": True}}},
+            )
+            plain = await client.call_tool("n8n_update_workflow", {"workflow_id": "1", "name": "Renamed"})
+            return _text(same), _text(patched), _text(plain)
+
+    same, patched, plain = asyncio.run(run())
+    assert same["updated"] is False and same["changes"] == {}
+    assert patched["changes"] == {"nodes": {"changed": {"Start": ["disabled"]}}}
+    assert patched["workflow"] == {"id": "1", "name": "WF", "active": None, "versionId": "v2", "updatedAt": None}
+    assert plain == {"name": "Renamed", "id": "1", "versionId": "v2"}
+    assert methods == ["GET", "GET", "PUT", "PUT"]
@@ -0,0 +1,62 @@
+"""Start-up regression tests: what importing the entry points loads, and how long it takes."""
+
+import subprocess
+import sys
+
+import pytest
+
+from mcp_n8n.config import get_settings
+
+# Modules each entry point must not load at import time (they load on first use).
+DEFERRED = {
+    "mcp_n8n": {"mcp_n8n.client", "requests", "httpx", "pydantic_settings"},
+    "mcp_n8n.server": {
+        "mcp_n8n.client", "mcp_n8n.mirror", "mcp_n8n.operations", "mcp_n8n.analytics",
+        "mcp_n8n.budget", "mcp_n8n.purge", "mcp_n8n.views", "mcp_n8n.hooks", "requests", "sqlite3",
+    },
+    "mcp_n8n.langchain_tools": {"mcp_n8n.client", "mcp_n8n.operations", "langchain_core", "pydantic"},
+}
+# Self time of mcp_n8n's own modules (tool registration included), median of five
+# ``-X importtime`` runs; the budget is 1.5x that, with 1 ms as the floor below
+# which the timer is noise.
+BASELINE_MS = {"mcp_n8n": 0.3, "mcp_n8n.server": 167, "mcp_n8n.langchain_tools": 0.8}
+OWN_BUDGET_MS = {module: max(1.5 * ms, 1.0) for module, ms in BASELINE_MS.items()}
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Self import time in microseconds of every module loaded by ``import module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us, _, name = line[len("import time:"):].split("|")
+            if self_us.strip().isdigit():
+                times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.parametrize("module", list(DEFERRED))
+def test_entry_point_defers_heavy_imports(module):
+    pytest.importorskip(module)
+    loaded = _importtime(module)
+    assert module in loaded
+    assert not DEFERRED[module] & loaded.keys()
+
+
+@pytest.mark.parametrize("module", list(OWN_BUDGET_MS))
+def test_entry_point_import_time_budget(module):
+    pytest.importorskip(module)
+    loaded = _importtime(module)
+    own_ms = sum(us for name, us in loaded.items() if name.split(".")[0] == "mcp_n8n") / 1000
+    assert own_ms < OWN_BUDGET_MS[module], f"{module} spends {own_ms:.0f} ms in its own modules"
+
+
+def test_settings_are_reused_until_the_environment_changes(monkeypatch):
+    first = get_settings()
+    assert get_settings() is first
+    monkeypatch.setenv("N8N_TIMEOUT", "7")
+    changed = get_settings()
+    assert changed is not first and changed.timeout == 7
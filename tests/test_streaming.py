@@ -0,0 +1,110 @@
+"""Tests for incremental JSON parsing of large execution payloads."""
+
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+import responses
+
+pytest.importorskip("ijson")
+
+from mcp_n8n.client import AsyncN8nClient, N8nClient  # noqa: E402
+from mcp_n8n.operations import executions  # noqa: E402
+from mcp_n8n.streaming import iter_matches  # noqa: E402
+from tests.synthetic import ChunkStream, execution_chunks  # noqa: E402
+
+BASE = "http://localhost:5678"
+API = f"{BASE}/api/v1"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _body(size=50_000, nodes=3):
+    return b"".join(execution_chunks(size, nodes=nodes, item_size=64))
+
+
+def test_iter_matches_wildcards_and_scalars():
+    doc = b'{"a": {"x": {"v": 1}, "y": {"v": 2.5}}, "b": [1, 2], "c": "s"}'
+    matches = list(iter_matches(ChunkStream([doc]), ["a.*.v", "b", "c"]))
+    assert matches == [("a.x.v", 1), ("a.y.v", 2.5), ("b", [1, 2]), ("c", "s")]
+
+
+@responses.activate
+def test_get_execution_streamed_errors():
+    responses.get(f"{API}/executions/1", body=_body())
+    result = executions.get_execution_streamed(N8nClient(base_url=BASE, api_key="k"), "1", select="errors")
+    assert result["status"] == "error"
+    assert result["lastNodeExecuted"] == "Node 2"
+    assert result["error"] == {"message": "boom"}
+    assert result["nodeErrors"] == {"Node 2": [{"message": "failed at node 2"}]}
+    assert responses.calls[0].request.params == {"includeData": "true"}
+
+
+@responses.activate
+def test_get_execution_streamed_last_node():
+    responses.get(f"{API}/executions/1", body=_body())
+    result = executions.get_execution_streamed(N8nClient(base_url=BASE, api_key="k"), "1", select="last_node")
+    assert result["lastNode"]["name"] == "Node 2"
+    assert result["lastNode"]["runs"][0]["error"]["message"] == "failed at node 2"
+    assert "selected" not in result
+
+
+@responses.activate
+def test_get_execution_streamed_custom_paths():
+    responses.get(f"{API}/executions/1", body=_body())
+    result = executions.get_execution_streamed(
+        N8nClient(base_url=BASE, api_key="k"), "1", paths=["data.resultData.runData.*.item.startTime"],
+    )
+    assert result["selected"] == {f"data.resultData.runData.Node {n}.item.startTime": 1 for n in range(3)}
+
+
+@responses.activate
+def test_get_execution_streamed_dotted_node_names():
+    run_data = {
+        "Fetch": [{"startTime": 1}],
+        "Parse v1.2": [{"startTime": 2, "error": {"message": "bad version"}}],
+    }
+    responses.get(f"{API}/executions/1", json={"id": "1", "data": {"resultData": {"runData": run_data}}})
+    client = N8nClient(base_url=BASE, api_key="k")
+    errors = executions.get_execution_streamed(client, "1", select="errors")
+    assert errors["nodeErrors"] == {"Parse v1.2": [{"message": "bad version"}]}
+    last = executions.get_execution_streamed(client, "1", select="last_node")
+    assert last["lastNode"] == {"name": "Parse v1.2", "runs": run_data["Parse v1.2"]}
+    assert list(iter_matches(ChunkStream([json.dumps(run_data).encode()]), ["*.item.startTime"])) == [
+        ("Fetch.item.startTime", 1), ("Parse v1.2.item.startTime", 2),
+    ]
+
+
+def test_get_execution_streamed_async():
+    body = _body()
+
+    def handler(request):
+        return httpx.Response(200, content=body)
+
+    async def run():
+        client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+        async with client:
+            return await executions.aget_execution_streamed(client, "1", select="errors")
+
+    assert asyncio.run(run())["nodeErrors"] == {"Node 2": [{"message": "failed at node 2"}]}
+
+
+def test_peak_memory_on_200mb_execution():
+    script = (
+        "import resource\n"
+        "from mcp_n8n.streaming import iter_matches\n"
+        "from tests.synthetic import ChunkStream, execution_chunks\n"
+        "patterns = ['id', 'status', 'data.resultData.error', 'data.resultData.runData.*.item.error']\n"
+        "found = list(iter_matches(ChunkStream(execution_chunks(200_000_000)), patterns))\n"
+        "assert len(found) == 4, found\n"
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    peak_mb = int(out.stdout.strip()) / 1024
+    # json.loads on the same body needs well over 1 GB.
+    assert peak_mb < 150, f"peak RSS {peak_mb:.0f} MB while streaming a 200 MB execution"
@@ -0,0 +1,140 @@
+"""Tests for view presets, field projection and output caching."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastmcp import Client
+
+from mcp_n8n import server
+from mcp_n8n.client import AsyncN8nClient
+from mcp_n8n.views import OutputCache, encode, project, render, shape
+
+BASE = "http://localhost:5678"
+
+WORKFLOW = {
+    "id": "1",
+    "name": "Orders",
+    "active": True,
+    "updatedAt": "2025-01-01T00:00:00.000Z",
+    "versionId": "v1",
+    "tags": [{"id": "t1", "name": "prod"}],
+    "nodes": [
+        {"name": "Webhook", "type": "n8n-nodes-base.webhook", "position": [0, 0], "parameters": {"path": "orders"}},
+        {"name": "Slack", "type": "n8n-nodes-base.slack", "position": [200, 0], "parameters": {"text": "hi"}},
+    ],
+    "connections": {"Webhook": {"main": [[{"node": "Slack"}]]}},
+    "pinData": {"Webhook": [{"json": {"big": "x" * 1000}}]},
+    "staticData": {"last": 1},
+}
+
+EXECUTION = {
+    "id": "9",
+    "workflowId": "1",
+    "status": "error",
+    "mode": "trigger",
+    "startedAt": "2025-01-01T00:00:00.000Z",
+    "stoppedAt": "2025-01-01T00:00:01.000Z",
+    "workflowData": WORKFLOW,
+    "data": {"resultData": {"lastNodeExecuted": "Slack", "error": {"message": "channel_not_found"}}},
+}
+
+
+def test_encode_is_compact_by_default():
+    assert encode({"a": [1, 2]}) == '{"a":[1,2]}'
+    assert encode({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_project_dotted_paths_through_lists():
+    assert project(WORKFLOW, ["name", "nodes.name", "missing.x"]) == {
+        "name": "Orders",
+        "nodes": [{"name": "Webhook"}, {"name": "Slack"}],
+    }
+    assert project(WORKFLOW, ["nodes.name", "nodes"])["nodes"] == WORKFLOW["nodes"]
+
+
+def test_workflow_views():
+    summary = shape(WORKFLOW, "workflow", "summary")
+    assert summary["tags"] == ["prod"]
+    assert summary["nodeCount"] == 2
+    assert summary["nodes"][1] == {"name": "Slack", "type": "n8n-nodes-base.slack"}
+    standard = shape(WORKFLOW, "workflow")
+    assert "pinData" not in standard and "staticData" not in standard
+    assert standard["nodes"] == WORKFLOW["nodes"]
+    assert shape(WORKFLOW, "workflow", "full") is WORKFLOW
+
+
+def test_execution_views():
+    summary = shape(EXECUTION, "execution", "summary")
+    assert summary["workflowName"] == "Orders"
+    assert summary["error"] == "channel_not_found"
+    assert summary["lastNodeExecuted"] == "Slack"
+    assert shape(EXECUTION, "execution")["workflowData"] == {"id": "1", "name": "Orders"}
+
+
+def test_pages_and_bulk_results_are_shaped_per_item():
+    page = shape({"workflows": [WORKFLOW], "nextCursor": "c"}, "workflow", fields=["id"])
+    assert page == {"workflows": [{"id": "1"}], "nextCursor": "c"}
+    bulk = shape(
+        {"results": [{"id": "1", "ok": True, "data": WORKFLOW}, {"id": "2", "ok": False, "error": "404"}]},
+        "workflow", "summary",
+    )
+    assert bulk["results"][0]["data"]["nodeCount"] == 2
+    assert bulk["results"][1] == {"id": "2", "ok": False, "error": "404"}
+
+
+def test_unknown_view_is_rejected():
+    with pytest.raises(ValueError):
+        shape(WORKFLOW, "workflow", "tiny")
+
+
+def test_output_cache_reuses_until_the_document_changes():
+    cache = OutputCache()
+    first = render(WORKFLOW, "workflow", "summary", cache=cache)
+    assert render(dict(WORKFLOW), "workflow", "summary", cache=cache) is first
+    assert cache.hits == 1
+    changed = dict(WORKFLOW, name="Renamed", updatedAt="2025-02-01T00:00:00.000Z")
+    assert json.loads(render(changed, "workflow", "summary", cache=cache))["name"] == "Renamed"
+
+
+def test_running_executions_are_not_cached():
+    cache = OutputCache()
+    running = dict(EXECUTION, status="running", stoppedAt=None)
+    render(running, "execution", cache=cache)
+    render(running, "execution", cache=cache)
+    assert cache.hits == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = OutputCache(max_entries=2)
+    for i in range(3):
+        render(dict(WORKFLOW, id=str(i)), "workflow", cache=cache)
+    render(dict(WORKFLOW, id="0"), "workflow", cache=cache)
+    assert cache.hits == 0
+
+
+def test_tools_accept_view_and_fields(monkeypatch):
+    def handler(request):
+        if request.url.path.endswith("/workflows/1"):
+            return httpx.Response(200, json=WORKFLOW)
+        return httpx.Response(200, json={"data": [EXECUTION], "nextCursor": None})
+
+    client = AsyncN8nClient(base_url=BASE, api_key="k", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_limit", None)
+    monkeypatch.setattr(server, "_output_cache", None)
+
+    async def run():
+        async with Client(server.mcp) as mcp_client:
+            return await asyncio.gather(
+                mcp_client.call_tool("n8n_get_workflow", {"workflow_id": "1", "view": "summary"}),
+                mcp_client.call_tool("n8n_get_workflow", {"workflow_id": "1", "fields": ["nodes.parameters"]}),
+                mcp_client.call_tool("n8n_list_executions", {"fields": ["id", "status"]}),
+            )
+
+    summary, fields, listing = (r.content[0].text for r in asyncio.run(run()))
+    assert "\n" not in summary
+    assert json.loads(summary)["nodes"][0]["name"] == "Webhook"
+    assert json.loads(fields) == {"nodes": [{"parameters": {"path": "orders"}}, {"parameters": {"text": "hi"}}]}
+    assert json.loads(listing)["executions"] == [{"id": "9", "status": "error"}]